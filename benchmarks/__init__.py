@@ -0,0 +1,3 @@
+"""
+Benchmarks de rendimiento con corpus sintéticos de certificados y constancias
+"""
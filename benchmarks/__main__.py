@@ -0,0 +1,8 @@
+import multiprocessing
+import sys
+
+from .run import main
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""
+Generación de corpus sintéticos y reproducibles de certificados y constancias
+
+Los textos siguen los formatos reconocidos por WorkerNamePatterns, de modo que
+cada página tiene un trabajador detectable. Con la misma semilla se generan
+siempre los mismos nombres y los mismos bytes.
+"""
+import os
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+FIRST_NAMES = [
+    "Juan", "María", "Carlos", "Ana", "Pedro", "Lucía", "José", "Rosa", "Luis", "Carmen",
+    "Jorge", "Elena", "Miguel", "Sofía", "Raúl", "Patricia", "Andrés", "Julia", "Víctor", "Inés",
+]
+
+LAST_NAMES = [
+    "Pérez", "García", "López", "Torres", "Quispe", "Mamani", "Rojas", "Díaz", "Silva", "Castro",
+    "Flores", "Ramírez", "Vargas", "Chávez", "Huamán", "Gutiérrez", "Mendoza", "Ruiz", "Núñez", "Salazar",
+]
+
+# Párrafo de relleno para que cada página tenga un volumen de texto realista
+FILLER = (
+    "Se expide el presente documento a solicitud del interesado para los fines que estime "
+    "conveniente, dejando constancia de su buen desempeño y conducta durante el periodo indicado."
+)
+
+# Carpetas de entrada del modo organizar y tipo de documento que produce cada una
+PROCESSED_FOLDERS = {
+    "PDFs_Procesados_Certificados": "certificate",
+    "PDFs_Procesados_Constancias": "termination",
+    "PDFs_Procesados_5Rentas": "income",
+}
+
+
+@dataclass
+class Corpus:
+    """Rutas y tamaños de un corpus generado"""
+    root: str
+    bundle_path: str
+    bundle_pages: int
+    singles_folder: str
+    singles_count: int
+    processed_root: str
+    processed_count: int
+    worker_names: List[str] = field(default_factory=list)
+
+    def as_dict(self) -> Dict:
+        return {
+            "root": self.root,
+            "bundle_pages": self.bundle_pages,
+            "singles_count": self.singles_count,
+            "processed_count": self.processed_count,
+            "workers": len(self.worker_names),
+        }
+
+
+def generate_worker_names(count: int, seed: int = 0) -> List[str]:
+    """
+    Genera nombres de trabajadores únicos y reproducibles
+
+    Args:
+        count: Número de nombres
+        seed: Semilla del generador
+
+    Returns:
+        Lista de nombres "Nombre Apellido Apellido"
+    """
+    rng = random.Random(seed)
+    max_names = len(FIRST_NAMES) * len(LAST_NAMES) * (len(LAST_NAMES) - 1)
+    count = min(count, max_names)
+
+    names = []
+    seen = set()
+    while len(names) < count:
+        first = rng.choice(FIRST_NAMES)
+        paternal, maternal = rng.sample(LAST_NAMES, 2)
+        name = f"{first} {paternal} {maternal}"
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+
+def _page_lines(kind: str, name: str, index: int) -> List[str]:
+    """Líneas de texto de una página según el tipo de documento"""
+    dni = f"{40000000 + index * 7919 % 9999999:08d}"
+    day = index % 28 + 1
+    month = index % 12 + 1
+
+    if kind == "certificate":
+        title = "el Sr." if index % 2 == 0 else "la Sra."
+        gender = "identificado" if index % 2 == 0 else "identificada"
+        return [
+            "CERTIFICADO DE TRABAJO",
+            "",
+            "La empresa Servicios Generales S.A.C. certifica:",
+            f"Que {title} {name} {gender} con DNI {dni}",
+            f"ha laborado en nuestra empresa desde el {day:02d}/{month:02d}/2019.",
+        ]
+    if kind == "termination":
+        return [
+            "CONSTANCIA DE BAJA DE TRABAJADOR",
+            "PERÚ",
+            name.upper(),
+            f"{day:02d}/{month:02d}/2023",
+            f"Documento de identidad {dni}",
+        ]
+    if kind == "income":
+        return [
+            "CERTIFICADO DE RENTAS Y RETENCIONES",
+            "Rentas de quinta categoría - Ejercicio gravable 2023",
+            f"Trabajador: {name}",
+            f"DNI {dni}",
+        ]
+    return [
+        "CONSTANCIA DE PRESTADORES",
+        f"Apellidos y nombres: {name}",
+        f"N° de documento: {dni}",
+    ]
+
+
+def _draw_page(pdf: canvas.Canvas, lines: List[str], filler_lines: int):
+    """Dibujar una página con su encabezado y párrafos de relleno"""
+    _, height = A4
+    y = height - 72
+    pdf.setFont("Helvetica-Bold", 13)
+    pdf.drawString(72, y, lines[0])
+    pdf.setFont("Helvetica", 11)
+    for line in lines[1:]:
+        y -= 18
+        pdf.drawString(72, y, line)
+
+    pdf.setFont("Helvetica", 9)
+    y -= 30
+    for _ in range(filler_lines):
+        pdf.drawString(72, y, FILLER[:95])
+        y -= 13
+        if y < 72:
+            break
+    pdf.showPage()
+
+
+def write_pdf(path: str, pages: List[List[str]], filler_lines: int = 20):
+    """
+    Escribe un PDF con una página por cada lista de líneas
+
+    Args:
+        path: Ruta del PDF a crear
+        pages: Líneas de texto de cada página
+        filler_lines: Líneas de relleno por página
+    """
+    # invariant=1: sin fechas ni identificadores aleatorios, salida byte a byte reproducible
+    pdf = canvas.Canvas(path, pagesize=A4, invariant=1)
+    for lines in pages:
+        _draw_page(pdf, lines, filler_lines)
+    pdf.save()
+
+
+def write_certificate_bundle(path: str, names: List[str], pages: int, kind: str = "certificate"):
+    """
+    Escribe un PDF multi-página con un trabajador por página (entrada del modo separar)
+
+    Los nombres se repiten cíclicamente para que también haya colisiones de nombre.
+    """
+    write_pdf(path, [_page_lines(kind, names[i % len(names)], i) for i in range(pages)])
+
+
+def write_single_constancias(folder: str, names: List[str], count: int, seed: int = 0) -> int:
+    """
+    Escribe una carpeta de PDFs de una página con nombres de archivo genéricos (entrada del modo renombrar)
+
+    Returns:
+        Número de archivos creados
+    """
+    os.makedirs(folder, exist_ok=True)
+    rng = random.Random(seed)
+    kinds = ["certificate", "termination", "income", "contractor"]
+    for i in range(count):
+        kind = rng.choice(kinds)
+        write_pdf(os.path.join(folder, f"documento_{i:05d}.pdf"), [_page_lines(kind, names[i % len(names)], i)])
+    return count
+
+
+def write_processed_tree(root: str, names: List[str]) -> int:
+    """
+    Escribe carpetas PDFs_Procesados_* con un archivo por trabajador (entrada del modo organizar)
+
+    Returns:
+        Número de archivos creados
+    """
+    created = 0
+    for folder_name, kind in PROCESSED_FOLDERS.items():
+        folder = os.path.join(root, folder_name)
+        os.makedirs(folder, exist_ok=True)
+        for i, name in enumerate(names):
+            write_pdf(os.path.join(folder, f"{name}.pdf"), [_page_lines(kind, name, i)])
+            created += 1
+    return created
+
+
+def build_corpus(root: str, bundle_pages: int = 500, singles: int = 300, workers: int = 100,
+                 seed: int = 0, names: Optional[List[str]] = None) -> Corpus:
+    """
+    Genera el corpus completo de benchmark
+
+    Args:
+        root: Carpeta donde crear el corpus
+        bundle_pages: Páginas del PDF multi-página
+        singles: Número de constancias individuales
+        workers: Número de trabajadores distintos
+        seed: Semilla para nombres y tipos de documento
+        names: Nombres a usar en lugar de los generados
+
+    Returns:
+        Descripción del corpus generado
+    """
+    os.makedirs(root, exist_ok=True)
+    names = names or generate_worker_names(workers, seed)
+
+    bundle_path = os.path.join(root, "certificados_lote.pdf")
+    write_certificate_bundle(bundle_path, names, bundle_pages)
+
+    singles_folder = os.path.join(root, "constancias")
+    write_single_constancias(singles_folder, names, singles, seed)
+
+    processed_root = os.path.join(root, "procesados")
+    processed_count = write_processed_tree(processed_root, names)
+
+    return Corpus(
+        root=root,
+        bundle_path=bundle_path,
+        bundle_pages=bundle_pages,
+        singles_folder=singles_folder,
+        singles_count=singles,
+        processed_root=processed_root,
+        processed_count=processed_count,
+        worker_names=names,
+    )
@@ -0,0 +1,255 @@
+"""
+Benchmark de extremo a extremo de los modos separar, renombrar y organizar
+
+Uso:
+    python -m benchmarks --workers 1 4 --output resultados.json
+    python -m benchmarks --corpus /tmp/corpus --bundle-pages 2000 --singles 1000
+    python -m benchmarks --modes separate --bundle-pages 2000 --page-writers pymupdf pypdf2
+    python -m benchmarks --modes separate rename --extractions full blocks roi
+
+Cada caso se ejecuta en un proceso nuevo, así el pico de memoria medido
+corresponde sólo a ese caso (incluidos los procesos del pool que lance).
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from organizer.processors.block_extraction import DEFAULT_EXTRACTION, EXTRACTION_MODES
+from organizer.processors.pdf_document import DEFAULT_PAGE_WRITER, PAGE_WRITERS
+
+from .corpus import Corpus, build_corpus
+
+MODES = ["separate", "rename", "organize"]
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Pico de memoria residente del proceso actual y de sus procesos hijos ya terminados
+
+    Returns:
+        Bytes, o None si el sistema no lo permite medir (Windows sin resource)
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    )
+    # Linux informa en KiB, macOS en bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def run_mode(mode: str, corpus: Corpus, output_folder: str, max_workers: int,
+             cache_path: Optional[str] = None, page_writer: str = DEFAULT_PAGE_WRITER,
+             extraction: str = DEFAULT_EXTRACTION) -> Dict:
+    """
+    Ejecuta un modo de PDFProcessor sobre el corpus y mide su rendimiento
+
+    Args:
+        mode: 'separate', 'rename' u 'organize'
+        corpus: Corpus generado
+        output_folder: Carpeta de salida (se crea vacía)
+        max_workers: Procesos en paralelo
+        cache_path: Caché de extracción a usar (None = sin caché)
+        page_writer: Biblioteca con la que se escriben las páginas separadas
+        extraction: Cómo se lee el texto para buscar el nombre
+
+    Returns:
+        Métricas del caso
+    """
+    from organizer.processors.pdf_processor import PDFProcessor, ResultSummary
+    from organizer.processors.rename_engine import ConcurrentRenamer
+    from organizer.utils.cache import open_extraction_cache
+
+    cache = open_extraction_cache(cache_path) if cache_path else None
+    processor = PDFProcessor(max_workers=max_workers, cache=cache, page_writer=page_writer, extraction=extraction)
+    summary = ResultSummary()
+
+    start = time.perf_counter()
+    try:
+        if mode == "separate":
+            results = processor.iter_separate_multi_page_pdf(corpus.bundle_path, output_folder)
+        elif mode == "rename":
+            renamer = ConcurrentRenamer(processor, max_workers)
+            results = renamer.iter_rename(processor.list_pdf_files(corpus.singles_folder), output_folder)
+        else:
+            results = processor.iter_organize_by_worker(corpus.processed_root, output_folder)
+
+        for result in results:
+            summary.add(result)
+    finally:
+        if cache is not None:
+            cache.close()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "workers": max_workers,
+        "cache": cache_path is not None,
+        "page_writer": page_writer if mode == "separate" else None,
+        "extraction": extraction if mode != "organize" else None,
+        "seconds": round(elapsed, 4),
+        "files": summary.total_processed,
+        "pages": summary.total_pages,
+        "successful": summary.successful,
+        "failed": summary.failed,
+        "files_per_s": round(summary.total_processed / elapsed, 2) if elapsed else None,
+        "pages_per_s": round(summary.total_pages / elapsed, 2) if elapsed else None,
+        "peak_rss_bytes": peak_rss_bytes(),
+        "stage_seconds": {stage: round(seconds, 4) for stage, seconds in summary.stage_totals.items()},
+        "bytes_read": summary.bytes_read,
+        "bytes_written": summary.bytes_written,
+    }
+
+
+def _case_entry(queue, mode, corpus, output_folder, max_workers, cache_path, page_writer, extraction):
+    """Punto de entrada del proceso que ejecuta un caso"""
+    try:
+        queue.put(run_mode(mode, corpus, output_folder, max_workers, cache_path, page_writer, extraction))
+    except Exception as e:
+        queue.put({"mode": mode, "workers": max_workers, "error": str(e)})
+
+
+def run_case_isolated(mode: str, corpus: Corpus, output_folder: str, max_workers: int,
+                      cache_path: Optional[str] = None, page_writer: str = DEFAULT_PAGE_WRITER,
+                      extraction: str = DEFAULT_EXTRACTION) -> Dict:
+    """Ejecutar un caso en un proceso nuevo para medir su memoria por separado"""
+    shutil.rmtree(output_folder, ignore_errors=True)
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=_case_entry,
+        args=(queue, mode, corpus, output_folder, max_workers, cache_path, page_writer, extraction)
+    )
+    process.start()
+    metrics = queue.get()
+    process.join()
+    return metrics
+
+
+def environment_info() -> Dict:
+    """Datos del equipo para poder comparar resultados entre ejecuciones"""
+    try:
+        import fitz
+        pymupdf_version = fitz.VersionBind
+    except ImportError:
+        pymupdf_version = None
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "pymupdf": pymupdf_version,
+    }
+
+
+def run_benchmarks(corpus: Corpus, workdir: str, worker_counts: List[int], modes: List[str],
+                   warm_cache: bool = False, page_writers: Optional[List[str]] = None,
+                   extractions: Optional[List[str]] = None) -> List[Dict]:
+    """
+    Ejecuta todos los casos pedidos
+
+    Args:
+        corpus: Corpus generado
+        workdir: Carpeta para las salidas y la caché temporal
+        worker_counts: Números de procesos a probar
+        modes: Modos a medir
+        warm_cache: Repetir cada caso con la caché ya llena
+        page_writers: Bibliotecas de escritura a comparar en el modo separar
+        extractions: Modos de lectura del texto a comparar al separar y renombrar
+
+    Returns:
+        Métricas de cada caso, en orden de ejecución
+    """
+    page_writers = page_writers or [DEFAULT_PAGE_WRITER]
+    extractions = extractions or [DEFAULT_EXTRACTION]
+    cases = []
+    for mode in modes:
+        for max_workers in worker_counts:
+            output_folder = os.path.join(workdir, f"salida_{mode}_{max_workers}")
+            # Solo el modo separar escribe páginas; los demás se miden una vez
+            for page_writer in (page_writers if mode == "separate" else page_writers[:1]):
+                for extraction in (extractions if mode != "organize" else extractions[:1]):
+                    cases.append(run_case_isolated(mode, corpus, output_folder, max_workers,
+                                                   page_writer=page_writer, extraction=extraction))
+                    print(_format_case(cases[-1]), file=sys.stderr)
+
+            if warm_cache and mode != "organize":
+                # Primera pasada llena la caché; la segunda mide el caso con caché caliente
+                cache_path = os.path.join(workdir, f"cache_{mode}_{max_workers}.sqlite3")
+                run_case_isolated(mode, corpus, output_folder, max_workers, cache_path)
+                cases.append(run_case_isolated(mode, corpus, output_folder, max_workers, cache_path))
+                print(_format_case(cases[-1]), file=sys.stderr)
+    return cases
+
+
+def _format_case(case: Dict) -> str:
+    """Línea de progreso legible de un caso"""
+    if "error" in case:
+        return f"{case['mode']:<9} w={case['workers']:<3} ERROR: {case['error']}"
+    cache = "caché" if case["cache"] else ""
+    writer = case.get("page_writer") or ""
+    extraction = case.get("extraction") or ""
+    return (
+        f"{case['mode']:<9} w={case['workers']:<3} {cache:<5} {writer:<7} {extraction:<6} {case['seconds']:>8.2f}s "
+        f"{case['pages_per_s']:>9.1f} pág/s {case['files_per_s']:>9.1f} arch/s"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Mide el rendimiento de separar, renombrar y organizar sobre un corpus sintético."
+    )
+    parser.add_argument("--corpus", help="carpeta donde generar el corpus (por defecto, temporal)")
+    parser.add_argument("--bundle-pages", type=int, default=500, help="páginas del PDF multi-página")
+    parser.add_argument("--singles", type=int, default=300, help="constancias individuales a renombrar")
+    parser.add_argument("--worker-names", type=int, default=100, help="trabajadores distintos en el corpus")
+    parser.add_argument("--seed", type=int, default=0, help="semilla del corpus")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1],
+                        help="números de procesos a probar")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES, help="modos a medir")
+    parser.add_argument("--warm-cache", action="store_true", help="medir también con la caché de extracción llena")
+    parser.add_argument("--page-writers", nargs="+", choices=PAGE_WRITERS, default=[DEFAULT_PAGE_WRITER],
+                        help="bibliotecas de escritura a comparar al separar (p. ej. pymupdf pypdf2)")
+    parser.add_argument("--extractions", nargs="+", choices=EXTRACTION_MODES, default=[DEFAULT_EXTRACTION],
+                        help="modos de lectura del texto a comparar al separar y renombrar (p. ej. full blocks roi)")
+    parser.add_argument("--output", help="guardar el informe JSON en este archivo (por defecto, stdout)")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="organizador_bench_")
+    try:
+        corpus_root = args.corpus or os.path.join(workdir, "corpus")
+        print(f"Generando corpus en {corpus_root}...", file=sys.stderr)
+        corpus = build_corpus(
+            corpus_root, bundle_pages=args.bundle_pages, singles=args.singles,
+            workers=args.worker_names, seed=args.seed
+        )
+
+        report = {
+            "environment": environment_info(),
+            "corpus": corpus.as_dict(),
+            "results": run_benchmarks(
+                corpus, workdir, sorted(set(args.workers)), args.modes, args.warm_cache,
+                list(dict.fromkeys(args.page_writers)), list(dict.fromkeys(args.extractions))
+            ),
+        }
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+    return 0 if all("error" not in case for case in report["results"]) else 1
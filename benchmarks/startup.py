@@ -0,0 +1,132 @@
+"""
+Tiempo de arranque: lo que cuesta importar la ventana principal y, aparte, el procesador de PDFs
+
+Uso:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 10 --output arranque.json
+
+Cada medición se hace en un proceso nuevo con python -X importtime. Termina con
+código 1 si al importar la ventana principal se cargan módulos que solo hacen
+falta al procesar PDFs (PyMuPDF, PyPDF2, procesadores...): el explorador debe
+arrancar solo con Qt.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+from .run import environment_info
+
+WINDOW_MODULE = "organizer.main_window"
+PDF_MODULE = "organizer.ui.pdf_dialog"
+
+# Módulos que no deben cargarse al abrir la ventana principal
+DEFERRED_MODULES = (
+    "fitz", "pymupdf", "PyPDF2",
+    "organizer.ui.pdf_dialog", "organizer.processors.pdf_processor", "organizer.processors.pdf_document",
+)
+
+# Módulos cuyo tiempo acumulado se muestra en el informe
+REPORTED_MODULES = ("PySide6.QtWidgets", "send2trash", "fitz", "PyPDF2", "organizer.processors.pdf_processor")
+
+
+def measure_imports(modules: List[str]) -> Dict[str, float]:
+    """
+    Importa módulos en un proceso nuevo y lee los tiempos de -X importtime
+
+    Args:
+        modules: Módulos a importar, en orden (cada uno solo cuenta lo que no cargaron los anteriores)
+
+    Returns:
+        Milisegundos acumulados de cada módulo cargado en el proceso
+    """
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    code = "; ".join(f"import {module}" for module in modules)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, env=env,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+
+    # Formato: "import time: <propio µs> | <acumulado µs> | <módulo>"
+    cumulative: Dict[str, float] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        cumulative[parts[2].strip()] = int(parts[1]) / 1000
+    return cumulative
+
+
+def run_startup_benchmark(runs: int) -> Dict:
+    """
+    Mide el arranque varias veces y resume la mediana
+
+    Args:
+        runs: Procesos a lanzar
+
+    Returns:
+        Informe con tiempos en milisegundos y módulos cargados antes de tiempo
+    """
+    samples: Dict[str, List[float]] = {}
+    deferred_loaded = set()
+    for _ in range(runs):
+        window = measure_imports([WINDOW_MODULE])
+        deferred_loaded.update(module for module in DEFERRED_MODULES if module in window)
+        samples.setdefault("window_ms", []).append(window.get(WINDOW_MODULE, 0.0))
+        for module in REPORTED_MODULES:
+            if module in window:
+                samples.setdefault(f"window:{module}", []).append(window[module])
+
+        # Coste de abrir "Procesar PDFs" con la ventana ya cargada
+        both = measure_imports([WINDOW_MODULE, PDF_MODULE])
+        samples.setdefault("pdf_processor_ms", []).append(both.get(PDF_MODULE, 0.0))
+        for module in REPORTED_MODULES:
+            if module in both and module not in window:
+                samples.setdefault(f"pdf_processor:{module}", []).append(both[module])
+
+    return {
+        "runs": runs,
+        "median_ms": {key: round(statistics.median(values), 1) for key, values in samples.items()},
+        "deferred_modules_loaded_at_startup": sorted(deferred_loaded),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.startup",
+        description="Mide el tiempo de importación de la ventana principal y del procesador de PDFs."
+    )
+    parser.add_argument("--runs", type=int, default=5, help="procesos a lanzar (se muestra la mediana)")
+    parser.add_argument("--output", help="guardar el informe JSON en este archivo (por defecto, stdout)")
+    args = parser.parse_args(argv)
+
+    report = {
+        "environment": environment_info(),
+        "startup": run_startup_benchmark(max(1, args.runs)),
+    }
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    loaded = report["startup"]["deferred_modules_loaded_at_startup"]
+    if loaded:
+        print(f"La ventana principal carga módulos que deberían cargarse al procesar PDFs: {', '.join(loaded)}",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 from PySide6.QtWidgets import QApplication
+import multiprocessing
 import sys
 from organizer.main_window import MainWindow
 
@@ -10,4 +11,6 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    # Necesario para el pool de procesos en el ejecutable de PyInstaller
+    multiprocessing.freeze_support()
     main()
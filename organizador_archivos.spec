@@ -2,6 +2,8 @@
 import sys
 from pathlib import Path
 
+from PyInstaller.utils.hooks import collect_submodules
+
 # Configuración para macOS
 block_cipher = None
 
@@ -24,13 +26,11 @@ hiddenimports = [
     'reportlab.pdfgen.canvas',
     'dateutil',
     'regex',
-    'organizer.main_window',
-    'organizer.processors.pdf_processor',
-    'organizer.processors.pdf_thread',
-    'organizer.ui.pdf_dialog',
-    'organizer.ui.pdf_tabs',
-    'organizer.ui.styles',
-    'organizer.utils.patterns'
+
+    # Todos los módulos de la aplicación: el procesador de PDFs (y lo que usa) se importa
+    # después de abrir la ventana (ver main_window.load_pdf_processor_dialog) y el análisis
+    # estático no ve esas importaciones diferidas. Así no hay lista que mantener a mano.
+    *collect_submodules('organizer'),
 ]
 
 a = Analysis(
@@ -0,0 +1,12 @@
+"""
+Permite ejecutar el procesamiento por línea de comandos: python -m organizer ...
+"""
+import multiprocessing
+import sys
+
+from .cli import main
+
+if __name__ == "__main__":
+    # Necesario para el pool de procesos en el ejecutable de PyInstaller
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,354 @@
+"""
+Línea de comandos para procesar PDFs sin interfaz gráfica
+
+Uso:
+    python -m organizer separate certificados.pdf -o salida/
+    python -m organizer rename carpeta/ --workers 8 --format csv
+    python -m organizer rename archivo/ --recursive --exclude "borradores" --exclude "2019/*"
+    python -m organizer organize carpeta_procesada/ --report resultados.json
+    python -m organizer organize carpeta_procesada/ --incremental
+    python -m organizer separate certificados.pdf --plan plan.json --plan-only
+    python -m organizer watch carpeta_escaner/ -o procesados/
+
+No importa PySide6: sirve en servidores sin entorno gráfico.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from dataclasses import asdict, fields
+from typing import Dict, Iterator, List, Optional
+
+from .processors.block_extraction import DEFAULT_EXTRACTION, EXTRACTION_MODES
+from .processors.discovery import DEFAULT_INCLUDE, DiscoveryOptions
+from .processors.job_journal import open_job_journal
+from .processors.job_plan import JobPlan, JobPlanner
+from .processors.parallel import default_worker_count
+from .processors.pdf_document import DEFAULT_PAGE_WRITER, PAGE_WRITERS
+from .processors.pdf_processor import PDFProcessor, ProcessResult
+from .processors.preview import plan_summary_lines
+from .processors.rename_engine import ConcurrentRenamer
+from .processors.sync_manifest import SyncOptions
+from .processors.transfer import DEFAULT_TRANSFER, TRANSFER_STRATEGIES
+from .processors.watch_folder import DEFAULT_SETTLE_SECONDS, FolderWatcher
+from .utils.cache import open_extraction_cache
+
+# Columnas de salida (mismo orden que los campos de ProcessResult)
+RESULT_FIELDS = [f.name for f in fields(ProcessResult)]
+
+
+def result_to_dict(result: ProcessResult) -> Dict:
+    """Convertir un resultado en un diccionario serializable"""
+    return asdict(result)
+
+
+def _csv_row(result: ProcessResult) -> Dict:
+    """Fila CSV: los valores compuestos se guardan como JSON"""
+    row = result_to_dict(result)
+    for key, value in row.items():
+        if isinstance(value, (dict, list)):
+            row[key] = json.dumps(value, ensure_ascii=False)
+    return row
+
+
+def default_output_folder(command: str, input_path: str) -> str:
+    """
+    Carpeta de salida sugerida (la misma que propone la interfaz gráfica)
+
+    Args:
+        command: Comando ('separate', 'rename', 'organize' o 'watch')
+        input_path: Archivo o carpeta de entrada
+
+    Returns:
+        Ruta de la carpeta de salida
+    """
+    if command == "separate":
+        return os.path.join(os.path.dirname(os.path.abspath(input_path)), "PDFs_Procesados")
+    if command in ("rename", "watch"):
+        return os.path.join(input_path, "PDFs_Procesados")
+    return os.path.join(input_path, "PDFs_Procesados_Trabajadores")
+
+
+class ResultWriter:
+    """Escribe cada resultado en stdout en cuanto llega (JSON Lines o CSV)"""
+
+    def __init__(self, stream, output_format: str):
+        self.stream = stream
+        self.output_format = output_format
+        self._csv_writer = None
+
+    def write(self, result: ProcessResult):
+        if self.output_format == "csv":
+            if self._csv_writer is None:
+                self._csv_writer = csv.DictWriter(self.stream, fieldnames=RESULT_FIELDS)
+                self._csv_writer.writeheader()
+            self._csv_writer.writerow(_csv_row(result))
+        elif self.output_format == "jsonl":
+            self.stream.write(json.dumps(result_to_dict(result), ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+
+def write_report(path: str, results: List[ProcessResult], summary: Dict):
+    """
+    Guardar todos los resultados en un archivo (.csv o .json según la extensión)
+
+    Args:
+        path: Ruta del informe
+        results: Resultados del procesamiento
+        summary: Resumen generado por PDFProcessor.get_summary
+    """
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fieldnames=RESULT_FIELDS)
+            writer.writeheader()
+            for result in results:
+                writer.writerow(_csv_row(result))
+    else:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"summary": summary, "results": [result_to_dict(r) for r in results]},
+                file, ensure_ascii=False, indent=2
+            )
+
+
+def prepare_plan(args, processor: PDFProcessor) -> JobPlan:
+    """
+    Leer el plan guardado en --plan si sigue vigente; si no, planificar y guardarlo
+
+    Returns:
+        Plan completo del trabajo
+    """
+    if args.plan and os.path.exists(args.plan):
+        try:
+            plan = JobPlan.load(args.plan)
+            reason = plan.invalid_reason(args.command, args.input, args.output, processor.name_version)
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            reason = f"no se pudo leer: {e}"
+        if reason is None:
+            print(f"Usando el plan guardado en {args.plan}", file=sys.stderr)
+            return plan
+        print(f"Plan descartado ({reason}): se planifica de nuevo", file=sys.stderr)
+
+    plan = JobPlanner(processor).plan(args.command, args.input, args.output)
+    if args.plan:
+        plan.save(args.plan)
+    return plan
+
+
+def report_plan(args, plan: JobPlan) -> Optional[int]:
+    """
+    Mostrar el resumen del plan y decidir si seguir con el procesamiento
+
+    Returns:
+        Código de salida si hay que terminar aquí (--plan-only o sin espacio), None para procesar
+    """
+    for line in plan_summary_lines(plan):
+        print(line, file=sys.stderr)
+
+    if args.plan_only:
+        if args.format != "none":
+            # Una línea JSON por unidad planificada
+            for unit in plan.units:
+                sys.stdout.write(json.dumps(asdict(unit), ensure_ascii=False) + "\n")
+        return 0
+
+    if not plan.has_free_space():
+        print("Error: no hay espacio suficiente en la unidad de salida", file=sys.stderr)
+        return 2
+    return None
+
+
+def iter_command_results(args, processor: PDFProcessor, journal=None,
+                         plan: Optional[JobPlan] = None) -> Iterator[ProcessResult]:
+    """Ejecutar el comando pedido entregando los resultados a medida que se producen"""
+    if args.command == "separate":
+        return processor.iter_separate_multi_page_pdf(args.input, args.output, journal, plan)
+
+    if args.command == "rename":
+        renamer = ConcurrentRenamer(processor, args.workers)
+        return renamer.iter_rename(processor.iter_input_files(args.input, args.output), args.output, journal, plan)
+
+    if args.command == "watch":
+        watcher = FolderWatcher(
+            args.input, args.output, processor, settle_seconds=args.settle,
+            log_path=args.log, process_existing=args.process_existing
+        )
+        return watcher.iter_results()
+
+    return processor.iter_organize_by_worker(args.input, args.output, journal, plan)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Crear el analizador de argumentos"""
+    parser = argparse.ArgumentParser(
+        prog="python -m organizer",
+        description="Procesa certificados y constancias en PDF sin interfaz gráfica."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    commands = {
+        "separate": ("Separar un PDF multi-página en un archivo por trabajador", "PDF multi-página"),
+        "rename": ("Renombrar los PDFs de una carpeta con el nombre del trabajador", "carpeta con PDFs"),
+        "organize": ("Agrupar PDFs ya procesados en una carpeta por trabajador",
+                     "carpeta con subcarpetas PDFs_Procesados_*"),
+        "watch": ("Vigilar una carpeta y procesar cada PDF nuevo en cuanto termina de copiarse "
+                  "(hasta pulsar Ctrl+C)", "carpeta a vigilar"),
+    }
+
+    for name, (help_text, input_help) in commands.items():
+        sub = subparsers.add_parser(name, help=help_text, description=help_text)
+        sub.add_argument("input", help=input_help)
+        sub.add_argument("-o", "--output", help="carpeta de salida (por defecto, la misma que sugiere la aplicación)")
+        sub.add_argument("-w", "--workers", type=int, default=default_worker_count(),
+                         help="procesos en paralelo (por defecto: número de núcleos)")
+        sub.add_argument("--format", choices=["jsonl", "csv", "none"], default="jsonl",
+                         help="formato de los resultados por stdout (por defecto: jsonl)")
+        sub.add_argument("--report", help="guardar todos los resultados en un archivo .json o .csv")
+        sub.add_argument("--no-cache", action="store_true", help="no usar la caché de extracción")
+        sub.add_argument("--cache-path", help="ruta alternativa del archivo de caché")
+        if name in ("separate", "watch"):
+            sub.add_argument("--page-writer", choices=PAGE_WRITERS, default=DEFAULT_PAGE_WRITER,
+                             help="biblioteca con la que escribir las páginas separadas (por defecto: %(default)s)")
+        if name != "organize":
+            sub.add_argument("--extraction", choices=EXTRACTION_MODES, default=DEFAULT_EXTRACTION,
+                             help="cómo buscar el nombre: full (todo el texto), blocks (bloques en orden de "
+                                  "lectura, para en el primer nombre) o roi (además aprende la zona del nombre "
+                                  "en cada PDF multi-página) (por defecto: %(default)s)")
+        if name in ("rename", "organize", "watch"):
+            sub.add_argument("--transfer", choices=TRANSFER_STRATEGIES, default=DEFAULT_TRANSFER,
+                             help="cómo llevar cada archivo al destino; si no es posible se copia "
+                                  "(por defecto: %(default)s)")
+        if name != "watch":
+            sub.add_argument("--resume", action="store_true",
+                             help="reanudar un trabajo interrumpido con el diario de la carpeta de salida: "
+                                  "salta lo ya escrito y borra las salidas a medio escribir (por defecto se "
+                                  "procesa todo sin llevar diario, igual que en la interfaz)")
+            sub.add_argument("--plan", metavar="ARCHIVO",
+                             help="plan del trabajo en JSON: si existe y los archivos de entrada no cambiaron "
+                                  "se ejecuta sin volver a analizar los PDFs; si no, se calcula y se guarda aquí")
+            sub.add_argument("--plan-only", action="store_true",
+                             help="solo planificar: mostrar el plan (y guardarlo con --plan) sin escribir nada")
+
+    rename = subparsers.choices["rename"]
+    rename.add_argument("-r", "--recursive", action="store_true",
+                        help="renombrar también los PDFs de las subcarpetas (se empiezan a procesar mientras se buscan)")
+    rename.add_argument("--include", action="append", metavar="PATRÓN",
+                        help="glob de los archivos a renombrar, comparado con el nombre y con la ruta relativa "
+                             "(se puede repetir; por defecto: *.pdf)")
+    rename.add_argument("--exclude", action="append", metavar="PATRÓN",
+                        help="glob de archivos o carpetas a saltar (se puede repetir)")
+
+    organize = subparsers.choices["organize"]
+    organize.add_argument("--incremental", action="store_true",
+                          help="copiar solo los documentos nuevos o modificados: se saltan los que ya tienen "
+                               "en destino el mismo tamaño y fecha (o coinciden con el manifiesto de la última vez)")
+    organize.add_argument("--verify-hash", action="store_true",
+                          help="con --incremental, comparar el contenido cuando el tamaño coincide pero la fecha no")
+
+    watch = subparsers.choices["watch"]
+    watch.add_argument("--settle", type=float, default=DEFAULT_SETTLE_SECONDS,
+                       help="segundos sin cambios antes de procesar un archivo (por defecto: %(default)s)")
+    watch.add_argument("--log", help="registro rotativo (por defecto, en la carpeta de salida)")
+    watch.add_argument("--process-existing", action="store_true",
+                       help="procesar también los PDFs que ya estaban en la carpeta")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Punto de entrada de la línea de comandos
+
+    Returns:
+        0 si todo se procesó, 1 si hubo errores en algún archivo, 2 si la entrada no es válida
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.input):
+        print(f"Error: la ruta de entrada no existe: {args.input}", file=sys.stderr)
+        return 2
+    if args.command != "separate" and not os.path.isdir(args.input):
+        print(f"Error: '{args.command}' requiere una carpeta de entrada", file=sys.stderr)
+        return 2
+
+    args.output = args.output or default_output_folder(args.command, args.input)
+    args.workers = max(1, args.workers)
+
+    cache = None if args.no_cache else open_extraction_cache(args.cache_path)
+    processor = PDFProcessor(
+        max_workers=args.workers, cache=cache,
+        page_writer=getattr(args, "page_writer", DEFAULT_PAGE_WRITER),
+        transfer=getattr(args, "transfer", DEFAULT_TRANSFER),
+        discovery=DiscoveryOptions(
+            recursive=getattr(args, "recursive", False),
+            include=tuple(getattr(args, "include", None) or DEFAULT_INCLUDE),
+            exclude=tuple(getattr(args, "exclude", None) or ())
+        ),
+        sync=SyncOptions(
+            incremental=getattr(args, "incremental", False),
+            verify_hash=getattr(args, "verify_hash", False)
+        ),
+        extraction=getattr(args, "extraction", DEFAULT_EXTRACTION)
+    )
+    writer = ResultWriter(sys.stdout, args.format)
+    results = []
+
+    # El plan se comprueba antes de crear la carpeta de salida, que puede estar dentro de la entrada
+    plan = None
+    if args.command != "watch" and (args.plan or args.plan_only):
+        try:
+            plan = prepare_plan(args, processor)
+            exit_code = report_plan(args, plan)
+        except KeyboardInterrupt:
+            print("Planificación cancelada", file=sys.stderr)
+            exit_code = 130
+        if exit_code is not None:
+            if cache is not None:
+                cache.close()
+            return exit_code
+
+    journal = None
+    if args.command != "watch" and args.resume:
+        journal = open_job_journal(args.output, args.command, args.input)
+    if journal is not None:
+        # Lo que se borró o devolvió del intento anterior, antes de los resultados de esta ejecución
+        for result in journal.discarded:
+            results.append(result)
+            writer.write(result)
+            print(f"Reanudando: {result.error}", file=sys.stderr)
+
+    interrupted = False
+    try:
+        for result in iter_command_results(args, processor, journal, plan):
+            results.append(result)
+            writer.write(result)
+    except KeyboardInterrupt:
+        interrupted = True
+    finally:
+        if journal is not None:
+            journal.close()
+        if cache is not None:
+            cache.prune()
+            cache.close()
+
+    # En modo vigilancia Ctrl+C es la forma normal de terminar
+    if interrupted and args.command != "watch":
+        print("Procesamiento cancelado", file=sys.stderr)
+        return 130
+
+    summary = processor.get_summary(results)
+    if args.report:
+        write_report(args.report, results, summary)
+
+    print(
+        f"Procesados: {summary['total_processed']} | Exitosos: {summary['successful']} | "
+        f"Con errores: {summary['failed']} | Trabajadores: {summary['workers_found']}"
+        + (f" | Sin cambios: {summary['skipped']}" if summary['skipped'] else "")
+        + (f" | Del intento interrumpido: {summary['interrupted']}" if summary['interrupted'] else "")
+        + (f" | Copia normal en lugar de {processor.transfer}: {summary['transfer_fallbacks']}"
+           if summary['transfer_fallbacks'] else ""),
+        file=sys.stderr
+    )
+    return 0 if summary['failed'] == 0 else 1
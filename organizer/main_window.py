@@ -1,15 +1,60 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QFileDialog, QMessageBox,
-    QTreeView, QToolBar, QInputDialog, QFileSystemModel,
-    QStatusBar
+    QTreeView, QToolBar, QInputDialog,
+    QStatusBar, QApplication, QProgressDialog
 )
-from PySide6.QtCore import QDir, QModelIndex, Qt
+from PySide6.QtCore import QDir, QModelIndex, Qt, QTimer
 from PySide6.QtGui import QAction
 import os
-import shutil
-from send2trash import send2trash
-from .ui.pdf_dialog import PDFProcessorDialog  # Import actualizado
+import threading
+import time
+from typing import Optional
 from PySide6.QtCore import QSize
+from .ui.file_model import FolderSizeModel
+from .processors.file_operations import (
+    OPERATION_DELETE, OPERATION_MOVE, OPERATION_TRASH, FileOperationThread, move_destination, top_level_paths
+)
+
+# Milisegundos tras abrir la ventana antes de precargar el procesador de PDFs
+PDF_WARMUP_DELAY_MS = 500
+
+# Segundos que tardó en importarse el procesador de PDFs (None = aún no cargado)
+pdf_processor_import_seconds = None
+
+# Elementos nombrados en las confirmaciones y avisos de operaciones en lote
+CONFIRM_LIST_LIMIT = 10
+
+# Milisegundos antes de mostrar el progreso de una operación en lote (las rápidas no lo muestran)
+PROGRESS_DIALOG_DELAY_MS = 400
+
+
+def load_pdf_processor_dialog():
+    """
+    Importa el diálogo de PDFs y con él PyMuPDF, PyPDF2 y los procesadores
+    
+    El explorador arranca solo con Qt; esto se hace en segundo plano tras
+    mostrar la ventana o, como tarde, al pulsar "Procesar PDFs". Importar dos
+    veces no cuesta nada y, si la precarga está en curso, Python espera a que
+    termine en lugar de repetirla.
+    
+    Returns:
+        Clase PDFProcessorDialog
+    """
+    global pdf_processor_import_seconds
+    start = time.perf_counter()
+    from .ui.pdf_dialog import PDFProcessorDialog
+    if pdf_processor_import_seconds is None:
+        pdf_processor_import_seconds = time.perf_counter() - start
+    return PDFProcessorDialog
+
+
+def _warm_up_pdf_processor():
+    """Precargar el procesador de PDFs sin bloquear la interfaz (los errores se verán al abrirlo)"""
+    try:
+        load_pdf_processor_dialog()
+    except Exception:
+        pass
+
 
 class MainWindow(QMainWindow):
     def __init__(self, parent=None):
@@ -33,8 +78,13 @@ class MainWindow(QMainWindow):
         self._history: list[str] = []
         self._future: list[str] = []
 
+        # Operación en lote en curso (mover, papelera o eliminar)
+        self._file_operation: Optional[FileOperationThread] = None
+        self._file_operation_progress: Optional[QProgressDialog] = None
+        self._file_operation_bytes = False
+
         # Modelo de sistema de archivos
-        self.model = QFileSystemModel(self)
+        self.model = FolderSizeModel(self)
         self.model.setReadOnly(False)
         self.model.setFilter(QDir.Filter.AllEntries | QDir.Filter.NoDotAndDotDot)
 
@@ -44,6 +94,7 @@ class MainWindow(QMainWindow):
         self.view.setSortingEnabled(True)
         self.view.setAlternatingRowColors(True)
         self.view.setSelectionBehavior(QTreeView.SelectionBehavior.SelectRows)
+        self.view.setSelectionMode(QTreeView.SelectionMode.ExtendedSelection)
         self.view.setUniformRowHeights(True)
         self.view.setWordWrap(False)
         self.view.doubleClicked.connect(self.on_double_clicked)
@@ -178,15 +229,22 @@ class MainWindow(QMainWindow):
         tb.addAction(act_rename)
 
         act_move = QAction("📤 Mover", self)
-        act_move.setToolTip("Mover archivo a otra ubicación")
+        act_move.setToolTip("Mover los elementos seleccionados a otra ubicación")
         act_move.triggered.connect(self.move_selected)
         tb.addAction(act_move)
 
         act_delete = QAction("🗑️ Eliminar", self)
-        act_delete.setToolTip("Enviar archivo a la papelera")
+        act_delete.setShortcut("Del")
+        act_delete.setToolTip("Enviar los elementos seleccionados a la papelera (Supr)")
         act_delete.triggered.connect(self.delete_selected)
         tb.addAction(act_delete)
 
+        # Solo con atajo: eliminar sin pasar por la papelera
+        act_delete_permanently = QAction("Eliminar permanentemente", self)
+        act_delete_permanently.setShortcut("Shift+Del")
+        act_delete_permanently.triggered.connect(self.delete_permanently_selected)
+        self.addAction(act_delete_permanently)
+
         act_refresh = QAction("🔄 Actualizar", self)
         act_refresh.setToolTip("Actualizar vista de archivos")
         act_refresh.triggered.connect(self.refresh)
@@ -225,6 +283,13 @@ class MainWindow(QMainWindow):
         # Establece carpeta inicial a Home
         home = QDir.homePath()
         self.set_root_path(home)
+        
+        # Cargar el procesador de PDFs cuando la ventana ya se haya pintado
+        QTimer.singleShot(PDF_WARMUP_DELAY_MS, self.start_pdf_warmup)
+    
+    def start_pdf_warmup(self):
+        if pdf_processor_import_seconds is None:
+            threading.Thread(target=_warm_up_pdf_processor, name="pdf-warmup", daemon=True).start()
 
     # ----- Métodos de navegación -----
     def set_root_path(self, path: str):
@@ -293,17 +358,36 @@ class MainWindow(QMainWindow):
             return QModelIndex()
         return idx
 
+    def selected_paths(self) -> list[str]:
+        # Filas seleccionadas (columna 0) o, si no hay selección, el elemento actual
+        paths = [self.model.filePath(idx) for idx in self.view.selectionModel().selectedRows(0)]
+        if not paths:
+            idx = self.current_index()
+            if idx.isValid():
+                paths.append(self.model.filePath(idx))
+        return paths
+
     def open_pdf_processor(self):
+        # Si la precarga no terminó, se espera aquí (o se importa ahora)
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            PDFProcessorDialog = load_pdf_processor_dialog()
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"No se pudo cargar el procesador de PDFs:\n{e}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        
         dialog = PDFProcessorDialog(self)
         current_root = self.view.rootIndex()
         if current_root.isValid():
-            current_path = self.model.filePath(current_root)
-            try:
-                pdf_files = [f for f in os.listdir(current_path) if f.lower().endswith('.pdf')]
-                if pdf_files:
-                    dialog.config_tab.input_path.setText(current_path)
-            except (PermissionError, FileNotFoundError):
-                pass
+            # El modelo ya tiene la carpeta listada: no se vuelve a leer el disco
+            has_pdfs = any(
+                self.model.fileName(self.model.index(row, 0, current_root)).lower().endswith('.pdf')
+                for row in range(self.model.rowCount(current_root))
+            )
+            if has_pdfs:
+                dialog.config_tab.input_path.setText(self.model.filePath(current_root))
         dialog.exec()
 
     # ----- Slots/Acciones -----
@@ -343,82 +427,198 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", f"No se pudo renombrar: {e}")
 
     def move_selected(self):
-        idx = self.current_index()
-        if not idx.isValid():
-            QMessageBox.information(self, "Mover", "Selecciona un elemento en la lista.")
+        paths = self.selected_paths()
+        if not paths:
+            QMessageBox.information(self, "Mover", "Selecciona uno o más elementos en la lista.")
             return
 
-        src_path = self.model.filePath(idx)
         target_dir = QFileDialog.getExistingDirectory(self, "Mover a carpeta...")
         if not target_dir:
             return
 
-        dst_path = os.path.join(target_dir, os.path.basename(src_path))
-        if os.path.abspath(src_path) == os.path.abspath(dst_path):
-            return
-
-        if os.path.exists(dst_path):
+        paths = top_level_paths(paths)
+        conflicts = sum(1 for path in paths if os.path.lexists(move_destination(path, target_dir)))
+        if len(paths) == 1 and conflicts:
             QMessageBox.warning(self, "Mover", "El destino ya contiene un archivo con el mismo nombre.")
             return
 
-        try:
-            shutil.move(src_path, dst_path)
-            self.statusBar().showMessage(f"Movido a: {dst_path}", 4000)
-            self.refresh()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"No se pudo mover: {e}")
+        message = f"¿Mover {self._count_label(paths)} a:\n{target_dir}?\n\n{self._item_list(paths)}"
+        if conflicts:
+            message += f"\n\n{conflicts} ya existen en el destino y no se moverán."
+        reply = QMessageBox.question(
+            self, "Mover", message,
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.Yes
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.start_file_operation(OPERATION_MOVE, paths, target_dir)
 
     def delete_selected(self):
-        idx = self.current_index()
-        if not idx.isValid():
-            QMessageBox.information(self, "Eliminar", "Selecciona un elemento en la lista.")
+        paths = [path for path in self.selected_paths() if os.path.lexists(path)]
+        if not paths:
+            QMessageBox.information(self, "Eliminar", "Selecciona uno o más elementos en la lista.")
             return
 
-        path = self.model.filePath(idx)
-        file_name = os.path.basename(path)
-        
-        if not os.path.exists(path):
-            QMessageBox.warning(self, "Error", f"El archivo ya no existe:\n{path}")
-            return
-            
         reply = QMessageBox.question(
             self, "Eliminar a Papelera",
-            f"¿Enviar a la papelera?\n\n{file_name}\n\nRuta: {path}",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, 
+            f"¿Enviar a la papelera {self._count_label(paths)}?\n\n{self._item_list(paths)}",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.No
         )
-        if reply != QMessageBox.StandardButton.Yes:
+        if reply == QMessageBox.StandardButton.Yes:
+            self.start_file_operation(OPERATION_TRASH, paths)
+
+    def delete_permanently_selected(self):
+        paths = [path for path in self.selected_paths() if os.path.lexists(path)]
+        if not paths:
+            QMessageBox.information(self, "Eliminar", "Selecciona uno o más elementos en la lista.")
             return
+        self.confirm_permanent_delete(
+            paths, f"¿Eliminar permanentemente {self._count_label(paths)}?\n\n{self._item_list(paths)}"
+        )
 
-        try:
-            normalized_path = os.path.normpath(path)
-            send2trash(normalized_path)
-            self.statusBar().showMessage(f"'{file_name}' enviado a papelera.", 4000)
-            self.refresh()
-        except Exception as e:
-            error_msg = str(e)
+    def confirm_permanent_delete(self, paths: list[str], message: str):
+        reply = QMessageBox.question(
+            self, "Eliminar permanentemente",
+            f"{message}\n\nADVERTENCIA: Esta acción no se puede deshacer.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.start_file_operation(OPERATION_DELETE, paths)
+
+    @staticmethod
+    def _count_label(paths: list[str]) -> str:
+        return "1 elemento" if len(paths) == 1 else f"{len(paths)} elementos"
+
+    @staticmethod
+    def _item_list(paths: list[str]) -> str:
+        # Un elemento se muestra con su ruta; de varios, solo los primeros nombres
+        if len(paths) == 1:
+            return f"{os.path.basename(paths[0])}\n\nRuta: {paths[0]}"
+        names = "\n".join(f"  • {os.path.basename(path)}" for path in paths[:CONFIRM_LIST_LIMIT])
+        if len(paths) > CONFIRM_LIST_LIMIT:
+            names += f"\n  ... y {len(paths) - CONFIRM_LIST_LIMIT} más"
+        return names
+
+    # ----- Operaciones en lote -----
+    def start_file_operation(self, operation: str, paths: list[str], target_dir: Optional[str] = None):
+        if self._file_operation is not None:
+            self.statusBar().showMessage("Espera a que termine la operación en curso.", 4000)
+            return
+
+        thread = FileOperationThread(operation, paths, target_dir)
+        labels = {
+            OPERATION_MOVE: "Moviendo",
+            OPERATION_TRASH: "Enviando a la papelera",
+            OPERATION_DELETE: "Eliminando",
+        }
+        progress = QProgressDialog(f"{labels[operation]} {self._count_label(thread.paths)}...",
+                                   "Cancelar", 0, len(thread.paths), self)
+        progress.setWindowTitle("Organizador de Archivos")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(PROGRESS_DIALOG_DELAY_MS)
+        progress.setAutoClose(False)
+        progress.setAutoReset(False)
+        if operation == OPERATION_TRASH:
+            # La papelera recibe todo en una sola llamada: no hay pasos intermedios ni cancelación
+            progress.setRange(0, 0)
+            progress.setCancelButton(None)
+        progress.setValue(0)
+
+        thread.progress.connect(self.handle_file_operation_progress)
+        thread.transfer_progress.connect(self.handle_transfer_progress)
+        thread.operation_finished.connect(self.handle_file_operation_finished)
+        progress.canceled.connect(thread.cancel)
+
+        self._file_operation = thread
+        self._file_operation_progress = progress
+        self._file_operation_bytes = False
+        thread.start()
+
+    def handle_file_operation_progress(self, done: int, total: int):
+        progress = self._file_operation_progress
+        if progress is not None and progress.maximum() > 0 and not self._file_operation_bytes:
+            progress.setValue(done)
+            progress.setLabelText(f"{done} de {total} elementos procesados...")
+
+    def handle_transfer_progress(self, status):
+        # Al mover entre unidades la barra sigue los bytes copiados (en milésimas: QProgressBar usa int)
+        progress = self._file_operation_progress
+        if progress is None:
+            return
+        if not self._file_operation_bytes:
+            self._file_operation_bytes = True
+            progress.setRange(0, 1000)
+        progress.setValue(int(status.bytes_done * 1000 / status.bytes_total) if status.bytes_total else 0)
+
+        text = f"Copiando a otra unidad: {status.bytes_done / 1048576:.1f} de {status.bytes_total / 1048576:.1f} MB"
+        if status.bytes_per_second:
+            text += f"\n{status.bytes_per_second / 1048576:.1f} MB/s"
+        if status.eta_seconds is not None:
+            minutes, seconds = divmod(int(status.eta_seconds), 60)
+            text += f" · quedan {minutes} min {seconds:02d} s" if minutes else f" · quedan {seconds} s"
+        progress.setLabelText(text)
+
+    def handle_file_operation_finished(self, result):
+        thread = self._file_operation
+        thread.wait()
+        thread.deleteLater()
+        self._file_operation = None
+        self._file_operation_progress.close()
+        self._file_operation_progress.deleteLater()
+        self._file_operation_progress = None
+
+        labels = {
+            OPERATION_MOVE: "movidos",
+            OPERATION_TRASH: "enviados a papelera",
+            OPERATION_DELETE: "eliminados permanentemente",
+        }
+        message = f"{len(result.done)} de {result.total} elementos {labels[result.operation]}."
+        if result.cancelled:
+            message += " Operación cancelada."
+        if result.failed:
+            message += f" {len(result.failed)} con errores."
+        self.statusBar().showMessage(message, 4000)
+        self.refresh()
+
+        if not result.failed:
+            return
+        details = "\n".join(f"{os.path.basename(path)}: {error}"
+                            for path, error in result.failed[:CONFIRM_LIST_LIMIT])
+        if len(result.failed) > CONFIRM_LIST_LIMIT:
+            details += f"\n... y {len(result.failed) - CONFIRM_LIST_LIMIT} más"
+
+        if result.operation == OPERATION_TRASH:
+            remaining = [path for path, _ in result.failed if os.path.lexists(path)]
+            if remaining:
+                self.confirm_permanent_delete(
+                    remaining,
+                    f"No se pudieron enviar a la papelera {self._count_label(remaining)}:\n\n{details}\n\n"
+                    f"¿Desea eliminarlos permanentemente?"
+                )
+                return
+        QMessageBox.warning(self, "Operación incompleta",
+                            f"No se pudieron procesar {self._count_label(result.failed)}:\n\n{details}")
+
+    def closeEvent(self, event):
+        if self._file_operation is not None and self._file_operation.isRunning():
             reply = QMessageBox.question(
-                self, "Error al enviar a papelera", 
-                f"No se pudo enviar a la papelera:\n{error_msg}\n\n"
-                f"¿Desea eliminar permanentemente el archivo?\n"
-                f"ADVERTENCIA: Esta acción no se puede deshacer.",
+                self, "Operación en curso",
+                "Hay una operación con archivos en curso. ¿Desea cancelarla y cerrar?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                 QMessageBox.StandardButton.No
             )
-            
-            if reply == QMessageBox.StandardButton.Yes:
-                try:
-                    if os.path.isfile(normalized_path):
-                        os.remove(normalized_path)
-                    elif os.path.isdir(normalized_path):
-                        shutil.rmtree(normalized_path)
-                    
-                    self.statusBar().showMessage(f"'{file_name}' eliminado permanentemente.", 4000)
-                    self.refresh()
-                except Exception as e2:
-                    QMessageBox.critical(self, "Error", f"No se pudo eliminar el archivo:\n{e2}")
+            if reply != QMessageBox.StandardButton.Yes:
+                event.ignore()
+                return
+            self._file_operation.cancel()
+            self._file_operation.wait()
+        self.model.shutdown()
+        event.accept()
 
     def refresh(self):
         current_root = self.view.rootIndex()
         if current_root.isValid():
+            self.model.invalidate_folder_sizes(self.model.filePath(current_root))
             self.view.resizeColumnToContents(0)
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""
+Detección del nombre por bloques de texto en orden de lectura, con parada temprana y zona aprendida
+"""
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+from ..utils.patterns import WorkerNameMatcher
+
+# Formas de leer el texto de una página para buscar el nombre:
+#   full:   texto completo de la página y todos los patrones sobre él
+#   blocks: bloques en orden de lectura, parando en el primero con un nombre válido
+#   roi:    como blocks, y tras las primeras páginas con nombre de un documento
+#           solo se lee la zona donde apareció (si no está ahí, la página entera)
+EXTRACTION_FULL = "full"
+EXTRACTION_BLOCKS = "blocks"
+EXTRACTION_ROI = "roi"
+EXTRACTION_MODES = (EXTRACTION_FULL, EXTRACTION_BLOCKS, EXTRACTION_ROI)
+DEFAULT_EXTRACTION = EXTRACTION_FULL
+
+EXTRACTION_LABELS = {
+    EXTRACTION_FULL: "Página completa (todos los patrones sobre todo el texto)",
+    EXTRACTION_BLOCKS: "Por bloques, parar en el primer nombre",
+    EXTRACTION_ROI: "Por bloques y solo la zona donde suele estar el nombre",
+}
+
+# Páginas con nombre de un documento a partir de las cuales se recorta a la zona aprendida
+ROI_LEARN_PAGES = 3
+
+# Margen alrededor de la zona aprendida (fracción del tamaño de la página)
+ROI_MARGIN = 0.05
+
+# Últimas líneas del texto anterior que se añaden a cada bloque al buscar,
+# para encontrar nombres cuyo patrón empieza en un bloque y termina en otro
+CONTEXT_LINES = 3
+
+# Rectángulo (x0, y0, x1, y1) en fracciones del ancho y alto de la página
+Rect = Tuple[float, float, float, float]
+
+
+@dataclass(frozen=True)
+class TextBlock:
+    """Bloque de texto de una página, con su posición relativa al tamaño de la página"""
+    rect: Rect
+    text: str
+
+
+def _union(first: Rect, second: Rect) -> Rect:
+    """Rectángulo mínimo que contiene a los dos"""
+    return (min(first[0], second[0]), min(first[1], second[1]),
+            max(first[2], second[2]), max(first[3], second[3]))
+
+
+class NameRegion:
+    """
+    Zona de la página donde aparece el nombre en un documento
+
+    Se aprende de las primeras páginas en las que se encontró un nombre (la
+    unión de los bloques que hicieron falta para encontrarlo) y, a partir de ROI_LEARN_PAGES,
+    las siguientes páginas se leen recortadas a esa zona con un margen. Si
+    una página no tiene el nombre dentro de la zona se lee entera y la zona
+    se amplía con lo encontrado.
+    """
+
+    def __init__(self, learn_pages: int = ROI_LEARN_PAGES, margin: float = ROI_MARGIN):
+        self.learn_pages = learn_pages
+        self.margin = margin
+        self._rect: Optional[Rect] = None
+        self._learned = 0
+
+    def clip(self) -> Optional[Rect]:
+        """
+        Returns:
+            Zona a leer (con margen), o None si aún no se ha aprendido
+        """
+        if self._rect is None or self._learned < self.learn_pages:
+            return None
+        x0, y0, x1, y1 = self._rect
+        return (max(0.0, x0 - self.margin), max(0.0, y0 - self.margin),
+                min(1.0, x1 + self.margin), min(1.0, y1 + self.margin))
+
+    def learn(self, rect: Rect):
+        """Añadir la posición del nombre encontrado en una página"""
+        self._rect = rect if self._rect is None else _union(self._rect, rect)
+        self._learned += 1
+
+
+def find_name_in_blocks(blocks: Iterable[TextBlock],
+                        matcher: WorkerNameMatcher) -> Optional[Tuple[str, Rect]]:
+    """
+    Busca el nombre bloque a bloque y se detiene en el primero válido
+
+    Cada bloque se busca junto con las últimas CONTEXT_LINES líneas del texto
+    anterior, así que el coste es proporcional al texto leído hasta el nombre
+    y no al de toda la página. El nombre es el primero válido en orden de
+    lectura (en el modo full gana el patrón de mayor prioridad en toda la
+    página; en los certificados habituales coinciden).
+
+    Args:
+        blocks: Bloques de la página en orden de lectura
+        matcher: Motor de patrones
+
+    Returns:
+        (nombre, zona de los bloques necesarios para encontrarlo) o None si no se encuentra
+    """
+    # Últimas líneas leídas, con la zona del bloque de cada una
+    context: List[Tuple[str, Rect]] = []
+    for block in blocks:
+        context_text = '\n'.join(line for line, _ in context)
+        text = f"{context_text}\n{block.text}" if context_text else block.text
+        found = matcher.search(text)
+        if found is not None:
+            name = found[0]
+            rect = block.rect
+            # Si el bloque solo no basta, la zona incluye todos los bloques de las líneas anteriores
+            # usadas: ahí pueden estar el encabezado o la etiqueta que exige el patrón
+            if context and matcher.find(block.text) != name:
+                for _, line_rect in context:
+                    rect = _union(rect, line_rect)
+            return name, rect
+        lines = block.text.rstrip('\n').split('\n')
+        context = (context + [(line, block.rect) for line in lines])[-CONTEXT_LINES:]
+    return None
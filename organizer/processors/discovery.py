@@ -0,0 +1,131 @@
+"""
+Búsqueda de los PDFs de entrada, opcionalmente en subcarpetas y con patrones de inclusión y exclusión
+"""
+import os
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+DEFAULT_INCLUDE = ("*.pdf",)
+
+
+@dataclass(frozen=True)
+class DiscoveryOptions:
+    """
+    Qué archivos de la carpeta de entrada se procesan
+
+    Los patrones son globs (*, ?, [..]) sin distinguir mayúsculas y se
+    comparan con el nombre y con la ruta relativa a la carpeta de entrada
+    (separada por "/"), p. ej. "*.pdf", "2024/*" o "borradores".
+    """
+    recursive: bool = False
+    # Archivos que se procesan
+    include: Tuple[str, ...] = DEFAULT_INCLUDE
+    # Archivos y carpetas que se saltan (una carpeta excluida no se recorre)
+    exclude: Tuple[str, ...] = ()
+
+
+def _matches(name: str, relative_path: str, patterns: Sequence[str]) -> bool:
+    """Comprobar si un nombre o su ruta relativa coincide con algún patrón"""
+    name = name.lower()
+    relative_path = relative_path.lower()
+    return any(fnmatchcase(name, pattern) or fnmatchcase(relative_path, pattern) for pattern in patterns)
+
+
+class PDFDiscovery:
+    """
+    Recorre la carpeta de entrada entregando cada archivo en cuanto lo encuentra
+
+    Cada carpeta se lista con os.scandir y se ordena antes de entregar sus
+    archivos (primero los archivos, después las subcarpetas, en profundidad),
+    así el orden es estable y el procesamiento puede empezar mientras el
+    resto del árbol se sigue recorriendo. Como cada carpeta se lista entera
+    antes de entregar nada, los archivos que el propio procesamiento cree o
+    renombre en ella no vuelven a aparecer. No se siguen enlaces a carpetas.
+
+    Attributes:
+        found: Archivos entregados hasta ahora (total parcial para el progreso)
+        finished: True cuando se ha recorrido todo
+        skipped_folders: Subcarpetas que no se pudieron leer
+    """
+
+    def __init__(self, folder: str, options: DiscoveryOptions = DiscoveryOptions(),
+                 skip_folders: Iterable[str] = ()):
+        """
+        Args:
+            folder: Carpeta de entrada
+            options: Subcarpetas y patrones a aplicar
+            skip_folders: Carpetas que no se recorren nunca (p. ej. la de salida si está dentro de la entrada)
+        """
+        self.folder = folder
+        self.options = options
+        self.skip_folders = {os.path.normcase(os.path.abspath(path)) for path in skip_folders}
+        self.include = tuple(pattern.lower() for pattern in options.include)
+        self.exclude = tuple(pattern.lower() for pattern in options.exclude)
+        self.found = 0
+        self.finished = False
+        self.skipped_folders: List[str] = []
+
+    def __iter__(self) -> Iterator[str]:
+        return self.iter_paths()
+
+    def iter_paths(self) -> Iterator[str]:
+        """
+        Yields:
+            Ruta completa de cada archivo que cumple los patrones
+        """
+        self.found = 0
+        self.finished = False
+        # Pila de (carpeta, ruta relativa); la carpeta de entrada se lee aunque esté excluida
+        pending = [(self.folder, "")]
+        while pending:
+            folder, relative = pending.pop()
+            try:
+                files, subfolders = self._list(folder, relative)
+            except OSError:
+                if not relative:
+                    raise
+                self.skipped_folders.append(folder)
+                continue
+
+            for path in files:
+                self.found += 1
+                yield path
+            if self.options.recursive:
+                # Al revés en la pila para recorrer las subcarpetas en orden alfabético
+                pending.extend(reversed(subfolders))
+        self.finished = True
+
+    def _list(self, folder: str, relative: str) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """Archivos que cumplen los patrones y subcarpetas a recorrer de una carpeta"""
+        files = []
+        subfolders = []
+        with os.scandir(folder) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                entry_relative = f"{relative}/{entry.name}" if relative else entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if self.exclude and _matches(entry.name, entry_relative, self.exclude):
+                    continue
+                if is_dir:
+                    if self.options.recursive and \
+                            os.path.normcase(os.path.abspath(entry.path)) not in self.skip_folders:
+                        subfolders.append((entry.path, entry_relative))
+                elif _matches(entry.name, entry_relative, self.include):
+                    files.append(entry.path)
+        return files, subfolders
+
+
+def parse_patterns(text: str) -> Tuple[str, ...]:
+    """
+    Patrones escritos por el usuario, separados por ";" o ","
+
+    Args:
+        text: Texto con los patrones
+
+    Returns:
+        Patrones sin espacios alrededor ni vacíos
+    """
+    return tuple(pattern.strip() for pattern in text.replace(",", ";").split(";") if pattern.strip())
@@ -0,0 +1,230 @@
+"""
+Operaciones en lote del explorador (mover, enviar a la papelera, eliminar) en un hilo aparte
+"""
+import os
+import shutil
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+from PySide6.QtCore import QThread, Signal
+from send2trash import send2trash
+
+from .move_engine import MoveCancelled, move_item, same_device, tree_size
+
+OPERATION_MOVE = "move"
+OPERATION_TRASH = "trash"
+OPERATION_DELETE = "delete"
+OPERATIONS = (OPERATION_MOVE, OPERATION_TRASH, OPERATION_DELETE)
+
+
+@dataclass
+class FileOperationResult:
+    """Resultado de una operación en lote"""
+    operation: str
+    total: int
+    done: List[str] = field(default_factory=list)
+    # (ruta, motivo) de cada elemento que no se pudo procesar
+    failed: List[Tuple[str, str]] = field(default_factory=list)
+    cancelled: bool = False
+
+
+@dataclass
+class TransferProgress:
+    """Progreso de los bytes copiados al mover entre unidades"""
+    bytes_done: int
+    bytes_total: int
+    bytes_per_second: float = 0.0
+    # Segundos restantes estimados (None hasta tener una velocidad fiable)
+    eta_seconds: Optional[float] = None
+
+
+def top_level_paths(paths: List[str]) -> List[str]:
+    """
+    Quita las rutas que están dentro de otra ruta de la lista
+
+    Al mover o eliminar una carpeta ya se lleva su contenido: si también se
+    seleccionaron elementos de dentro, fallarían por no existir.
+
+    Args:
+        paths: Rutas seleccionadas
+
+    Returns:
+        Rutas sin repetir y sin las contenidas en otras, en el orden original
+    """
+    normalized = [os.path.normpath(os.path.abspath(path)) for path in paths]
+    selected = set(normalized)
+    result = []
+    for path in dict.fromkeys(normalized):
+        parent = os.path.dirname(path)
+        while parent != os.path.dirname(parent) and parent not in selected:
+            parent = os.path.dirname(parent)
+        if parent not in selected:
+            result.append(path)
+    return result
+
+
+def move_destination(path: str, target_dir: str) -> str:
+    """Ruta que tendrá un elemento al moverlo a una carpeta"""
+    return os.path.join(target_dir, os.path.basename(path))
+
+
+class FileOperationThread(QThread):
+    """
+    Hilo que mueve, envía a la papelera o elimina varios elementos sin bloquear la ventana
+
+    Mover y eliminar se cancelan entre un elemento y el siguiente. La papelera
+    se usa con una sola llamada a send2trash para todos los elementos (mucho
+    más rápido que uno a uno), así que solo puede cancelarse antes de empezar.
+    Al mover a otra unidad se copia por bloques (ver move_engine): cancelar
+    durante la copia elimina la copia parcial y deja el original intacto.
+
+    Signals:
+        progress: Elementos procesados y total
+        transfer_progress: Bytes copiados entre unidades (TransferProgress)
+        operation_finished: Resultado final (FileOperationResult)
+    """
+
+    progress = Signal(int, int)
+    transfer_progress = Signal(object)  # TransferProgress
+    operation_finished = Signal(object)  # FileOperationResult
+
+    # Intervalo mínimo (segundos) entre avisos de progreso
+    PROGRESS_INTERVAL = 0.1
+
+    def __init__(self, operation: str, paths: List[str], target_dir: Optional[str] = None):
+        """
+        Args:
+            operation: 'move', 'trash' o 'delete'
+            paths: Elementos a procesar
+            target_dir: Carpeta de destino (solo al mover)
+        """
+        super().__init__()
+        if operation not in OPERATIONS:
+            raise ValueError(f"Operación desconocida: {operation}")
+        if operation == OPERATION_MOVE and not target_dir:
+            raise ValueError("Mover requiere una carpeta de destino")
+        self.operation = operation
+        self.paths = top_level_paths(paths)
+        self.target_dir = target_dir
+        self._is_cancelled = False
+        self._last_progress_time = 0.0
+        self._last_transfer_time = 0.0
+        self._bytes_done = 0
+        self._bytes_total = 0
+        self._copy_started: Optional[float] = None
+
+    def cancel(self):
+        """Cancelar la operación (termina tras el elemento en curso)"""
+        self._is_cancelled = True
+
+    def run(self):
+        """Ejecutar la operación en el hilo separado"""
+        result = FileOperationResult(operation=self.operation, total=len(self.paths))
+        try:
+            if self.operation == OPERATION_TRASH:
+                self._trash(result)
+            else:
+                self._run_each(result)
+        except Exception as e:
+            # Lo que no llegó a procesarse queda como fallido
+            handled = set(result.done) | {path for path, _ in result.failed}
+            result.failed += [(path, str(e)) for path in self.paths if path not in handled]
+
+        result.cancelled = self._is_cancelled
+        self.progress.emit(len(result.done) + len(result.failed), result.total)
+        self.operation_finished.emit(result)
+
+    def _report_progress(self, done: int, total: int):
+        """Avisar del progreso sin saturar la interfaz"""
+        now = time.monotonic()
+        if now - self._last_progress_time >= self.PROGRESS_INTERVAL:
+            self._last_progress_time = now
+            self.progress.emit(done, total)
+
+    def _add_copied_bytes(self, count: int):
+        """Sumar bytes copiados y avisar del progreso, la velocidad y el tiempo restante"""
+        now = time.monotonic()
+        if self._copy_started is None:
+            self._copy_started = now
+        self._bytes_done += count
+        if now - self._last_transfer_time >= self.PROGRESS_INTERVAL:
+            self._last_transfer_time = now
+            self.transfer_progress.emit(self._transfer_status(now))
+
+    def _transfer_status(self, now: float) -> TransferProgress:
+        """Estado actual de la copia entre unidades"""
+        status = TransferProgress(self._bytes_done, max(self._bytes_total, self._bytes_done))
+        elapsed = now - self._copy_started if self._copy_started is not None else 0.0
+        if elapsed > 0 and self._bytes_done:
+            status.bytes_per_second = self._bytes_done / elapsed
+            status.eta_seconds = (status.bytes_total - self._bytes_done) / status.bytes_per_second
+        return status
+
+    def _measure_cross_device_bytes(self):
+        """Calcular los bytes que habrá que copiar porque van a otra unidad"""
+        for path in self.paths:
+            if self._is_cancelled:
+                return
+            if same_device(path, self.target_dir):
+                continue
+            try:
+                self._bytes_total += tree_size(path)
+            except OSError:
+                pass
+        if self._bytes_total:
+            self.transfer_progress.emit(TransferProgress(0, self._bytes_total))
+
+    def _trash(self, result: FileOperationResult):
+        """Enviar todos los elementos a la papelera con una sola llamada"""
+        if self._is_cancelled or not self.paths:
+            return
+        try:
+            send2trash(self.paths)
+            result.done = list(self.paths)
+        except Exception as e:
+            # Parte de los elementos puede haber llegado a la papelera antes del error
+            for path in self.paths:
+                if os.path.lexists(path):
+                    result.failed.append((path, str(e)))
+                else:
+                    result.done.append(path)
+
+    def _run_each(self, result: FileOperationResult):
+        """Mover o eliminar los elementos uno a uno, atendiendo a la cancelación"""
+        if self.operation == OPERATION_MOVE:
+            self._measure_cross_device_bytes()
+
+        for index, path in enumerate(self.paths):
+            if self._is_cancelled:
+                return
+            try:
+                if self.operation == OPERATION_MOVE:
+                    self._move(path)
+                else:
+                    self._delete(path)
+                result.done.append(path)
+            except MoveCancelled:
+                return
+            except OSError as e:
+                result.failed.append((path, e.strerror or str(e)))
+            except Exception as e:
+                result.failed.append((path, str(e)))
+            self._report_progress(index + 1, result.total)
+
+    def _move(self, path: str):
+        """Mover un elemento a la carpeta de destino sin sobrescribir nada"""
+        destination = move_destination(path, self.target_dir)
+        if os.path.normcase(os.path.abspath(destination)) == os.path.normcase(path):
+            raise ValueError("Ya está en la carpeta de destino")
+        target = os.path.normcase(os.path.abspath(self.target_dir))
+        if os.path.isdir(path) and (target + os.sep).startswith(os.path.normcase(path) + os.sep):
+            raise ValueError("No se puede mover una carpeta dentro de sí misma")
+        move_item(path, destination, progress=self._add_copied_bytes, is_cancelled=lambda: self._is_cancelled)
+
+    @staticmethod
+    def _delete(path: str):
+        """Eliminar un elemento de forma permanente"""
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
@@ -0,0 +1,155 @@
+"""
+Listado de carpetas con os.scandir compartido por validación, vista previa y procesamiento
+"""
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+# Segundos de precisión de la fecha de modificación en los sistemas más toscos (FAT, algunos SMB).
+# Una carpeta listada antes de que pase este margen desde su último cambio se vuelve a listar,
+# porque otro cambio dentro del mismo margen no movería su fecha.
+MTIME_GRANULARITY = 2.0
+
+
+@dataclass(frozen=True)
+class ScanEntry:
+    """Elemento de una carpeta tal como lo devolvió os.scandir"""
+    name: str
+    path: str
+    is_dir: bool
+    size: int
+    mtime_ns: int
+
+    @property
+    def is_pdf(self) -> bool:
+        return not self.is_dir and self.name.lower().endswith('.pdf')
+
+
+@dataclass
+class FolderSnapshot:
+    """Contenido de una carpeta (sin subcarpetas) en el momento de listarla"""
+    path: str
+    size: int
+    mtime_ns: int
+    device: int
+    entries: List[ScanEntry]
+    scanned_at: float
+
+    @property
+    def dirs(self) -> List[ScanEntry]:
+        return [entry for entry in self.entries if entry.is_dir]
+
+    @property
+    def pdf_files(self) -> List[ScanEntry]:
+        return [entry for entry in self.entries if entry.is_pdf]
+
+
+@dataclass
+class ProcessedFolder:
+    """Subcarpeta de documentos ya procesados de un tipo reconocido"""
+    snapshot: FolderSnapshot
+    doc_type: str
+
+    @property
+    def path(self) -> str:
+        return self.snapshot.path
+
+    @property
+    def pdf_files(self) -> List[ScanEntry]:
+        return self.snapshot.pdf_files
+
+
+class FolderScanCache:
+    """
+    Listados de carpetas reutilizables mientras la carpeta no cambie de fecha
+
+    Comprobar un listado guardado cuesta un solo stat de la carpeta en lugar
+    de listarla y consultar cada elemento, lo que en unidades de red con
+    miles de PDFs evita la mayor parte de las consultas. La fecha de una
+    carpeta cambia al añadir, quitar o renombrar elementos, no al modificar
+    un archivo: tamaños y fechas de archivos ya listados pueden ir con
+    retraso, así que quien necesite el valor exacto (p. ej. para validar un
+    plan) debe consultarlo. Se puede usar desde varios hilos.
+    """
+
+    def __init__(self):
+        self._snapshots: Dict[str, FolderSnapshot] = {}
+        self._lock = threading.Lock()
+
+    def scan(self, path: str) -> FolderSnapshot:
+        """
+        Lista una carpeta o devuelve el listado guardado si sigue vigente
+
+        Args:
+            path: Carpeta a listar
+
+        Returns:
+            Listado de la carpeta
+        """
+        key = os.path.normcase(os.path.abspath(path))
+        stat_result = os.stat(path)
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+        if snapshot is not None and snapshot.mtime_ns == stat_result.st_mtime_ns and \
+                snapshot.scanned_at - stat_result.st_mtime_ns / 1e9 > MTIME_GRANULARITY:
+            return snapshot
+
+        snapshot = FolderSnapshot(
+            path=path, size=stat_result.st_size, mtime_ns=stat_result.st_mtime_ns, device=stat_result.st_dev,
+            entries=_scan_entries(path), scanned_at=time.time()
+        )
+        with self._lock:
+            self._snapshots[key] = snapshot
+        return snapshot
+
+    def invalidate(self, path: Optional[str] = None):
+        """Olvidar el listado de una carpeta (o todos)"""
+        with self._lock:
+            if path is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(os.path.normcase(os.path.abspath(path)), None)
+
+    def processed_folders(self, source_folder: str,
+                          detect_document_type: Callable[[str], Optional[str]]) -> List[ProcessedFolder]:
+        """
+        Subcarpetas de documentos procesados de una carpeta, con sus PDFs
+
+        Args:
+            source_folder: Carpeta padre que contiene subcarpetas procesadas
+            detect_document_type: Tipo de documento según el nombre de la subcarpeta (None si no es reconocida)
+
+        Returns:
+            Subcarpetas de tipo reconocido, en el orden del listado
+        """
+        folders = []
+        for entry in self.scan(source_folder).dirs:
+            doc_type = detect_document_type(entry.name)
+            if doc_type:
+                folders.append(ProcessedFolder(self.scan(entry.path), doc_type))
+        return folders
+
+
+def _scan_entries(path: str) -> List[ScanEntry]:
+    """Leer los elementos de una carpeta con os.scandir"""
+    entries = []
+    with os.scandir(path) as iterator:
+        for entry in iterator:
+            try:
+                is_dir = entry.is_dir()
+                # En Windows los datos vienen del propio listado; en otros sistemas solo se consultan archivos
+                stat_result = entry.stat() if not is_dir or os.name == 'nt' else None
+            except OSError:
+                continue
+            entries.append(ScanEntry(
+                name=entry.name, path=entry.path, is_dir=is_dir,
+                size=stat_result.st_size if stat_result and not is_dir else 0,
+                mtime_ns=stat_result.st_mtime_ns if stat_result else 0,
+            ))
+    return entries
+
+
+# Caché compartida por el diálogo, la vista previa y los hilos de procesamiento
+folder_scans = FolderScanCache()
@@ -0,0 +1,180 @@
+"""
+Tamaño de carpetas calculado en segundo plano, con caché por ruta y fecha de modificación
+"""
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+from PySide6.QtCore import QThread, Signal
+
+
+def mtime_ms(stat_result: os.stat_result) -> int:
+    """Fecha de modificación en milisegundos (la precisión con que la da QFileSystemModel)"""
+    return stat_result.st_mtime_ns // 1_000_000
+
+
+class FolderSizeCache:
+    """
+    Tamaños de carpetas ya calculados, válidos mientras la carpeta no cambie de fecha
+
+    La fecha de una carpeta solo cambia cuando se añade, quita o renombra algo
+    directamente dentro de ella; el escáner la comprueba con os.stat para no
+    volver a recorrer las subcarpetas que no cambiaron. La interfaz consulta
+    solo por ruta y se apoya en invalidate(), que descarta la carpeta y todas
+    las que la contienen.
+    Se usa desde el hilo de la interfaz y desde el del escáner.
+    """
+
+    def __init__(self):
+        self._sizes: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str, modified_ms: Optional[int] = None) -> Optional[int]:
+        """
+        Args:
+            path: Carpeta
+            modified_ms: Fecha de modificación actual en milisegundos (None = no comprobarla)
+
+        Returns:
+            Tamaño en bytes, o None si no se ha calculado o la carpeta cambió
+        """
+        with self._lock:
+            cached = self._sizes.get(os.path.normpath(path))
+        if cached is None or (modified_ms is not None and cached[0] != modified_ms):
+            return None
+        return cached[1]
+
+    def put(self, path: str, modified_ms: int, size: int):
+        """Guardar el tamaño de una carpeta con su fecha de modificación"""
+        with self._lock:
+            self._sizes[os.path.normpath(path)] = (modified_ms, size)
+
+    def invalidate(self, path: str) -> List[str]:
+        """
+        Descarta una carpeta y todas las que la contienen (su tamaño también cambió)
+
+        Returns:
+            Carpetas descartadas
+        """
+        path = os.path.normpath(path)
+        removed = []
+        with self._lock:
+            while True:
+                if self._sizes.pop(path, None) is not None:
+                    removed.append(path)
+                parent = os.path.dirname(path)
+                if parent == path:
+                    break
+                path = parent
+        return removed
+
+    def invalidate_tree(self, path: str):
+        """Descartar una carpeta, todo lo que contiene y las carpetas que la contienen"""
+        prefix = os.path.join(os.path.normpath(path), "")
+        with self._lock:
+            for cached in [cached for cached in self._sizes if cached.startswith(prefix)]:
+                del self._sizes[cached]
+        self.invalidate(path)
+
+
+class FolderSizeScanner(QThread):
+    """
+    Hilo que calcula el tamaño de las carpetas pedidas recorriéndolas con os.scandir
+
+    Cada subcarpeta recorrida se guarda también en la caché, así que al entrar
+    en ella su tamaño ya está disponible. Las subcarpetas que siguen en caché
+    no se vuelven a recorrer. Las peticiones se atienden empezando por la más
+    reciente (la que el usuario está viendo).
+
+    Signals:
+        size_ready: Ruta de una carpeta pedida cuyo tamaño ya está en la caché
+    """
+
+    size_ready = Signal(str)
+
+    def __init__(self, cache: FolderSizeCache, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self._pending: List[str] = []
+        self._condition = threading.Condition()
+        self._generation = 0
+        self._is_stopped = False
+
+    def request(self, path: str):
+        """Pedir el tamaño de una carpeta (las peticiones repetidas se ignoran)"""
+        with self._condition:
+            if path in self._pending:
+                return
+            self._pending.append(path)
+            self._condition.notify()
+
+    def clear(self):
+        """Olvidar las peticiones pendientes y abandonar la carpeta en curso"""
+        with self._condition:
+            self._pending.clear()
+            self._generation += 1
+
+    def stop(self):
+        """Terminar el hilo (hay que esperarlo con wait())"""
+        with self._condition:
+            self._is_stopped = True
+            self._generation += 1
+            self._condition.notify()
+
+    def run(self):
+        """Atender peticiones hasta que se llame a stop()"""
+        while True:
+            with self._condition:
+                while not self._pending and not self._is_stopped:
+                    self._condition.wait()
+                if self._is_stopped:
+                    return
+                path = self._pending.pop()
+                generation = self._generation
+
+            try:
+                if self._scan(path, generation) is not None:
+                    self.size_ready.emit(path)
+            except OSError:
+                # Carpeta borrada o sin permiso: se queda sin tamaño
+                pass
+
+    def _scan(self, path: str, generation: int, stat_result: Optional[os.stat_result] = None) -> Optional[int]:
+        """
+        Tamaño de una carpeta, usando la caché para las subcarpetas que no cambiaron
+
+        Returns:
+            Tamaño en bytes, o None si se abandonó por clear() o stop()
+        """
+        if generation != self._generation:
+            return None
+        if stat_result is None:
+            stat_result = os.stat(path)
+        modified = mtime_ms(stat_result)
+        cached = self.cache.get(path, modified)
+        if cached is not None:
+            return cached
+
+        total = 0
+        subfolders = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subfolders.append((entry.path, entry.stat(follow_symlinks=False)))
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            # Sin permiso o borrada mientras tanto: cuenta como vacía y no bloquea a las que la contienen
+            pass
+
+        for subfolder, subfolder_stat in subfolders:
+            size = self._scan(subfolder, generation, subfolder_stat)
+            if size is None:
+                return None
+            total += size
+
+        self.cache.put(path, modified, total)
+        return total
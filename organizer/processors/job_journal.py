@@ -0,0 +1,284 @@
+"""
+Diario de trabajos: registro de solo-anexado para reanudar procesamientos interrumpidos
+"""
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+
+from .pdf_processor import ProcessResult
+
+JOURNAL_VERSION = 1
+
+# Entradas escritas antes de forzar el volcado a disco (os.fsync)
+FSYNC_EVERY = 50
+
+
+class JobJournal:
+    """
+    Registro de las unidades completadas de un trabajo (página, archivo o documento de un trabajador)
+
+    Cada unidad escribe una línea "start" con su ruta de salida antes de escribirla
+    y una línea "done" con el resultado al terminar. Si el programa se cierra a
+    mitad, al reanudar:
+        - las unidades terminadas cuya salida sigue existiendo se saltan y su
+          resultado se repite desde el diario
+        - las salidas a medio escribir (start sin done) se borran, para que el
+          control de duplicados no genere copias _001 de más
+        - salvo si su original ya no existe: entonces la salida es la única
+          copia. Si la unidad movía el original (transfer='move'), se devuelve
+          a su sitio para rehacerla; si no, se conserva tal cual
+
+    Cada salida borrada, devuelta o conservada queda en discarded como un
+    ProcessResult con interrupted=True, para mostrarla junto a los resultados.
+    El archivo se guarda en la carpeta de salida, uno por modo y origen.
+
+    Attributes:
+        discarded: Salidas del intento interrumpido y qué se hizo con cada una
+    """
+
+    def __init__(self, path: str, mode: str, source_path: str):
+        """
+        Args:
+            path: Ruta del archivo del diario
+            mode: Modo de procesamiento ('separate', 'rename' u 'organize')
+            source_path: Archivo o carpeta de entrada del trabajo
+        """
+        self.path = path
+        self.mode = mode
+        self.source_path = os.path.abspath(source_path)
+        self._done: Dict[str, dict] = {}
+        self._file = None
+        self._unsynced = 0
+        self.discarded: List[ProcessResult] = []
+
+        started = self._load()
+        self._discard_interrupted(started)
+
+        self._file = open(self.path, 'a', encoding='utf-8')
+        if self._file.tell() == 0:
+            self._append({'type': 'job', 'version': JOURNAL_VERSION,
+                          'mode': self.mode, 'source': self.source_path})
+
+    @staticmethod
+    def source_stat(path: str) -> Optional[Tuple[int, int]]:
+        """
+        Huella de un archivo de entrada para detectar si cambió entre ejecuciones
+
+        Returns:
+            (tamaño, mtime_ns) o None si no se pudo leer
+        """
+        try:
+            stat = os.stat(path)
+            return stat.st_size, stat.st_mtime_ns
+        except OSError:
+            return None
+
+    @classmethod
+    def for_job(cls, output_folder: str, mode: str, source_path: str) -> 'JobJournal':
+        """
+        Abre (o crea) el diario de un trabajo
+
+        Args:
+            output_folder: Carpeta de salida del trabajo
+            mode: Modo de procesamiento
+            source_path: Archivo o carpeta de entrada
+
+        Returns:
+            Diario listo para usar (cerrar con close())
+        """
+        os.makedirs(output_folder, exist_ok=True)
+        source_id = hashlib.sha1(os.path.abspath(source_path).encode('utf-8')).hexdigest()[:12]
+        path = os.path.join(output_folder, f".organizador_diario_{mode}_{source_id}.jsonl")
+        return cls(path, mode, source_path)
+
+    def _load(self) -> Dict[str, dict]:
+        """
+        Leer el diario existente
+
+        Returns:
+            Unidades empezadas y no terminadas: {unidad: entrada "start"}
+        """
+        started: Dict[str, dict] = {}
+        if not os.path.exists(self.path):
+            return started
+
+        with open(self.path, 'r', encoding='utf-8') as file:
+            lines = file.readlines()
+
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Última línea cortada por un cierre inesperado
+                continue
+
+            kind = entry.get('type')
+            if kind == 'job':
+                if entry.get('mode') != self.mode or entry.get('source') != self.source_path:
+                    # Diario de otro trabajo: empezar de nuevo
+                    self._done.clear()
+                    started.clear()
+            elif kind == 'start':
+                started[entry['unit']] = entry
+            elif kind == 'done':
+                started.pop(entry['unit'], None)
+                self._done[entry['unit']] = entry
+
+        # Reescribir compacto: solo la cabecera y las unidades terminadas
+        self._rewrite()
+        return started
+
+    def _rewrite(self):
+        """Reemplazar el diario por una versión compacta (escritura atómica)"""
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            header = {'type': 'job', 'version': JOURNAL_VERSION, 'mode': self.mode, 'source': self.source_path}
+            file.write(json.dumps(header, ensure_ascii=False) + '\n')
+            for entry in self._done.values():
+                file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.path)
+
+    def _discard_interrupted(self, started: Dict[str, dict]):
+        """Borrar las salidas que quedaron a medio escribir (o devolver los originales movidos)"""
+        claimed = {entry.get('output') for entry in self._done.values()}
+        for entry in started.values():
+            output_path = entry.get('output')
+            if not output_path or output_path in claimed or not os.path.exists(output_path):
+                continue
+
+            input_path = entry.get('input')
+            if input_path and not os.path.exists(input_path):
+                # El original ya no está: la salida es su única copia
+                if entry.get('move'):
+                    try:
+                        os.replace(output_path, input_path)
+                        action = f"Original devuelto a {input_path} para volver a moverlo"
+                    except OSError as e:
+                        action = f"No se pudo devolver el original a {input_path}: {e}"
+                else:
+                    action = "Salida conservada: el original ya no existe"
+            else:
+                try:
+                    os.remove(output_path)
+                    action = "Salida a medio escribir borrada para rehacerla"
+                except OSError as e:
+                    action = f"No se pudo borrar la salida a medio escribir: {e}"
+
+            self.discarded.append(ProcessResult(
+                original_file=os.path.basename(input_path or self.source_path),
+                success=False,
+                new_name=os.path.basename(output_path),
+                error=f"{action} ({output_path})",
+                interrupted=True
+            ))
+
+    def _append(self, entry: dict):
+        """Agregar una línea al diario y volcarla al sistema operativo"""
+        self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._file.flush()
+        self._unsynced += 1
+        if self._unsynced >= FSYNC_EVERY:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def completed(self, unit: str, source: Optional[Tuple[int, int]] = None) -> Optional[ProcessResult]:
+        """
+        Comprueba si una unidad ya se completó en una ejecución anterior
+
+        Args:
+            unit: Identificador de la unidad (p. ej. "page:17" o "file:doc.pdf")
+            source: Huella actual de la entrada (ver source_stat); si cambió, se rehace
+
+        Returns:
+            Resultado guardado (sin tiempos ni bytes) o None si hay que procesarla
+        """
+        entry = self._done.get(unit)
+        if entry is None:
+            return None
+        if source is not None and tuple(entry.get('source') or ()) != tuple(source):
+            return None
+        if not os.path.exists(entry['output']):
+            return None
+
+        data = dict(entry['result'])
+        # Repetir el resultado no cuesta tiempo ni lectura/escritura
+        data.update(timings={}, bytes_read=0, bytes_written=0)
+        return ProcessResult(**data)
+
+    def start(self, unit: str, output_path: str, input_path: Optional[str] = None,
+              moves_input: bool = False):
+        """
+        Anotar que una unidad empieza a escribir su salida
+
+        Args:
+            unit: Identificador de la unidad
+            output_path: Ruta de la salida que se va a escribir
+            input_path: Archivo de entrada que se lleva a la salida (renombrar y organizar)
+            moves_input: La operación quita el original (transfer='move')
+        """
+        entry = {'type': 'start', 'unit': unit, 'output': os.path.abspath(output_path)}
+        if input_path is not None:
+            entry['input'] = os.path.abspath(input_path)
+            if moves_input:
+                entry['move'] = True
+        self._append(entry)
+
+    def finish(self, unit: str, result: ProcessResult, output_path: str,
+               source: Optional[Tuple[int, int]] = None):
+        """
+        Anotar una unidad terminada
+
+        Args:
+            unit: Identificador de la unidad
+            result: Resultado obtenido
+            output_path: Ruta de la salida escrita
+            source: Huella de la entrada al procesarla
+        """
+        entry = {
+            'type': 'done',
+            'unit': unit,
+            'output': os.path.abspath(output_path),
+            'source': list(source) if source else None,
+            'result': asdict(result),
+        }
+        self._done[unit] = entry
+        self._append(entry)
+
+    def close(self):
+        """Volcar a disco y cerrar el diario"""
+        if self._file is None:
+            return
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'JobJournal':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def open_job_journal(output_folder: str, mode: str, source_path: str) -> Optional[JobJournal]:
+    """
+    Abre el diario de un trabajo sin interrumpir el procesamiento si falla
+
+    Args:
+        output_folder: Carpeta de salida del trabajo
+        mode: Modo de procesamiento ('separate', 'rename' u 'organize')
+        source_path: Archivo o carpeta de entrada
+
+    Returns:
+        Diario abierto o None si no se pudo abrir (p. ej. carpeta sin permisos)
+    """
+    try:
+        return JobJournal.for_job(output_folder, mode, source_path)
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,441 @@
+"""
+Plan de trabajo: qué se va a escribir y dónde, calculado una vez y reutilizado al procesar
+"""
+import json
+import os
+import shutil
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Deque, Dict, Iterator, List, Optional
+
+from .output_names import OutputNameIndex
+from .pdf_processor import PDFProcessor, ProcessResult
+from .rename_engine import ConcurrentRenamer, file_unit
+from .transfer import DEFAULT_TRANSFER, METADATA_ONLY
+from ..utils.cache import hash_file
+
+PLAN_VERSION = 1
+
+PLAN_MODES = ("separate", "rename", "organize")
+
+
+def sample_pages(total_pages: int, samples: int) -> List[int]:
+    """
+    Elige páginas repartidas uniformemente, incluyendo la primera y la última
+
+    Args:
+        total_pages: Número de páginas del documento
+        samples: Número máximo de páginas a elegir
+
+    Returns:
+        Números de página (0-indexed) ordenados y sin repetir
+    """
+    if total_pages <= samples:
+        return list(range(total_pages))
+    if samples <= 1:
+        return [0]
+    step = (total_pages - 1) / (samples - 1)
+    return sorted({round(i * step) for i in range(samples)})
+
+
+def _path_key(path: str) -> str:
+    """Clave de una ruta para compararla entre ejecuciones"""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _existing_folder(path: str) -> str:
+    """Carpeta existente más cercana (la de salida puede no haberse creado aún)"""
+    path = os.path.abspath(path)
+    while not os.path.isdir(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+@dataclass
+class PlannedUnit:
+    """Una unidad del plan: página, archivo o documento de un trabajador"""
+    # Mismo identificador que en el diario del trabajo (page:N, file:nombre, doc:trabajador/tipo)
+    unit: str
+    source: str
+    worker_name: Optional[str] = None
+    # Ruta de salida relativa a la carpeta de salida (None si la unidad no se escribe)
+    target: Optional[str] = None
+    page: Optional[int] = None
+    doc_type: Optional[str] = None
+    estimated_bytes: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class JobPlan:
+    """
+    Resultado de la fase de planificación, serializable a JSON
+
+    Guarda el nombre detectado de cada unidad y su destino, para que el
+    procesamiento solo tenga que escribir sin volver a extraer texto. El plan
+    deja de valer si cambia el modo, la entrada, la salida, los patrones de
+    nombres o alguno de los archivos de entrada (tamaño y mtime; si solo cambió
+    el mtime se compara el hash del contenido, cuando se conoce).
+    """
+    mode: str
+    source_path: str
+    output_folder: str
+    patterns_version: str
+    transfer: str = DEFAULT_TRANSFER
+    units: List[PlannedUnit] = field(default_factory=list)
+    # Huella de cada archivo de entrada: ruta → [tamaño, mtime_ns, hash o None]
+    inputs: Dict[str, list] = field(default_factory=dict)
+    page_count: int = 0
+    complete: bool = False
+    created_at: float = 0.0
+    version: int = PLAN_VERSION
+    # Unidades por ruta de entrada (se calcula la primera vez que se consulta, no se guarda)
+    _analyses: Dict[str, PlannedUnit] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @classmethod
+    def create(cls, mode: str, source_path: str, output_folder: str, processor: PDFProcessor) -> 'JobPlan':
+        """
+        Plan vacío para un trabajo, listo para que JobPlanner lo complete
+
+        Args:
+            mode: 'separate', 'rename' u 'organize'
+            source_path: Archivo o carpeta de entrada
+            output_folder: Carpeta de salida
+            processor: Procesador con los patrones y la estrategia de transferencia a usar
+        """
+        if mode not in PLAN_MODES:
+            raise ValueError(f"Tipo de procesamiento no válido: {mode}")
+        return cls(
+            mode=mode,
+            source_path=os.path.abspath(source_path),
+            output_folder=os.path.abspath(output_folder),
+            patterns_version=processor.name_version,
+            transfer=processor.transfer,
+            created_at=time.time()
+        )
+
+    def add_input(self, path: str, file_hash: Optional[str] = None,
+                  size: Optional[int] = None, mtime_ns: Optional[int] = None):
+        """Anotar la huella de un archivo de entrada (con tamaño y fecha ya conocidos no se consulta)"""
+        if size is None or mtime_ns is None:
+            stat = os.stat(path)
+            size, mtime_ns = stat.st_size, stat.st_mtime_ns
+        self.inputs[os.path.abspath(path)] = [size, mtime_ns, file_hash]
+
+    @property
+    def estimated_bytes(self) -> int:
+        """Bytes que se escribirán en la carpeta de salida (estimación)"""
+        return sum(unit.estimated_bytes for unit in self.units)
+
+    def free_bytes(self) -> int:
+        """Espacio libre actual en la unidad de la carpeta de salida"""
+        return shutil.disk_usage(_existing_folder(self.output_folder)).free
+
+    def has_free_space(self) -> bool:
+        """Comprobar que lo estimado cabe en la unidad de salida"""
+        try:
+            return self.estimated_bytes <= self.free_bytes()
+        except OSError:
+            # Sin poder consultar la unidad no se bloquea el procesamiento
+            return True
+
+    def matches(self, mode: str, source_path: str, output_folder: str) -> bool:
+        """Comprobar que el plan es del mismo trabajo (sin tocar los archivos de entrada)"""
+        return (self.mode == mode and
+                _path_key(self.source_path) == _path_key(source_path) and
+                _path_key(self.output_folder) == _path_key(output_folder))
+
+    def invalid_reason(self, mode: str, source_path: str, output_folder: str,
+                       patterns_version: str) -> Optional[str]:
+        """
+        Motivo por el que el plan no sirve para un trabajo
+
+        Args:
+            mode: Modo de procesamiento
+            source_path: Archivo o carpeta de entrada
+            output_folder: Carpeta de salida
+            patterns_version: Versión de los patrones de nombres en uso
+
+        Returns:
+            Descripción del motivo, o None si el plan puede ejecutarse tal cual
+        """
+        if self.version != PLAN_VERSION:
+            return "plan de otra versión"
+        if not self.complete:
+            return "plan incompleto"
+        if not self.matches(mode, source_path, output_folder):
+            return "plan de otro trabajo"
+        if self.patterns_version != patterns_version:
+            return "cambiaron los patrones de nombres"
+
+        for path, (size, mtime_ns, file_hash) in self.inputs.items():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return f"falta {os.path.basename(path)}"
+            if stat.st_size != size:
+                return f"cambió {os.path.basename(path)}"
+            if stat.st_mtime_ns != mtime_ns and (file_hash is None or hash_file(path) != file_hash):
+                return f"cambió {os.path.basename(path)}"
+        return None
+
+    def page_names(self) -> List[Optional[str]]:
+        """Trabajador de cada página, en orden (modo separate)"""
+        names: List[Optional[str]] = [None] * self.page_count
+        for unit in self.units:
+            if unit.page is not None and unit.page < self.page_count:
+                names[unit.page] = unit.worker_name
+        return names
+
+    def analysis(self, input_path: str) -> Optional[ProcessResult]:
+        """
+        Resultado del análisis de un archivo, como lo daría PDFProcessor.analyze_single_pdf (modo rename)
+
+        Returns:
+            Resultado planificado o None si el archivo no está en el plan
+        """
+        if not self._analyses:
+            self._analyses = {_path_key(unit.source): unit for unit in self.units}
+        unit = self._analyses.get(_path_key(input_path))
+        if unit is None:
+            return None
+        return ProcessResult(
+            original_file=os.path.basename(input_path),
+            success=unit.worker_name is not None,
+            worker_name=unit.worker_name,
+            error=unit.error
+        )
+
+    def worker_documents(self) -> Dict[str, Dict[str, str]]:
+        """Documentos de cada trabajador: {trabajador: {tipo: ruta}} (modo organize)"""
+        worker_docs: Dict[str, Dict[str, str]] = {}
+        for unit in self.units:
+            if unit.worker_name and unit.doc_type:
+                worker_docs.setdefault(unit.worker_name, {})[unit.doc_type] = unit.source
+        return worker_docs
+
+    def to_dict(self) -> dict:
+        """Plan como diccionario serializable"""
+        data = asdict(self)
+        del data['_analyses']
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'JobPlan':
+        """Reconstruir un plan guardado con to_dict()"""
+        data = dict(data)
+        data['units'] = [PlannedUnit(**unit) for unit in data.get('units', [])]
+        return cls(**data)
+
+    def save(self, path: str):
+        """Guardar el plan como JSON (escritura atómica)"""
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'JobPlan':
+        """Leer un plan guardado con save()"""
+        with open(path, 'r', encoding='utf-8') as file:
+            return cls.from_dict(json.load(file))
+
+
+class JobPlanner:
+    """
+    Fase de planificación: detecta el nombre de cada unidad y calcula su destino sin escribir nada
+
+    Usa los mismos pasos que el procesamiento (caché, procesos en paralelo,
+    patrones), así que planificar cuesta lo mismo que la detección de nombres
+    del procesamiento, y ejecutar el plan después solo hace la escritura.
+    """
+
+    def __init__(self, processor: PDFProcessor,
+                 progress: Optional[Callable[[int, int], None]] = None):
+        """
+        Args:
+            processor: Procesador usado para detectar nombres
+            progress: Función llamada con (unidades planificadas, total) a medida que avanza
+        """
+        self.processor = processor
+        self.progress = progress
+
+    def plan(self, mode: str, source_path: str, output_folder: str) -> JobPlan:
+        """
+        Planificar un trabajo completo
+
+        Returns:
+            Plan completo
+        """
+        plan = JobPlan.create(mode, source_path, output_folder, self.processor)
+        for _ in self.iter_plan(plan):
+            pass
+        return plan
+
+    def iter_plan(self, plan: JobPlan, samples: int = 0) -> Iterator[PlannedUnit]:
+        """
+        Completa un plan entregando cada unidad en cuanto se planifica
+
+        Los destinos (con sus sufijos _001, _002...) se asignan al final, en
+        orden, y entonces el plan queda marcado como completo.
+
+        Args:
+            plan: Plan creado con JobPlan.create
+            samples: Al separar, páginas repartidas por el documento que se
+                     planifican antes que las demás (para mostrarlas enseguida)
+
+        Yields:
+            Cada unidad planificada
+        """
+        if plan.mode == "separate":
+            yield from self._iter_separate(plan, samples)
+        elif plan.mode == "rename":
+            yield from self._iter_rename(plan)
+        else:
+            yield from self._iter_organize(plan)
+        plan.complete = True
+
+    def _report(self, done: int, total: int):
+        if self.progress is not None:
+            self.progress(done, total)
+
+    def _copied_bytes(self, source_path: str, output_folder: str,
+                      size: Optional[int] = None, device: Optional[int] = None) -> int:
+        """Bytes que ocupará la copia de un archivo según la estrategia de transferencia"""
+        if size is None:
+            size = os.path.getsize(source_path)
+        if self.processor.transfer not in METADATA_ONLY:
+            return size
+        # Clonar, enlazar o mover no ocupa espacio nuevo si es la misma unidad
+        try:
+            if device is None:
+                device = os.stat(source_path).st_dev
+            same_device = device == os.stat(_existing_folder(output_folder)).st_dev
+        except OSError:
+            same_device = False
+        return 0 if same_device else size
+
+    def _iter_separate(self, plan: JobPlan, samples: int) -> Iterator[PlannedUnit]:
+        """Trabajador de cada página; las páginas de muestra primero"""
+        input_path = plan.source_path
+        processor = self.processor
+        with processor.open_document(input_path) as session:
+            total_pages = session.page_count
+            plan.page_count = total_pages
+            page_bytes = os.path.getsize(input_path) // max(1, total_pages)
+            units: Dict[int, PlannedUnit] = {}
+
+            def page_unit(page_num: int, worker_name: Optional[str]) -> PlannedUnit:
+                unit = PlannedUnit(
+                    unit=f"page:{page_num}", source=input_path, worker_name=worker_name,
+                    page=page_num, estimated_bytes=page_bytes,
+                    error=None if worker_name else "No se pudo extraer nombre del trabajador"
+                )
+                units[page_num] = unit
+                return unit
+
+            # Muestras sin clave de caché: calcularla obliga a leer el archivo entero
+            first_pages = sample_pages(total_pages, samples) if samples else []
+            for page_num in first_pages:
+                yield page_unit(page_num, processor.detect_page_worker_name(input_path, page_num, session))
+                self._report(len(units), total_pages)
+
+            if len(units) < total_pages:
+                # Las páginas de muestra no se vuelven a analizar
+                known = {page_num: unit.worker_name for page_num, unit in units.items()}
+                page_names = processor.iter_page_worker_names(input_path, session, total_pages, known=known)
+                try:
+                    for page_num, (worker_name, _timer) in enumerate(page_names):
+                        if page_num in units:
+                            continue
+                        yield page_unit(page_num, worker_name)
+                        self._report(len(units), total_pages)
+                finally:
+                    page_names.close()
+
+        plan.add_input(input_path, processor.cache_key(input_path))
+        plan.units = [units[page_num] for page_num in range(total_pages)]
+
+        names = OutputNameIndex(plan.output_folder, reserve=False)
+        for unit in plan.units:
+            if unit.worker_name:
+                path = names.claim(processor.clean_filename(unit.worker_name), ".pdf")
+            else:
+                path = names.claim(processor.unnamed_page_name(unit.page), ".pdf")
+            unit.target = os.path.basename(path)
+
+    def _iter_rename(self, plan: JobPlan) -> Iterator[PlannedUnit]:
+        """Trabajador de cada archivo, analizados en paralelo si hay varios procesos"""
+        processor = self.processor
+        renamer = ConcurrentRenamer(processor, processor.max_workers)
+
+        # Los archivos se analizan a medida que se encuentran (en el mismo orden)
+        discovery = processor.iter_input_files(plan.source_path, plan.output_folder)
+        discovered: Deque[str] = deque()
+
+        def iter_discovered() -> Iterator[str]:
+            for path in discovery:
+                discovered.append(path)
+                yield path
+
+        analyses = renamer.iter_analyze(iter_discovered())
+        try:
+            for done, result in enumerate(analyses, 1):
+                input_path = discovered.popleft()
+                unit = PlannedUnit(
+                    unit=file_unit(input_path, plan.source_path), source=input_path,
+                    worker_name=result.worker_name if result.success else None,
+                    error=None if result.success else result.error
+                )
+                if result.success:
+                    unit.estimated_bytes = self._copied_bytes(input_path, plan.output_folder)
+                plan.add_input(input_path, processor.cache_key(input_path))
+                plan.units.append(unit)
+                yield unit
+                self._report(done, discovery.found)
+        finally:
+            analyses.close()
+
+        names = OutputNameIndex(plan.output_folder, reserve=False)
+        for unit in plan.units:
+            if unit.worker_name:
+                extension = os.path.splitext(unit.source)[1]
+                path = names.claim(processor.clean_filename(unit.worker_name), extension)
+                unit.target = os.path.basename(path)
+
+    def _iter_organize(self, plan: JobPlan) -> Iterator[PlannedUnit]:
+        """Documentos de cada trabajador según el nombre de archivo (sin abrir los PDFs)"""
+        processor = self.processor
+        documents = []
+        for folder in processor.scan_processed_folders(plan.source_path):
+            # Un PDF nuevo o borrado en la subcarpeta cambia su mtime y anula el plan
+            snapshot = folder.snapshot
+            plan.add_input(snapshot.path, size=snapshot.size, mtime_ns=snapshot.mtime_ns)
+            for pdf_file in folder.pdf_files:
+                worker_name = processor.extract_worker_name_from_filename(pdf_file.name)
+                documents.append((pdf_file, folder.doc_type, worker_name, snapshot.device))
+
+        # Como al organizar, si un trabajador repite tipo de documento gana el último
+        latest: Dict[tuple, str] = {}
+        for pdf_file, doc_type, worker_name, _ in documents:
+            if worker_name:
+                latest[(worker_name, doc_type)] = pdf_file.path
+
+        for done, (pdf_file, doc_type, worker_name, device) in enumerate(documents, 1):
+            source_path = pdf_file.path
+            unit = PlannedUnit(
+                unit=f"doc:{worker_name}/{doc_type}" if worker_name else f"file:{source_path}",
+                source=source_path, worker_name=worker_name, doc_type=doc_type,
+                error=None if worker_name else "Sin nombre de trabajador en el archivo"
+            )
+            if worker_name and latest[(worker_name, doc_type)] == source_path:
+                unit.target = os.path.join(worker_name, f"{worker_name}_{doc_type}.pdf")
+                unit.estimated_bytes = self._copied_bytes(source_path, plan.output_folder, pdf_file.size, device)
+                plan.add_input(source_path, size=pdf_file.size, mtime_ns=pdf_file.mtime_ns)
+            plan.units.append(unit)
+            yield unit
+            self._report(done, len(documents))
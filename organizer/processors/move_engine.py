@@ -0,0 +1,212 @@
+"""
+Mover archivos y carpetas: renombrado en la misma unidad o copia por bloques entre unidades
+"""
+import errno
+import os
+import shutil
+from typing import Callable, Optional
+
+# Bytes copiados por bloque entre unidades (también marca cada cuánto se atiende la cancelación)
+COPY_CHUNK_SIZE = 8 * 1024 * 1024
+
+MOVE_RENAME = "rename"
+MOVE_COPY = "copy"
+
+# Errores de copy_file_range que indican que hay que copiar leyendo y escribiendo
+_KERNEL_COPY_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM}
+
+
+class MoveCancelled(Exception):
+    """El movimiento se canceló; la copia parcial ya se eliminó y el original sigue intacto"""
+
+
+class SourceNotRemovedError(OSError):
+    """La copia se completó y verificó, pero no se pudo borrar el original"""
+
+
+def same_device(source: str, target_dir: str) -> bool:
+    """Indica si origen y carpeta de destino están en la misma unidad (se puede renombrar)"""
+    try:
+        return os.lstat(source).st_dev == os.stat(target_dir).st_dev
+    except OSError:
+        return False
+
+
+def tree_size(path: str) -> int:
+    """
+    Bytes de un archivo o de todos los archivos de una carpeta (sin seguir enlaces)
+
+    Args:
+        path: Archivo o carpeta
+
+    Returns:
+        Tamaño total en bytes
+    """
+    if os.path.islink(path):
+        return 0
+    if not os.path.isdir(path):
+        return os.lstat(path).st_size
+
+    total = 0
+    pending = [path]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+def move_item(source: str, destination: str, progress: Optional[Callable[[int], None]] = None,
+              is_cancelled: Optional[Callable[[], bool]] = None) -> str:
+    """
+    Mueve un archivo o carpeta sin sobrescribir nada
+
+    En la misma unidad basta con renombrar. Entre unidades se copia por
+    bloques a un nombre temporal junto al destino; cuando la copia está
+    escrita en disco y verificada (mismos archivos y tamaños) se le da el
+    nombre final y solo entonces se borra el original. Si se cancela o falla,
+    la copia parcial se elimina y el original queda como estaba.
+
+    Args:
+        source: Archivo o carpeta a mover
+        destination: Ruta final (no debe existir)
+        progress: Función que recibe los bytes copiados en cada bloque
+        is_cancelled: Función que indica si hay que cancelar
+
+    Returns:
+        MOVE_RENAME o MOVE_COPY, según cómo se movió
+
+    Raises:
+        MoveCancelled: Si se canceló durante la copia
+        SourceNotRemovedError: Si se copió pero el original no pudo borrarse
+    """
+    if os.path.lexists(destination):
+        raise FileExistsError(errno.EEXIST, "El destino ya contiene un elemento con el mismo nombre", destination)
+
+    if same_device(source, os.path.dirname(destination)):
+        try:
+            os.rename(source, destination)
+            return MOVE_RENAME
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+
+    partial = os.path.join(os.path.dirname(destination), f".{os.path.basename(destination)}.{os.getpid()}.partial")
+    copier = _ChunkedCopier(progress, is_cancelled)
+    try:
+        copier.copy(source, partial)
+        _verify_copy(source, partial)
+        if os.path.lexists(destination):
+            raise FileExistsError(errno.EEXIST, "El destino ya contiene un elemento con el mismo nombre",
+                                  destination)
+        os.rename(partial, destination)
+    except BaseException:
+        _remove(partial)
+        raise
+
+    try:
+        _remove(source)
+    except OSError as e:
+        raise SourceNotRemovedError(e.errno, f"Copiado, pero no se pudo borrar el original: {e.strerror}",
+                                    source) from e
+    return MOVE_COPY
+
+
+class _ChunkedCopier:
+    """Copia archivos y carpetas por bloques, avisando del progreso y atendiendo a la cancelación"""
+
+    def __init__(self, progress: Optional[Callable[[int], None]], is_cancelled: Optional[Callable[[], bool]]):
+        self.progress = progress
+        self.is_cancelled = is_cancelled
+        self.use_kernel_copy = hasattr(os, "copy_file_range")
+        self._buffer = None
+
+    def _check_cancelled(self):
+        if self.is_cancelled is not None and self.is_cancelled():
+            raise MoveCancelled()
+
+    def copy(self, source: str, destination: str):
+        """Copiar un archivo, enlace simbólico o carpeta completa"""
+        self._check_cancelled()
+        if os.path.islink(source):
+            os.symlink(os.readlink(source), destination)
+        elif os.path.isdir(source):
+            os.mkdir(destination)
+            with os.scandir(source) as entries:
+                names = [entry.name for entry in entries]
+            for name in names:
+                self.copy(os.path.join(source, name), os.path.join(destination, name))
+            shutil.copystat(source, destination)
+        else:
+            self._copy_file(source, destination)
+
+    def _copy_file(self, source: str, destination: str):
+        """Copiar un archivo por bloques (en el kernel si es posible) y esperar a que esté en disco"""
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            while True:
+                self._check_cancelled()
+                copied = self._copy_chunk(src, dst)
+                if not copied:
+                    break
+                if self.progress is not None:
+                    self.progress(copied)
+            dst.flush()
+            os.fsync(dst.fileno())
+        shutil.copystat(source, destination)
+
+    def _copy_chunk(self, src, dst) -> int:
+        """Copiar el siguiente bloque; devuelve los bytes copiados (0 al final)"""
+        if self.use_kernel_copy:
+            try:
+                return os.copy_file_range(src.fileno(), dst.fileno(), COPY_CHUNK_SIZE)
+            except OSError as e:
+                if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                    raise
+                # Ambos archivos siguen en la misma posición: se continúa leyendo y escribiendo
+                self.use_kernel_copy = False
+
+        if self._buffer is None:
+            self._buffer = memoryview(bytearray(COPY_CHUNK_SIZE))
+        read = src.readinto(self._buffer)
+        if read:
+            dst.write(self._buffer[:read])
+        return read
+
+
+def _verify_copy(source: str, copy: str):
+    """Comprobar que la copia tiene los mismos archivos y tamaños que el original"""
+    if os.path.isdir(source) and not os.path.islink(source):
+        for root, dirs, files in os.walk(source):
+            relative = os.path.relpath(root, source)
+            for name in files:
+                _verify_file(os.path.join(root, name), os.path.join(copy, relative, name))
+            for name in dirs:
+                if not os.path.lexists(os.path.join(copy, relative, name)):
+                    raise OSError(errno.EIO, "Falta una carpeta en la copia", os.path.join(copy, relative, name))
+    elif not os.path.islink(source):
+        _verify_file(source, copy)
+
+
+def _verify_file(source: str, copy: str):
+    """Comprobar que un archivo copiado existe y tiene el tamaño del original"""
+    if os.path.islink(source):
+        if not os.path.islink(copy):
+            raise OSError(errno.EIO, "Falta un enlace en la copia", copy)
+        return
+    try:
+        copied_size = os.lstat(copy).st_size
+    except FileNotFoundError:
+        raise OSError(errno.EIO, "Falta un archivo en la copia", copy)
+    if copied_size != os.lstat(source).st_size:
+        raise OSError(errno.EIO, "La copia no tiene el tamaño del original", copy)
+
+
+def _remove(path: str):
+    """Borrar un archivo, enlace o carpeta si existe"""
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    elif os.path.lexists(path):
+        os.remove(path)
@@ -0,0 +1,106 @@
+"""
+Índice de nombres de salida: asigna nombres libres (nombre, nombre_001, ...) sin consultar el disco por cada intento
+"""
+import os
+import threading
+from typing import Dict, Set
+
+
+class OutputNameIndex:
+    """
+    Nombres ocupados de una carpeta de salida, leídos una sola vez
+
+    Cada nombre asignado se crea en disco con O_EXCL (archivo vacío que luego se
+    sobrescribe con el contenido), así dos procesos o programas que escriban en la
+    misma carpeta nunca se pisan: si otro creó el archivo antes, se toma el siguiente
+    sufijo. Los nombres se comparan sin distinguir mayúsculas, igual que en Windows,
+    macOS y carpetas compartidas SMB.
+
+    Uso:
+        names = OutputNameIndex(carpeta)
+        ruta = names.claim("Juan Perez", ".pdf")   # crea Juan Perez.pdf o Juan Perez_001.pdf...
+        ...escribir en ruta...
+        names.release(ruta)                         # solo si la escritura falló
+
+    Con reserve=False los nombres solo se asignan en memoria, sin crear nada en
+    disco: sirve para calcular de antemano los destinos de un plan de trabajo.
+    """
+
+    def __init__(self, folder: str, reserve: bool = True):
+        """
+        Args:
+            folder: Carpeta de salida (debe existir o poder crearse)
+            reserve: Crear en disco cada nombre asignado (False = solo calcularlos)
+        """
+        self.folder = folder
+        self.reserve = reserve
+        self._lock = threading.Lock()
+        # Siguiente sufijo a probar por nombre base (0 = sin sufijo)
+        self._next_suffix: Dict[str, int] = {}
+        self._taken: Set[str] = set()
+
+        if reserve:
+            os.makedirs(folder, exist_ok=True)
+        elif not os.path.isdir(folder):
+            return
+        with os.scandir(folder) as entries:
+            self._taken = {entry.name.casefold() for entry in entries}
+
+    @staticmethod
+    def candidate(clean_name: str, extension: str, suffix: int) -> str:
+        """Nombre de archivo para un sufijo dado (0 = sin sufijo)"""
+        if suffix == 0:
+            return f"{clean_name}{extension}"
+        return f"{clean_name}_{suffix:03d}{extension}"
+
+    def claim(self, clean_name: str, extension: str) -> str:
+        """
+        Reserva y crea el primer nombre libre
+
+        Args:
+            clean_name: Nombre base ya limpio
+            extension: Extensión del archivo (con punto)
+
+        Returns:
+            Ruta del archivo creado (vacío) listo para escribir, o solo la ruta si reserve=False
+        """
+        base = f"{clean_name}{extension}".casefold()
+        with self._lock:
+            suffix = self._next_suffix.get(base, 0)
+            while True:
+                filename = self.candidate(clean_name, extension, suffix)
+                suffix += 1
+                if filename.casefold() in self._taken:
+                    continue
+
+                self._taken.add(filename.casefold())
+                path = os.path.join(self.folder, filename)
+                if not self.reserve:
+                    self._next_suffix[base] = suffix
+                    return path
+                try:
+                    os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                except FileExistsError:
+                    # Creado por otro proceso después de leer la carpeta
+                    continue
+
+                self._next_suffix[base] = suffix
+                return path
+
+    def release(self, path: str):
+        """
+        Borra un archivo reservado que no llegó a escribirse y libera su nombre
+
+        Args:
+            path: Ruta devuelta por claim()
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            return
+
+        filename = os.path.basename(path).casefold()
+        with self._lock:
+            self._taken.discard(filename)
+            # Volver a empezar la búsqueda para que el nombre liberado se reutilice
+            self._next_suffix.clear()
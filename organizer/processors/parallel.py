@@ -0,0 +1,150 @@
+"""
+Extracción paralela de nombres por página usando un pool de procesos
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .block_extraction import DEFAULT_EXTRACTION
+from .pdf_document import PDFDocumentSession
+from .timing import STAGE_OPEN, StageTimer
+from ..utils.cache import open_extraction_cache
+
+# Por debajo de este número de páginas no compensa arrancar procesos
+MIN_PAGES_FOR_PARALLEL = 40
+
+# Fragmentos por proceso: varios por proceso reparten mejor la carga
+CHUNKS_PER_WORKER = 4
+
+
+def default_worker_count() -> int:
+    """Número de procesos por defecto (núcleos disponibles)"""
+    return os.cpu_count() or 1
+
+
+def split_page_ranges(total_pages: int, max_workers: int, start_page: int = 0) -> List[Tuple[int, int]]:
+    """
+    Divide las páginas en rangos contiguos [inicio, fin) para repartir entre procesos
+
+    Args:
+        total_pages: Número total de páginas
+        max_workers: Número de procesos disponibles
+        start_page: Primera página a repartir (las anteriores se omiten)
+
+    Returns:
+        Lista de rangos (inicio, fin) en orden de página
+    """
+    remaining = total_pages - start_page
+    if remaining <= 0:
+        return []
+
+    chunks = max(1, min(remaining, max_workers * CHUNKS_PER_WORKER))
+    chunk_size = -(-remaining // chunks)  # División redondeando hacia arriba
+
+    return [
+        (start, min(start + chunk_size, total_pages))
+        for start in range(start_page, total_pages, chunk_size)
+    ]
+
+
+def extract_names_for_range(pdf_path: str, start: int, end: int, cache_path: Optional[str] = None,
+                            file_key: Optional[str] = None, extraction: str = DEFAULT_EXTRACTION,
+                            known: Optional[Dict[int, Optional[str]]] = None
+                            ) -> Dict[int, Tuple[Optional[str], Dict[str, float]]]:
+    """
+    Extrae el nombre del trabajador de cada página de un rango
+
+    Se ejecuta dentro de un proceso del pool: abre su propio manejador del documento
+    y, si se indica, su propia conexión a la caché de extracción. En modo "roi"
+    cada rango aprende su propia zona del nombre desde sus primeras páginas.
+
+    Args:
+        pdf_path: Ruta del PDF multi-página
+        start: Primera página del rango (0-indexed, incluida)
+        end: Última página del rango (excluida)
+        cache_path: Ruta de la caché de extracción (None = sin caché)
+        file_key: Clave de caché del documento
+        extraction: Cómo leer el texto de cada página (ver block_extraction.EXTRACTION_MODES)
+        known: Nombres ya detectados de algunas páginas del rango (no se vuelven a buscar)
+
+    Returns:
+        Diccionario {página: (nombre del trabajador o None, segundos por etapa)}
+    """
+    from .pdf_processor import PDFProcessor
+
+    # En procesos paralelos cada escritura se confirma para no bloquear a los demás
+    cache = open_extraction_cache(cache_path, flush_every=1) if cache_path else None
+    processor = PDFProcessor(cache=cache, extraction=extraction)
+    if cache is None:
+        file_key = None
+
+    assignments = {}
+    # La apertura del documento en este proceso se atribuye a la primera página del rango
+    timer = StageTimer()
+    try:
+        with timer.stage(STAGE_OPEN):
+            session = PDFDocumentSession(pdf_path)
+        with session:
+            for page_num in range(start, end):
+                if known and page_num in known:
+                    assignments[page_num] = (known[page_num], {})
+                    continue
+                try:
+                    worker_name = processor.detect_page_worker_name(
+                        pdf_path, page_num, session, file_key, timer
+                    )
+                except Exception:
+                    worker_name = None
+                assignments[page_num] = (worker_name, timer.durations)
+                timer = StageTimer()
+    finally:
+        if cache is not None:
+            cache.close()
+    return assignments
+
+
+def iter_page_names(pdf_path: str, total_pages: int, max_workers: int, cache_path: Optional[str] = None,
+                    file_key: Optional[str] = None, start_page: int = 0, extraction: str = DEFAULT_EXTRACTION,
+                    known: Optional[Dict[int, Optional[str]]] = None
+                    ) -> Iterator[Tuple[int, Optional[str], Dict[str, float]]]:
+    """
+    Obtiene la asignación página → trabajador repartiendo el trabajo entre procesos
+
+    Los rangos se entregan en orden de página en cuanto cada uno termina, de modo
+    que las primeras páginas pueden escribirse mientras el resto sigue en proceso.
+
+    Args:
+        pdf_path: Ruta del PDF multi-página
+        total_pages: Número total de páginas del PDF
+        max_workers: Número máximo de procesos
+        cache_path: Ruta de la caché de extracción compartida por los procesos
+        file_key: Clave de caché del documento
+        start_page: Primera página a analizar
+        extraction: Cómo leer el texto de cada página
+        known: Nombres ya detectados de algunas páginas {página: nombre o None} (no se vuelven a buscar)
+
+    Yields:
+        Tuplas (página, nombre del trabajador o None, segundos por etapa) desde start_page, en orden
+    """
+    ranges = split_page_ranges(total_pages, max_workers, start_page)
+    if not ranges:
+        return
+
+    known = known or {}
+    executor = ProcessPoolExecutor(max_workers=min(max_workers, len(ranges)))
+    try:
+        futures = [
+            executor.submit(
+                extract_names_for_range, pdf_path, start, end, cache_path, file_key, extraction,
+                {page_num: name for page_num, name in known.items() if start <= page_num < end}
+            )
+            for start, end in ranges
+        ]
+        for future in futures:
+            assignments = future.result()
+            for page_num in sorted(assignments):
+                worker_name, durations = assignments[page_num]
+                yield page_num, worker_name, durations
+    finally:
+        # Si se cancela a mitad, los rangos que no han empezado se descartan y se espera a los que están en curso
+        executor.shutdown(wait=True, cancel_futures=True)
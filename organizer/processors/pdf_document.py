@@ -0,0 +1,247 @@
+"""
+Sesión de documento PDF: mantiene un único documento abierto durante todo el proceso
+"""
+import os
+from typing import Iterable, List, Optional, Tuple
+import fitz  # PyMuPDF - mejor para extracción de texto
+import PyPDF2
+
+from .block_extraction import NameRegion, Rect, TextBlock
+
+# Formas de escribir páginas separadas: PyMuPDF copia las páginas desde el
+# documento ya abierto; PyPDF2 (puro Python, más lento) queda como respaldo
+PAGE_WRITER_PYMUPDF = "pymupdf"
+PAGE_WRITER_PYPDF2 = "pypdf2"
+PAGE_WRITERS = (PAGE_WRITER_PYMUPDF, PAGE_WRITER_PYPDF2)
+DEFAULT_PAGE_WRITER = PAGE_WRITER_PYMUPDF
+
+
+class PDFDocumentSession:
+    """
+    Documento PDF abierto una sola vez y compartido por extracción de texto,
+    escritura de páginas y vista previa.
+
+    PyMuPDF se abre al crear la sesión; el lector de PyPDF2 solo se crea si
+    hace falta (texto vacío, documento que PyMuPDF no abre o escritura con
+    page_writer="pypdf2") y se reutiliza después.
+
+    Uso:
+        with PDFDocumentSession(ruta) as session:
+            for page_num in range(session.page_count):
+                text = session.extract_text(page_num)
+    """
+
+    def __init__(self, pdf_path: str, page_writer: str = DEFAULT_PAGE_WRITER):
+        """
+        Abrir el documento
+
+        Args:
+            pdf_path: Ruta del archivo PDF
+            page_writer: Forma de escribir páginas (ver PAGE_WRITERS)
+        """
+        if page_writer not in PAGE_WRITERS:
+            raise ValueError(f"Escritor de páginas desconocido: {page_writer}")
+        self.pdf_path = pdf_path
+        self.page_writer = page_writer
+        self._doc = None
+        self._file = None
+        self._reader = None
+        self._reader_opened = False
+        self._page_count: Optional[int] = None
+        # Zona donde aparece el nombre en este documento (modo de extracción "roi")
+        self.name_region = NameRegion()
+
+        try:
+            self._doc = fitz.open(pdf_path)
+        except Exception:
+            self._doc = None
+
+    def __enter__(self) -> "PDFDocumentSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def page_count(self) -> int:
+        """Número de páginas del documento"""
+        if self._page_count is None:
+            if self._doc is not None:
+                self._page_count = len(self._doc)
+            else:
+                reader = self._get_reader()
+                self._page_count = len(reader.pages) if reader else 0
+        return self._page_count
+
+    def _get_reader(self) -> Optional[PyPDF2.PdfReader]:
+        """Obtener el lector de PyPDF2, abriéndolo una sola vez"""
+        if not self._reader_opened:
+            self._reader_opened = True
+            try:
+                self._file = open(self.pdf_path, 'rb')
+                self._reader = PyPDF2.PdfReader(self._file)
+            except Exception:
+                self._reader = None
+        return self._reader
+
+    def extract_text(self, page_num: int = 0) -> str:
+        """
+        Extrae texto de una página del documento
+
+        Args:
+            page_num: Número de página a extraer (0-indexed)
+
+        Returns:
+            Texto extraído de la página
+        """
+        # Intentar con PyMuPDF (mejor calidad)
+        if self._doc is not None:
+            try:
+                if page_num < len(self._doc):
+                    text = self._doc[page_num].get_text()
+                    if text.strip():
+                        return text
+            except Exception:
+                pass
+
+        # Fallback a PyPDF2
+        reader = self._get_reader()
+        if reader is not None:
+            try:
+                if page_num < len(reader.pages):
+                    return reader.pages[page_num].extract_text()
+            except Exception:
+                pass
+
+        return ""
+
+    def extract_blocks(self, page_num: int = 0, clip: Optional[Rect] = None) -> List[TextBlock]:
+        """
+        Extrae los bloques de texto de una página en orden de lectura (de arriba abajo)
+
+        Args:
+            page_num: Número de página (0-indexed)
+            clip: Zona a leer en fracciones del tamaño de la página (None = toda)
+
+        Returns:
+            Bloques con texto, o lista vacía si PyMuPDF no pudo leer la página
+            (en ese caso usar extract_text, que recurre a PyPDF2)
+        """
+        if self._doc is None:
+            return []
+        try:
+            if page_num >= len(self._doc):
+                return []
+            page = self._doc[page_num]
+            width, height = page.rect.width, page.rect.height
+            if not width or not height:
+                return []
+            page_clip = None
+            if clip is not None:
+                page_clip = fitz.Rect(clip[0] * width, clip[1] * height, clip[2] * width, clip[3] * height)
+            blocks = page.get_text("blocks", clip=page_clip, sort=True)
+        except Exception:
+            return []
+
+        # (x0, y0, x1, y1, texto, número de bloque, tipo); tipo 1 = imagen
+        return [
+            TextBlock((x0 / width, y0 / height, x1 / width, y1 / height), text)
+            for x0, y0, x1, y1, text, _, block_type in blocks
+            if block_type == 0 and text.strip()
+        ]
+
+    def write_page(self, page_num: int, output_path: str):
+        """
+        Guarda una página del documento como un PDF independiente
+
+        Args:
+            page_num: Número de página a guardar (0-indexed)
+            output_path: Ruta del PDF de salida
+        """
+        self.write_pages([page_num], output_path)
+
+    def write_pages(self, page_nums: Iterable[int], output_path: str):
+        """
+        Guarda varias páginas del documento, en el orden indicado, en un único PDF
+
+        Con PyMuPDF las páginas se copian desde el documento ya abierto sin
+        volver a leer el archivo; si falla (o se eligió "pypdf2") se escribe
+        con PyPDF2.
+
+        Args:
+            page_nums: Números de página a guardar (0-indexed)
+            output_path: Ruta del PDF de salida
+        """
+        page_nums = list(page_nums)
+        if self.page_writer == PAGE_WRITER_PYMUPDF and self._doc is not None:
+            try:
+                self._write_pages_pymupdf(page_nums, output_path)
+                return
+            except Exception:
+                pass
+
+        self._write_pages_pypdf2(page_nums, output_path)
+
+    def _write_pages_pymupdf(self, page_nums: List[int], output_path: str):
+        """
+        Copiar las páginas con PyMuPDF, agrupando las consecutivas en un solo bloque
+
+        PyMuPDF reemplaza el archivo de destino al guardar, lo que dejaría un
+        instante sin archivo y anularía la reserva exclusiva del nombre (ver
+        OutputNameIndex); por eso se guarda en un temporal y se sustituye con
+        os.replace, que es atómico.
+        """
+        for page_num in page_nums:
+            if not 0 <= page_num < len(self._doc):
+                raise IndexError(f"Página fuera de rango: {page_num + 1}")
+
+        temp_path = f"{output_path}.{os.getpid()}.tmp"
+        output = fitz.open()
+        try:
+            for first, last in _consecutive_runs(page_nums):
+                output.insert_pdf(self._doc, from_page=first, to_page=last)
+            output.save(temp_path)
+            os.replace(temp_path, output_path)
+        finally:
+            output.close()
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _write_pages_pypdf2(self, page_nums: List[int], output_path: str):
+        """Escribir las páginas con PyPDF2"""
+        reader = self._get_reader()
+        if reader is None:
+            raise IOError(f"No se pudo leer el PDF: {self.pdf_path}")
+
+        pdf_writer = PyPDF2.PdfWriter()
+        for page_num in page_nums:
+            pdf_writer.add_page(reader.pages[page_num])
+
+        with open(output_path, 'wb') as output_file:
+            pdf_writer.write(output_file)
+
+    def close(self):
+        """Cerrar el documento y el lector de respaldo"""
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._reader = None
+
+
+def _consecutive_runs(page_nums: List[int]) -> List[Tuple[int, int]]:
+    """
+    Agrupa números de página consecutivos en rangos
+
+    Returns:
+        Lista de (primera, última) inclusivas, p. ej. [3, 4, 5, 9] → [(3, 5), (9, 9)]
+    """
+    runs: List[Tuple[int, int]] = []
+    for page_num in page_nums:
+        if runs and page_num == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], page_num)
+        else:
+            runs.append((page_num, page_num))
+    return runs
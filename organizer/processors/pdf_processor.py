@@ -1,14 +1,40 @@
 import os
 import re
-import shutil
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Dict, Optional
-import fitz  # PyMuPDF - mejor para extracción de texto
-import PyPDF2
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Dict, Iterable, Iterator, Optional, Set, Tuple
+from dataclasses import dataclass, field
 
+from .block_extraction import (
+    DEFAULT_EXTRACTION, EXTRACTION_FULL, EXTRACTION_MODES, EXTRACTION_ROI, find_name_in_blocks
+)
+from .discovery import DiscoveryOptions, PDFDiscovery
+from .folder_scan import ProcessedFolder, folder_scans
+from .output_names import OutputNameIndex
+from .pdf_document import DEFAULT_PAGE_WRITER, PAGE_WRITERS, PDFDocumentSession
+from .parallel import MIN_PAGES_FOR_PARALLEL, iter_page_names
+from .sync_manifest import SyncManifest, SyncOptions, open_sync_manifest
+from .timing import (
+    STAGES, STAGE_EXTRACT, STAGE_MATCH, STAGE_OPEN, STAGE_WRITE, StageTimer, summarize_samples
+)
+from .transfer import DEFAULT_TRANSFER, METADATA_ONLY, TRANSFER_MOVE, TRANSFER_STRATEGIES, transfer_file
+from ..utils.cache import ExtractionCache, MISSING, NO_TEXT
 from ..utils.patterns import WorkerNamePatterns
 
+if TYPE_CHECKING:
+    from .job_journal import JobJournal
+    from .job_plan import JobPlan
+
+# Hilos que copian documentos a la vez al organizar (en unidades de red la latencia pesa más que el ancho de banda)
+ORGANIZE_COPY_THREADS = 8
+
+# Copias encoladas por hilo al organizar (limita la memoria con miles de trabajadores)
+COPIES_IN_FLIGHT_PER_THREAD = 4
+
+# Tareas del pool al organizar: comprobar si el destino está al día o copiar
+SYNC_TASK_CHECK = "check"
+SYNC_TASK_COPY = "copy"
+
 @dataclass
 class ProcessResult:
     """Resultado del procesamiento de un archivo"""
@@ -18,12 +44,143 @@ class ProcessResult:
     worker_name: Optional[str] = None
     error: Optional[str] = None
     pages_processed: int = 0
+    # Segundos dedicados a cada etapa (ver processors.timing.STAGES)
+    timings: Dict[str, float] = field(default_factory=dict)
+    bytes_read: int = 0
+    bytes_written: int = 0
+    # El destino ya estaba al día (sincronización incremental): no se copió
+    skipped: bool = False
+    # No se pudo usar la estrategia de transferencia pedida y se hizo una copia normal
+    transfer_fallback: bool = False
+    # Salida de un intento interrumpido que el diario borró, devolvió o conservó al reanudar
+    # (no es una unidad procesada: no cuenta como éxito ni como error)
+    interrupted: bool = False
+
+class ResultSummary:
+    """Contadores acumulados de resultados, actualizables a medida que llegan"""
+    
+    def __init__(self):
+        self.total_processed = 0
+        self.successful = 0
+        self.skipped = 0
+        self.transfer_fallbacks = 0
+        self.interrupted = 0
+        self.total_pages = 0
+        self.unique_workers: Set[str] = set()
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.stage_totals: Dict[str, float] = {stage: 0.0 for stage in STAGES}
+        # Duraciones de cada resultado por etapa, para calcular percentiles
+        self._stage_samples: Dict[str, List[float]] = {stage: [] for stage in STAGES + ('total',)}
+    
+    @property
+    def failed(self) -> int:
+        return self.total_processed - self.successful
+    
+    def add(self, result: ProcessResult):
+        """Sumar un resultado a los contadores"""
+        if result.interrupted:
+            self.interrupted += 1
+            return
+        self.total_processed += 1
+        if result.skipped:
+            self.skipped += 1
+        if result.transfer_fallback:
+            self.transfer_fallbacks += 1
+        if result.success:
+            self.successful += 1
+            if result.worker_name:
+                self.unique_workers.add(result.worker_name)
+        if result.pages_processed:
+            self.total_pages += result.pages_processed
+        
+        self.bytes_read += result.bytes_read
+        self.bytes_written += result.bytes_written
+        for stage in STAGES:
+            seconds = result.timings.get(stage, 0.0)
+            self.stage_totals[stage] += seconds
+            self._stage_samples[stage].append(seconds)
+        self._stage_samples['total'].append(sum(result.timings.values()))
+    
+    def add_all(self, results: Iterable[ProcessResult]):
+        """Sumar varios resultados a los contadores"""
+        for result in results:
+            self.add(result)
+    
+    def stage_percentiles(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns:
+            Percentiles por etapa y del total de cada resultado: {etapa: {'p50': s, 'p90': s, ...}}
+        """
+        return {stage: summarize_samples(samples) for stage, samples in self._stage_samples.items()}
+    
+    def as_dict(self, percentiles: bool = False) -> Dict:
+        """
+        Args:
+            percentiles: Incluir percentiles por etapa (ordena todas las muestras)
+            
+        Returns:
+            Diccionario con estadísticas del procesamiento (formato de get_summary)
+        """
+        summary = {
+            'total_processed': self.total_processed,
+            'successful': self.successful,
+            'failed': self.failed,
+            'skipped': self.skipped,
+            'transfer_fallbacks': self.transfer_fallbacks,
+            'interrupted': self.interrupted,
+            'success_rate': (self.successful / self.total_processed * 100) if self.total_processed else 0.0,
+            'workers_found': len(self.unique_workers),
+            'total_pages': self.total_pages,
+            'bytes_read': self.bytes_read,
+            'bytes_written': self.bytes_written,
+            'stage_totals': dict(self.stage_totals)
+        }
+        if percentiles:
+            summary['stage_percentiles'] = self.stage_percentiles()
+        return summary
 
 class PDFProcessor:
     """Procesador de PDFs para extraer nombres y organizar archivos"""
     
-    def __init__(self):
+    def __init__(self, max_workers: int = 1, cache: Optional[ExtractionCache] = None,
+                 page_writer: str = DEFAULT_PAGE_WRITER, transfer: str = DEFAULT_TRANSFER,
+                 discovery: DiscoveryOptions = DiscoveryOptions(), sync: SyncOptions = SyncOptions(),
+                 extraction: str = DEFAULT_EXTRACTION):
+        """
+        Args:
+            max_workers: Procesos para extraer texto en paralelo al separar PDFs (1 = secuencial)
+            cache: Caché persistente de texto y nombres por página (None = sin caché)
+            page_writer: Forma de escribir las páginas separadas ('pymupdf' o 'pypdf2')
+            transfer: Cómo llevar los archivos al destino al renombrar y organizar
+                      ('copy', 'kernel_copy', 'reflink', 'hardlink' o 'move')
+            discovery: Qué archivos de la carpeta de entrada se renombran (subcarpetas y patrones)
+            sync: Al organizar, si se saltan los documentos cuyo destino ya está al día
+            extraction: Cómo leer el texto para buscar el nombre ('full', 'blocks' o 'roi',
+                        ver processors.block_extraction)
+        """
+        if page_writer not in PAGE_WRITERS:
+            raise ValueError(f"Escritor de páginas desconocido: {page_writer}")
+        if transfer not in TRANSFER_STRATEGIES:
+            raise ValueError(f"Estrategia de transferencia desconocida: {transfer}")
+        if extraction not in EXTRACTION_MODES:
+            raise ValueError(f"Modo de extracción desconocido: {extraction}")
         self.results: List[ProcessResult] = []
+        self.max_workers = max(1, max_workers)
+        self.cache = cache
+        self.page_writer = page_writer
+        self.transfer = transfer
+        self.discovery = discovery
+        self.sync = sync
+        self.extraction = extraction
+        # Motor de patrones compartido por procesamiento, vista previa e hilos
+        self.name_matcher = WorkerNamePatterns.get_matcher()
+        # Versión de los nombres detectados (caché y planes): los modos por bloques pueden dar otro nombre
+        self.name_version = self.name_matcher.version
+        if extraction != EXTRACTION_FULL:
+            self.name_version = f"{self.name_matcher.version}-{extraction}"
+        # Nombres ocupados de cada carpeta de salida (se leen una vez por carpeta)
+        self._output_names: Dict[str, OutputNameIndex] = {}
         
     def extract_worker_name(self, text: str) -> Optional[str]:
         """
@@ -35,7 +192,7 @@ class PDFProcessor:
         Returns:
             Nombre del trabajador en formato Title Case o None si no se encuentra
         """
-        return WorkerNamePatterns.extract_worker_name(text)
+        return self.name_matcher.find(text)
     
     def clean_filename(self, filename: str) -> str:
         """
@@ -65,157 +222,493 @@ class PDFProcessor:
         
         return filename
     
-    def extract_text_from_pdf(self, pdf_path: str, page_num: int = 0) -> str:
+    def open_document(self, pdf_path: str) -> PDFDocumentSession:
+        """
+        Abre un PDF una sola vez para reutilizarlo en varias operaciones
+        
+        Args:
+            pdf_path: Ruta del archivo PDF
+            
+        Returns:
+            Sesión de documento (usar como context manager)
+        """
+        return PDFDocumentSession(pdf_path, self.page_writer)
+    
+    def extract_text_from_pdf(self, pdf_path: str, page_num: int = 0,
+                              session: Optional[PDFDocumentSession] = None) -> str:
         """
         Extrae texto de una página específica del PDF
         
         Args:
             pdf_path: Ruta del archivo PDF
             page_num: Número de página a extraer (0-indexed)
+            session: Sesión ya abierta del documento (evita volver a abrirlo)
             
         Returns:
             Texto extraído de la página
         """
-        # Intentar con PyMuPDF (mejor calidad)
+        return self._page_text(pdf_path, page_num, session, self.cache_key(pdf_path))
+    
+    def cache_key(self, pdf_path: str) -> Optional[str]:
+        """
+        Obtiene la clave de caché (hash del contenido) de un PDF
+        
+        Args:
+            pdf_path: Ruta del archivo PDF
+            
+        Returns:
+            Clave de caché o None si no hay caché o no se pudo calcular
+        """
+        if self.cache is None:
+            return None
         try:
-            doc = fitz.open(pdf_path)
-            if page_num < len(doc):
-                text = doc[page_num].get_text()
-                doc.close()
-                if text.strip():
-                    return text
-            doc.close()
+            return self.cache.file_key(pdf_path)
         except Exception:
-            pass
+            return None
+    
+    def _page_text(self, pdf_path: str, page_num: int, session: Optional[PDFDocumentSession],
+                   file_key: Optional[str], timer: Optional[StageTimer] = None) -> str:
+        """Texto de una página, desde la caché si está disponible"""
+        timer = timer or StageTimer()
+        
+        if file_key is not None:
+            with timer.stage(STAGE_EXTRACT):
+                text = self.cache.get_text(file_key, page_num)
+            if text is not None:
+                return text
+        
+        if session is not None:
+            with timer.stage(STAGE_EXTRACT):
+                text = session.extract_text(page_num)
+        else:
+            with timer.stage(STAGE_OPEN):
+                doc_session = self.open_document(pdf_path)
+                timer.bytes_read += os.path.getsize(pdf_path)
+            with doc_session, timer.stage(STAGE_EXTRACT):
+                text = doc_session.extract_text(page_num)
+        
+        if file_key is not None:
+            with timer.stage(STAGE_EXTRACT):
+                self.cache.set_text(file_key, page_num, text)
+        return text
+    
+    def detect_page_worker_name(self, pdf_path: str, page_num: int = 0,
+                                session: Optional[PDFDocumentSession] = None,
+                                file_key: Optional[str] = None,
+                                timer: Optional[StageTimer] = None) -> Optional[str]:
+        """
+        Detecta el trabajador de una página usando la caché de nombres y de texto
+        
+        Args:
+            pdf_path: Ruta del archivo PDF
+            page_num: Número de página (0-indexed)
+            session: Sesión ya abierta del documento (evita volver a abrirlo)
+            file_key: Clave de caché ya calculada (ver cache_key)
+            timer: Medidor donde sumar los tiempos de extracción y patrones
+            
+        Returns:
+            Nombre del trabajador o None si no se encuentra
+        """
+        timer = timer or StageTimer()
+        
+        if file_key is not None:
+            with timer.stage(STAGE_MATCH):
+                cached = self.cache.get_name(file_key, page_num, self.name_version)
+            if cached is not MISSING:
+                return cached or None
+        
+        worker_name, _ = self._match_page(pdf_path, page_num, session, file_key, timer)
+        if file_key is not None:
+            with timer.stage(STAGE_MATCH):
+                self.cache.set_name(file_key, page_num, self.name_version, worker_name)
+        return worker_name
+    
+    def _match_page(self, pdf_path: str, page_num: int, session: Optional[PDFDocumentSession],
+                    file_key: Optional[str], timer: StageTimer) -> Tuple[Optional[str], bool]:
+        """
+        Busca el nombre en una página según el modo de extracción (sin consultar la caché de nombres)
+        
+        Returns:
+            (nombre o None, si la página tiene texto)
+        """
+        if self.extraction == EXTRACTION_FULL:
+            text = self._page_text(pdf_path, page_num, session, file_key, timer)
+            with timer.stage(STAGE_MATCH):
+                return self.extract_worker_name(text), bool(text.strip())
         
-        # Fallback a PyPDF2
+        if session is not None:
+            return self._match_page_blocks(session, page_num, timer)
+        with timer.stage(STAGE_OPEN):
+            doc_session = self.open_document(pdf_path)
+            timer.bytes_read += os.path.getsize(pdf_path)
+        with doc_session:
+            return self._match_page_blocks(doc_session, page_num, timer)
+    
+    def _match_page_blocks(self, session: PDFDocumentSession, page_num: int,
+                           timer: StageTimer) -> Tuple[Optional[str], bool]:
+        """
+        Busca el nombre leyendo los bloques de texto en orden y parando en el primero válido
+        
+        En modo 'roi' se lee primero la zona aprendida del documento
+        (session.name_region) y solo si el nombre no está ahí la página entera.
+        El texto por bloques no se guarda en la caché de texto (no es el de la
+        página completa); el nombre sí, con su propia versión.
+        """
+        region = session.name_region if self.extraction == EXTRACTION_ROI else None
+        clip = region.clip() if region is not None else None
+        
+        with timer.stage(STAGE_EXTRACT):
+            blocks = session.extract_blocks(page_num, clip)
+        with timer.stage(STAGE_MATCH):
+            found = find_name_in_blocks(blocks, self.name_matcher)
+        
+        if found is None and clip is not None:
+            # El nombre no está en la zona aprendida: leer la página entera
+            with timer.stage(STAGE_EXTRACT):
+                blocks = session.extract_blocks(page_num)
+            with timer.stage(STAGE_MATCH):
+                found = find_name_in_blocks(blocks, self.name_matcher)
+        
+        if found is None:
+            if blocks:
+                return None, True
+            # Sin bloques de PyMuPDF (p. ej. documento que solo abre PyPDF2): texto completo
+            with timer.stage(STAGE_EXTRACT):
+                text = session.extract_text(page_num)
+            with timer.stage(STAGE_MATCH):
+                return self.extract_worker_name(text), bool(text.strip())
+        
+        worker_name, rect = found
+        if region is not None:
+            region.learn(rect)
+        return worker_name, True
+    
+    def list_pdf_files(self, folder: str) -> List[str]:
+        """
+        Lista los PDFs de una carpeta (sin subcarpetas) en orden alfabético
+        
+        Args:
+            folder: Carpeta a listar
+            
+        Returns:
+            Rutas completas de los PDFs encontrados
+        """
+        return list(PDFDiscovery(folder))
+    
+    def iter_input_files(self, folder: str, output_folder: Optional[str] = None) -> PDFDiscovery:
+        """
+        Busca los archivos a renombrar según las opciones de búsqueda del procesador
+        
+        Los archivos se entregan a medida que se encuentran; el objeto devuelto
+        lleva la cuenta de los encontrados hasta el momento (found) y si la
+        búsqueda terminó (finished).
+        
+        Args:
+            folder: Carpeta de entrada
+            output_folder: Carpeta de salida; si está dentro de la entrada no se recorre
+            
+        Returns:
+            Búsqueda iterable con la ruta de cada archivo
+        """
+        return PDFDiscovery(folder, self.discovery, [output_folder] if output_folder else ())
+    
+    def get_page_count(self, pdf_path: str) -> int:
+        """
+        Obtiene el número de páginas de un PDF
+        
+        Args:
+            pdf_path: Ruta del archivo PDF
+            
+        Returns:
+            Número de páginas (0 si no se puede leer)
+        """
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                if page_num < len(pdf_reader.pages):
-                    text = pdf_reader.pages[page_num].extract_text()
-                    return text
+            with self.open_document(pdf_path) as session:
+                return session.page_count
         except Exception:
-            pass
-        
-        return ""
+            return 0
     
-    def separate_multi_page_pdf(self, input_path: str, output_folder: str) -> List[ProcessResult]:
+    def separate_multi_page_pdf(self, input_path: str, output_folder: str,
+                                journal: Optional['JobJournal'] = None,
+                                plan: Optional['JobPlan'] = None) -> List[ProcessResult]:
         """
         Separa un PDF multi-página en archivos individuales por trabajador
         
         Args:
             input_path: Ruta del PDF multi-página
             output_folder: Carpeta donde guardar los archivos separados
+            journal: Diario del trabajo para reanudar si se interrumpió
+            plan: Plan vigente con el trabajador de cada página (no se vuelve a extraer texto)
             
         Returns:
             Lista de resultados del procesamiento
         """
-        results = []
+        return list(self.iter_separate_multi_page_pdf(input_path, output_folder, journal, plan))
+    
+    def iter_separate_multi_page_pdf(self, input_path: str, output_folder: str,
+                                     journal: Optional['JobJournal'] = None,
+                                     plan: Optional['JobPlan'] = None) -> Iterator[ProcessResult]:
+        """
+        Separa un PDF multi-página entregando el resultado de cada página en cuanto se escribe
         
+        Args:
+            input_path: Ruta del PDF multi-página
+            output_folder: Carpeta donde guardar los archivos separados
+            journal: Diario del trabajo: las páginas ya separadas se saltan
+            plan: Plan vigente con el trabajador de cada página (no se vuelve a extraer texto)
+            
+        Yields:
+            Resultado de cada página, en orden
+        """
         try:
             # Validar que el archivo existe y es PDF
             if not os.path.exists(input_path) or not input_path.lower().endswith('.pdf'):
-                return [ProcessResult(
+                yield ProcessResult(
                     original_file=os.path.basename(input_path),
                     success=False,
                     error="Archivo no válido o no es PDF"
-                )]
+                )
+                return
             
             # Crear carpeta de salida
             os.makedirs(output_folder, exist_ok=True)
             
-            with open(input_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                total_pages = len(pdf_reader.pages)
-                
+            # Abrir el documento una sola vez para todas las páginas
+            doc_timer = StageTimer()
+            with doc_timer.stage(STAGE_OPEN):
+                session = self.open_document(input_path)
+                total_pages = session.page_count
+                doc_timer.bytes_read = os.path.getsize(input_path)
+            
+            with session:
                 if total_pages == 0:
-                    return [ProcessResult(
+                    yield doc_timer.apply(ProcessResult(
                         original_file=os.path.basename(input_path),
                         success=False,
                         error="El PDF no contiene páginas"
-                    )]
+                    ))
+                    return
                 
-                for page_num in range(total_pages):
-                    try:
-                        # Extraer texto de la página
-                        text = self.extract_text_from_pdf(input_path, page_num)
-                        worker_name = self.extract_worker_name(text)
-                        
-                        if worker_name:
-                            # Crear nombre de archivo
-                            clean_name = self.clean_filename(worker_name)
-                            filename = f"{clean_name}.pdf"
-                            output_path = os.path.join(output_folder, filename)
-                            
-                            # Evitar duplicados
-                            counter = 1
-                            while os.path.exists(output_path):
-                                filename = f"{clean_name}_{counter:03d}.pdf"
-                                output_path = os.path.join(output_folder, filename)
-                                counter += 1
-                            
-                            # Crear PDF con solo esta página
-                            pdf_writer = PyPDF2.PdfWriter()
-                            pdf_writer.add_page(pdf_reader.pages[page_num])
-                            
-                            with open(output_path, 'wb') as output_file:
-                                pdf_writer.write(output_file)
-                            
-                            results.append(ProcessResult(
-                                original_file=f"{os.path.basename(input_path)} - Página {page_num + 1}",
-                                success=True,
-                                new_name=filename,
-                                worker_name=worker_name,
-                                pages_processed=1
-                            ))
-                        else:
-                            # No se pudo extraer nombre
-                            filename = f"Pagina_{page_num + 1:03d}.pdf"
-                            output_path = os.path.join(output_folder, filename)
-                            
-                            pdf_writer = PyPDF2.PdfWriter()
-                            pdf_writer.add_page(pdf_reader.pages[page_num])
-                            
-                            with open(output_path, 'wb') as output_file:
-                                pdf_writer.write(output_file)
-                            
-                            results.append(ProcessResult(
-                                original_file=f"{os.path.basename(input_path)} - Página {page_num + 1}",
-                                success=False,
-                                new_name=filename,
-                                error="No se pudo extraer nombre del trabajador",
-                                pages_processed=1
-                            ))
-                            
-                    except Exception as e:
-                        results.append(ProcessResult(
-                            original_file=f"{os.path.basename(input_path)} - Página {page_num + 1}",
-                            success=False,
-                            error=f"Error procesando página: {str(e)}",
-                            pages_processed=1
-                        ))
+                # Páginas ya separadas en una ejecución anterior interrumpida
+                start_page = 0
+                source = None
+                if journal is not None:
+                    source = journal.source_stat(input_path)
+                    while start_page < total_pages:
+                        replayed = journal.completed(f"page:{start_page}", source)
+                        if replayed is None:
+                            break
+                        yield replayed
+                        start_page += 1
+                
+                # Con varios procesos, los nombres se detectan en paralelo y
+                # aquí solo se escriben las páginas en orden
+                if plan is not None and plan.page_count == total_pages:
+                    page_names = self._iter_planned_page_names(plan, start_page)
+                else:
+                    page_names = self.iter_page_worker_names(input_path, session, total_pages, start_page)
+                
+                try:
+                    yield from self._write_separated_pages(
+                        input_path, output_folder, session, page_names, doc_timer,
+                        start_page, journal, source
+                    )
+                finally:
+                    page_names.close()
         
         except Exception as e:
-            results.append(ProcessResult(
+            yield ProcessResult(
                 original_file=os.path.basename(input_path),
                 success=False,
                 error=f"Error abriendo archivo: {str(e)}"
-            ))
+            )
+    
+    def _write_separated_pages(self, input_path: str, output_folder: str, session: PDFDocumentSession,
+                               page_names: Iterator[Tuple[Optional[str], StageTimer]],
+                               doc_timer: Optional[StageTimer] = None, start_page: int = 0,
+                               journal: Optional['JobJournal'] = None,
+                               source: Optional[Tuple[int, int]] = None) -> Iterator[ProcessResult]:
+        """
+        Escribe cada página como un PDF independiente usando los nombres ya detectados
         
-        return results
+        Args:
+            input_path: Ruta del PDF multi-página
+            output_folder: Carpeta donde guardar los archivos separados
+            session: Sesión abierta del documento
+            page_names: Nombre del trabajador de cada página y tiempos de su detección, en orden
+            doc_timer: Tiempos de apertura del documento (se suman a la primera página)
+            start_page: Primera página a escribir (las anteriores ya estaban hechas)
+            journal: Diario del trabajo donde anotar cada página escrita
+            source: Huella del PDF de entrada para el diario
+            
+        Yields:
+            Resultado de cada página, en orden
+        """
+        for page_num, (worker_name, timer) in enumerate(page_names, start_page):
+            if page_num == start_page and doc_timer is not None:
+                timer.merge(doc_timer)
+            
+            unit = f"page:{page_num}"
+            if journal is not None:
+                replayed = journal.completed(unit, source)
+                if replayed is not None:
+                    yield replayed
+                    continue
+            
+            try:
+                if worker_name:
+                    with timer.stage(STAGE_WRITE):
+                        # Reservar un nombre libre (evita duplicados)
+                        clean_name = self.clean_filename(worker_name)
+                        output_path = self.claim_output_path(output_folder, clean_name, ".pdf")
+                        filename = os.path.basename(output_path)
+                        
+                        # Crear PDF con solo esta página
+                        if journal is not None:
+                            journal.start(unit, output_path)
+                        try:
+                            session.write_page(page_num, output_path)
+                        except Exception:
+                            self.release_output_path(output_path)
+                            raise
+                        timer.bytes_written += os.path.getsize(output_path)
+                    
+                    result = timer.apply(ProcessResult(
+                        original_file=f"{os.path.basename(input_path)} - Página {page_num + 1}",
+                        success=True,
+                        new_name=filename,
+                        worker_name=worker_name,
+                        pages_processed=1
+                    ))
+                else:
+                    # No se pudo extraer nombre: Pagina_NNN, sin pisar las de otro PDF en la misma carpeta
+                    with timer.stage(STAGE_WRITE):
+                        output_path = self.claim_output_path(output_folder, self.unnamed_page_name(page_num), ".pdf")
+                        filename = os.path.basename(output_path)
+                        
+                        if journal is not None:
+                            journal.start(unit, output_path)
+                        try:
+                            session.write_page(page_num, output_path)
+                        except Exception:
+                            self.release_output_path(output_path)
+                            raise
+                        timer.bytes_written += os.path.getsize(output_path)
+                    
+                    result = timer.apply(ProcessResult(
+                        original_file=f"{os.path.basename(input_path)} - Página {page_num + 1}",
+                        success=False,
+                        new_name=filename,
+                        error="No se pudo extraer nombre del trabajador",
+                        pages_processed=1
+                    ))
+                
+                if journal is not None:
+                    journal.finish(unit, result, output_path, source)
+                yield result
+                    
+            except Exception as e:
+                yield timer.apply(ProcessResult(
+                    original_file=f"{os.path.basename(input_path)} - Página {page_num + 1}",
+                    success=False,
+                    error=f"Error procesando página: {str(e)}",
+                    pages_processed=1
+                ))
     
-    def rename_single_pdf(self, input_path: str, output_folder: str = None) -> ProcessResult:
+    @staticmethod
+    def unnamed_page_name(page_num: int) -> str:
         """
-        Renombra un PDF individual basado en el contenido
+        Nombre base del archivo de una página sin trabajador detectado
+        
+        Se reserva como los demás (claim_output_path): si ya existe, se numera _001, _002...
         
         Args:
-            input_path: Ruta del PDF a renombrar
-            output_folder: Carpeta de destino (opcional, usa la misma carpeta si es None)
+            page_num: Número de página (0-indexed)
+        """
+        return f"Pagina_{page_num + 1:03d}"
+    
+    @staticmethod
+    def _iter_planned_page_names(plan: 'JobPlan', start_page: int) -> Iterator[Tuple[Optional[str], StageTimer]]:
+        """Nombres de cada página tomados del plan, con el mismo formato que iter_page_worker_names"""
+        for worker_name in plan.page_names()[start_page:]:
+            yield worker_name, StageTimer()
+    
+    def iter_page_worker_names(self, input_path: str, session: PDFDocumentSession, total_pages: int,
+                                start_page: int = 0, known: Optional[Dict[int, Optional[str]]] = None
+                                ) -> Iterator[Tuple[Optional[str], StageTimer]]:
+        """
+        Detecta el trabajador de cada página, en paralelo si hay varios procesos
+        
+        Args:
+            input_path: Ruta del PDF multi-página
+            session: Sesión abierta del documento (para el modo secuencial)
+            total_pages: Número total de páginas
+            start_page: Primera página a analizar
+            known: Nombres ya detectados de algunas páginas {página: nombre o None} (no se vuelven a buscar)
+            
+        Yields:
+            Nombre del trabajador (o None) de cada página desde start_page y tiempos de su detección, en orden
+        """
+        known = known or {}
+        next_page = start_page
+        lookup_timer = StageTimer()
+        with lookup_timer.stage(STAGE_EXTRACT):
+            file_key = self.cache_key(input_path)
+        
+        # Documento ya procesado con estos patrones: no hace falta extraer texto
+        if file_key is not None:
+            with lookup_timer.stage(STAGE_MATCH):
+                for page_num, worker_name in known.items():
+                    self.cache.set_name(file_key, page_num, self.name_version, worker_name)
+                cached_names = self.cache.get_names(file_key, self.name_version)
+            if all(page_num in cached_names for page_num in range(start_page, total_pages)):
+                for page_num in range(start_page, total_pages):
+                    yield cached_names[page_num] or None, lookup_timer if page_num == start_page else StageTimer()
+                return
+        
+        if self.max_workers > 1 and total_pages - start_page >= MIN_PAGES_FOR_PARALLEL:
+            cache_path = None
+            if self.cache is not None:
+                # Liberar la base de datos para que los procesos puedan escribir
+                self.cache.flush()
+                cache_path = self.cache.db_path
+            try:
+                for page_num, worker_name, durations in iter_page_names(
+                        input_path, total_pages, self.max_workers, cache_path, file_key, start_page,
+                        self.extraction, known):
+                    timer = StageTimer(durations)
+                    if page_num == start_page:
+                        timer.merge(lookup_timer)
+                    yield worker_name, timer
+                    next_page = page_num + 1
+            except Exception:
+                # Si el pool falla (p. ej. sin soporte de multiprocessing) seguir en secuencial
+                pass
+        
+        for page_num in range(next_page, total_pages):
+            timer = lookup_timer if page_num == start_page else StageTimer()
+            if page_num in known:
+                yield known[page_num], timer
+                continue
+            worker_name = self.detect_page_worker_name(input_path, page_num, session, file_key, timer)
+            yield worker_name, timer
+    
+    def analyze_single_pdf(self, input_path: str, timer: Optional[StageTimer] = None) -> ProcessResult:
+        """
+        Detecta el trabajador de un PDF individual sin copiar ni renombrar nada
+        
+        Args:
+            input_path: Ruta del PDF a analizar
+            timer: Medidor donde sumar los tiempos de cada etapa
             
         Returns:
-            Resultado del procesamiento
+            Resultado con worker_name si se detectó, o con el error correspondiente
         """
+        timer = timer or StageTimer()
+        return timer.apply(self._analyze_single_pdf(input_path, timer))
+    
+    def _analyze_single_pdf(self, input_path: str, timer: StageTimer) -> ProcessResult:
+        """Detección del trabajador de un PDF individual (ver analyze_single_pdf)"""
         try:
             # Validar archivo
             if not os.path.exists(input_path) or not input_path.lower().endswith('.pdf'):
@@ -225,16 +718,32 @@ class PDFProcessor:
                     error="Archivo no válido o no es PDF"
                 )
             
-            # Extraer texto y nombre
-            text = self.extract_text_from_pdf(input_path)
-            if not text.strip():
+            # Nombre ya detectado en una ejecución anterior
+            with timer.stage(STAGE_EXTRACT):
+                file_key = self.cache_key(input_path)
+            worker_name = MISSING
+            if file_key is not None:
+                with timer.stage(STAGE_MATCH):
+                    worker_name = self.cache.get_name(file_key, 0, self.name_version)
+            
+            # Los PDFs sin nombre o sin texto también se guardan: no se vuelven a leer
+            if worker_name is MISSING:
+                # Extraer texto y nombre
+                worker_name, has_text = self._match_page(input_path, 0, None, file_key, timer)
+                if not has_text:
+                    worker_name = NO_TEXT
+                
+                if file_key is not None:
+                    with timer.stage(STAGE_MATCH):
+                        self.cache.set_name(file_key, 0, self.name_version, worker_name)
+            
+            if worker_name == NO_TEXT:
                 return ProcessResult(
                     original_file=os.path.basename(input_path),
                     success=False,
                     error="No se pudo extraer texto del PDF"
                 )
             
-            worker_name = self.extract_worker_name(text)
             if not worker_name:
                 return ProcessResult(
                     original_file=os.path.basename(input_path),
@@ -242,43 +751,167 @@ class PDFProcessor:
                     error="No se pudo extraer nombre del trabajador"
                 )
             
-            # Determinar carpeta de salida
-            if output_folder is None:
-                output_folder = os.path.dirname(input_path)
-            else:
-                os.makedirs(output_folder, exist_ok=True)
+            return ProcessResult(
+                original_file=os.path.basename(input_path),
+                success=True,
+                worker_name=worker_name
+            )
             
-            # Crear nuevo nombre
-            clean_name = self.clean_filename(worker_name)
-            extension = Path(input_path).suffix
+        except Exception as e:
+            return ProcessResult(
+                original_file=os.path.basename(input_path),
+                success=False,
+                error=f"Error procesando archivo: {str(e)}"
+            )
+    
+    def output_names(self, output_folder: str) -> OutputNameIndex:
+        """
+        Índice de nombres ocupados de una carpeta de salida
+        
+        La carpeta se lee la primera vez y después los nombres se asignan en
+        memoria, sin consultar el disco por cada sufijo probado.
+        
+        Args:
+            output_folder: Carpeta de destino
             
-            new_filename = f"{clean_name}{extension}"
-            output_path = os.path.join(output_folder, new_filename)
+        Returns:
+            Índice compartido por todas las escrituras de este procesador en la carpeta
+        """
+        key = os.path.normcase(os.path.abspath(output_folder))
+        index = self._output_names.get(key)
+        if index is None:
+            index = OutputNameIndex(output_folder)
+            self._output_names[key] = index
+        return index
+    
+    def claim_output_path(self, output_folder: str, clean_name: str, extension: str) -> str:
+        """
+        Reserva un nombre libre agregando sufijos _001, _002... y crea el archivo vacío
+        
+        La creación es exclusiva (O_EXCL): otro proceso escribiendo en la misma
+        carpeta nunca recibe el mismo nombre.
+        
+        Args:
+            output_folder: Carpeta de destino
+            clean_name: Nombre base ya limpio
+            extension: Extensión del archivo (con punto)
+            
+        Returns:
+            Ruta reservada, lista para escribir
+        """
+        return self.output_names(output_folder).claim(clean_name, extension)
+    
+    def release_output_path(self, output_path: str):
+        """
+        Borra una ruta reservada con claim_output_path que no llegó a escribirse
+        
+        Args:
+            output_path: Ruta reservada
+        """
+        key = os.path.normcase(os.path.abspath(os.path.dirname(output_path)))
+        index = self._output_names.get(key)
+        if index is not None:
+            index.release(output_path)
+        
+    def rename_single_pdf(self, input_path: str, output_folder: str = None) -> ProcessResult:
+        """
+        Renombra un PDF individual basado en el contenido
+        
+        Args:
+            input_path: Ruta del PDF a renombrar
+            output_folder: Carpeta de destino (opcional, usa la misma carpeta si es None)
             
-            # Evitar sobreescribir
-            counter = 1
-            while os.path.exists(output_path):
-                new_filename = f"{clean_name}_{counter:03d}{extension}"
-                output_path = os.path.join(output_folder, new_filename)
-                counter += 1
+        Returns:
+            Resultado del procesamiento
+        """
+        timer = StageTimer()
+        result = self.analyze_single_pdf(input_path, timer)
+        if not result.success:
+            return result
+        
+        try:
+            with timer.stage(STAGE_WRITE):
+                # Determinar carpeta de salida
+                if output_folder is None:
+                    output_folder = os.path.dirname(input_path)
+                else:
+                    os.makedirs(output_folder, exist_ok=True)
+                
+                # Reservar nuevo nombre
+                clean_name = self.clean_filename(result.worker_name)
+                extension = Path(input_path).suffix
+                output_path = self.claim_output_path(output_folder, clean_name, extension)
             
             # Copiar archivo con nuevo nombre
-            shutil.copy2(input_path, output_path)
+            return self.copy_renamed_pdf(input_path, output_path, result.worker_name, timer)
             
-            return ProcessResult(
+        except Exception as e:
+            return timer.apply(ProcessResult(
+                original_file=os.path.basename(input_path),
+                success=False,
+                error=f"Error procesando archivo: {str(e)}"
+            ))
+    
+    def copy_renamed_pdf(self, input_path: str, output_path: str, worker_name: str,
+                         timer: Optional[StageTimer] = None) -> ProcessResult:
+        """
+        Copia (o enlaza/mueve, según self.transfer) un PDF a su ruta de destino ya resuelta
+        
+        Args:
+            input_path: Ruta del PDF original
+            output_path: Ruta final (reservada con claim_output_path)
+            worker_name: Nombre del trabajador detectado
+            timer: Medidor con los tiempos del análisis (se le suma la escritura)
+            
+        Returns:
+            Resultado del procesamiento
+        """
+        timer = timer or StageTimer()
+        try:
+            with timer.stage(STAGE_WRITE):
+                used = self.transfer_file(input_path, output_path, timer)
+            
+            return timer.apply(ProcessResult(
                 original_file=os.path.basename(input_path),
                 success=True,
-                new_name=new_filename,
+                new_name=os.path.basename(output_path),
                 worker_name=worker_name,
-                pages_processed=1
-            )
+                pages_processed=1,
+                transfer_fallback=used != self.transfer
+            ))
             
         except Exception as e:
-            return ProcessResult(
+            # No dejar el archivo vacío reservado
+            self.release_output_path(output_path)
+            return timer.apply(ProcessResult(
                 original_file=os.path.basename(input_path),
                 success=False,
                 error=f"Error procesando archivo: {str(e)}"
-            )
+            ))
+    
+    def transfer_file(self, source_path: str, destination_path: str, timer: StageTimer) -> str:
+        """
+        Lleva un archivo a su destino con la estrategia del procesador (copia normal si no es posible)
+        
+        Args:
+            source_path: Archivo de origen
+            destination_path: Ruta de destino (se sobrescribe si existe)
+            timer: Medidor al que sumar los bytes copiados
+            
+        Returns:
+            Estrategia usada realmente (TRANSFER_COPY si se tuvo que copiar: sus bytes sí se cuentan)
+        """
+        used = transfer_file(source_path, destination_path, self.transfer)
+        if used not in METADATA_ONLY:
+            size = os.path.getsize(destination_path)
+            timer.bytes_read += size
+            timer.bytes_written += size
+        return used
+    
+    @property
+    def moves_inputs(self) -> bool:
+        """La estrategia de transferencia quita los originales (el diario debe poder devolverlos)"""
+        return self.transfer == TRANSFER_MOVE
     
     def get_summary(self, results: List[ProcessResult]) -> Dict:
         """
@@ -290,55 +923,70 @@ class PDFProcessor:
         Returns:
             Diccionario con estadísticas del procesamiento
         """
-        if not results:
-            return {
-                'total_processed': 0,
-                'successful': 0,
-                'failed': 0,
-                'success_rate': 0.0,
-                'workers_found': 0,
-                'total_pages': 0
-            }
-        
-        successful = [r for r in results if r.success]
-        failed = [r for r in results if not r.success]
-        
-        # Obtener trabajadores únicos
-        unique_workers = set()
-        for result in successful:
-            if result.worker_name:
-                unique_workers.add(result.worker_name)
-        
-        return {
-            'total_processed': len(results),
-            'successful': len(successful),
-            'failed': len(failed),
-            'success_rate': (len(successful) / len(results) * 100) if results else 0,
-            'workers_found': len(unique_workers),
-            'total_pages': sum(r.pages_processed for r in results if r.pages_processed)
-        }
+        summary = ResultSummary()
+        summary.add_all(results or [])
+        return summary.as_dict(percentiles=True)
     
-    def organize_by_worker(self, source_folder: str, output_folder: str) -> List[ProcessResult]:
+    def organize_by_worker(self, source_folder: str, output_folder: str,
+                           journal: Optional['JobJournal'] = None,
+                           plan: Optional['JobPlan'] = None) -> List[ProcessResult]:
         """
         Organiza documentos ya procesados agrupándolos por trabajador
         
         Args:
             source_folder: Carpeta padre que contiene subcarpetas procesadas
             output_folder: Carpeta donde crear las carpetas por trabajador
+            journal: Diario del trabajo para reanudar si se interrumpió
+            plan: Plan vigente con los documentos de cada trabajador (no se vuelven a escanear las carpetas)
             
         Returns:
             Lista de resultados del procesamiento
         """
-        results = []
+        return list(self.iter_organize_by_worker(source_folder, output_folder, journal, plan))
+    
+    def scan_processed_folders(self, source_folder: str) -> List[ProcessedFolder]:
+        """
+        Busca las subcarpetas de documentos ya procesados
+        
+        Los listados se comparten (folder_scans): validar, previsualizar y
+        organizar la misma carpeta solo la recorre una vez mientras no cambie.
+        
+        Args:
+            source_folder: Carpeta padre que contiene subcarpetas procesadas
+            
+        Returns:
+            Subcarpetas de tipo reconocido (por su nombre) con los PDFs que contienen
+        """
+        return folder_scans.processed_folders(source_folder, self.detect_document_type)
+    
+    def iter_organize_by_worker(self, source_folder: str, output_folder: str,
+                                journal: Optional['JobJournal'] = None,
+                                plan: Optional['JobPlan'] = None) -> Iterator[ProcessResult]:
+        """
+        Organiza documentos por trabajador entregando cada resultado en cuanto se copia
+        
+        Con sincronización incremental (self.sync) los documentos cuyo destino
+        ya está al día no se copian y se entregan con skipped=True; en ese
+        modo decide el manifiesto y el diario solo protege las copias en curso.
         
+        Args:
+            source_folder: Carpeta padre que contiene subcarpetas procesadas
+            output_folder: Carpeta donde crear las carpetas por trabajador
+            journal: Diario del trabajo: los documentos ya copiados se saltan
+            plan: Plan vigente con los documentos de cada trabajador (no se vuelven a escanear las carpetas)
+            
+        Yields:
+            Resultado de cada documento copiado (o del trabajador que falló)
+        """
         try:
             # Validar que la carpeta fuente existe
             if not os.path.exists(source_folder):
-                return [ProcessResult(
+                yield ProcessResult(
                     original_file=source_folder,
                     success=False,
                     error="La carpeta fuente no existe"
-                )]
+                )
+                return
             
             # Crear carpeta de salida
             os.makedirs(output_folder, exist_ok=True)
@@ -346,67 +994,237 @@ class PDFProcessor:
             # Buscar subcarpetas con PDFs procesados
             worker_docs = {}  # {worker_name: {doc_type: file_path}}
             
-            # Escanear subcarpetas
-            for item in os.listdir(source_folder):
-                subfolder_path = os.path.join(source_folder, item)
-                
-                if not os.path.isdir(subfolder_path):
-                    continue
-                
-                # Detectar tipo de documento por nombre de carpeta
-                doc_type = self.detect_document_type(item)
-                if not doc_type:
-                    continue
-                
-                # Buscar PDFs en la subcarpeta
-                pdf_files = [f for f in os.listdir(subfolder_path) if f.lower().endswith('.pdf')]
-                
-                for pdf_file in pdf_files:
-                    worker_name = self.extract_worker_name_from_filename(pdf_file)
-                    
-                    if worker_name:
-                        if worker_name not in worker_docs:
-                            worker_docs[worker_name] = {}
-                        
-                        worker_docs[worker_name][doc_type] = os.path.join(subfolder_path, pdf_file)
-            
-            # Crear carpetas por trabajador y organizar documentos
-            for worker_name, documents in worker_docs.items():
-                try:
-                    # Crear carpeta del trabajador
-                    worker_folder = os.path.join(output_folder, worker_name)
-                    os.makedirs(worker_folder, exist_ok=True)
-                    
-                    # Copiar documentos con nuevo nombre
-                    for doc_type, source_path in documents.items():
-                        new_filename = f"{worker_name}_{doc_type}.pdf"
-                        destination_path = os.path.join(worker_folder, new_filename)
-                        
-                        shutil.copy2(source_path, destination_path)
-                        
-                        results.append(ProcessResult(
-                            original_file=os.path.basename(source_path),
-                            success=True,
-                            new_name=new_filename,
-                            worker_name=worker_name,
-                            pages_processed=1
-                        ))
+            if plan is not None:
+                worker_docs = plan.worker_documents()
+            else:
+                for folder in self.scan_processed_folders(source_folder):
+                    for pdf_file in folder.pdf_files:
+                        worker_name = self.extract_worker_name_from_filename(pdf_file.name)
                         
-                except Exception as e:
-                    results.append(ProcessResult(
-                        original_file=f"Documentos de {worker_name}",
-                        success=False,
-                        error=f"Error organizando trabajador: {str(e)}"
-                    ))
+                        if worker_name:
+                            if worker_name not in worker_docs:
+                                worker_docs[worker_name] = {}
+                            
+                            worker_docs[worker_name][folder.doc_type] = pdf_file.path
             
-            return results
+            # Crear todas las carpetas por trabajador de una vez y copiar los documentos en paralelo
+            folder_errors = self._create_worker_folders(output_folder, worker_docs)
+            for worker_name, error in folder_errors.items():
+                yield self._worker_error(worker_name, error)
             
+            manifest = open_sync_manifest(output_folder, source_folder) if self.sync.incremental else None
+            try:
+                yield from self._iter_organize_copies(
+                    [(worker_name, documents) for worker_name, documents in worker_docs.items()
+                     if worker_name not in folder_errors],
+                    output_folder, journal, manifest
+                )
+            finally:
+                # También al cancelar: lo ya sincronizado no se vuelve a comprobar a fondo
+                if manifest is not None:
+                    try:
+                        manifest.save()
+                    except OSError:
+                        pass
+        
         except Exception as e:
-            return [ProcessResult(
+            yield ProcessResult(
                 original_file=source_folder,
                 success=False,
                 error=f"Error organizando por trabajador: {str(e)}"
-            )]
+            )
+    
+    @staticmethod
+    def _create_worker_folders(output_folder: str, worker_names: Iterable[str]) -> Dict[str, str]:
+        """
+        Crea las carpetas de los trabajadores que aún no existen, en una sola pasada
+        
+        La carpeta de salida se lista una vez, así que las carpetas que ya
+        existen no cuestan ninguna consulta más.
+        
+        Args:
+            output_folder: Carpeta donde crear las carpetas por trabajador
+            worker_names: Nombres de los trabajadores
+            
+        Returns:
+            Error de cada trabajador cuya carpeta no se pudo crear: {trabajador: error}
+        """
+        with os.scandir(output_folder) as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+        
+        errors = {}
+        for worker_name in worker_names:
+            if worker_name in existing:
+                continue
+            try:
+                os.makedirs(os.path.join(output_folder, worker_name), exist_ok=True)
+            except OSError as e:
+                errors[worker_name] = str(e)
+        return errors
+    
+    @staticmethod
+    def _worker_error(worker_name: str, error: str) -> ProcessResult:
+        """Resultado de un trabajador cuyos documentos no se pudieron organizar"""
+        return ProcessResult(
+            original_file=f"Documentos de {worker_name}",
+            success=False,
+            error=f"Error organizando trabajador: {error}"
+        )
+    
+    def _iter_organize_copies(self, worker_docs: Iterable[Tuple[str, Dict[str, str]]], output_folder: str,
+                              journal: Optional['JobJournal'] = None,
+                              manifest: Optional[SyncManifest] = None) -> Iterator[ProcessResult]:
+        """
+        Copia los documentos de cada trabajador con un pool de hilos acotado
+        
+        El diario y el manifiesto se consultan y se anotan solo desde este
+        hilo; los hilos del pool solo comprueban y copian. Si un documento
+        falla, los de ese trabajador que aún no se habían encolado se saltan y
+        se informa un único error del trabajador; los demás trabajadores no se
+        ven afectados.
+        
+        Args:
+            worker_docs: (trabajador, {tipo: ruta}) de cada trabajador, con su carpeta ya creada
+            output_folder: Carpeta con las carpetas por trabajador
+            journal: Diario del trabajo: los documentos ya copiados se saltan
+            manifest: Manifiesto de sincronización incremental: primero se comprueba
+                      en el pool si el destino ya está al día y solo se copia si no
+            
+        Yields:
+            Resultado de cada documento copiado, sin cambios (skipped) o del trabajador que falló,
+            en orden de finalización
+        """
+        max_in_flight = ORGANIZE_COPY_THREADS * COPIES_IN_FLIGHT_PER_THREAD
+        # Tarea en curso → (tarea, trabajador, unidad del diario, origen, destino, estado del origen)
+        tasks: Dict[Future, Tuple[str, str, str, str, str, Optional[Tuple[int, int]]]] = {}
+        failed_workers: Set[str] = set()
+        documents = (
+            (worker_name, doc_type, source_path)
+            for worker_name, worker_documents in worker_docs
+            for doc_type, source_path in worker_documents.items()
+        )
+        exhausted = False
+        
+        def submit_copy(worker_name: str, unit: str, source_path: str, destination_path: str,
+                        source: Optional[Tuple[int, int]] = None):
+            if journal is not None:
+                source = source or journal.source_stat(source_path)
+                journal.start(unit, destination_path, source_path, self.moves_inputs)
+            future = copy_pool.submit(
+                self._copy_worker_document, source_path, destination_path, worker_name, manifest
+            )
+            tasks[future] = (SYNC_TASK_COPY, worker_name, unit, source_path, destination_path, source)
+        
+        copy_pool = ThreadPoolExecutor(max_workers=ORGANIZE_COPY_THREADS)
+        try:
+            while True:
+                # Mantener el pool lleno sin encolar todos los documentos de golpe
+                while not exhausted and len(tasks) < max_in_flight:
+                    document = next(documents, None)
+                    if document is None:
+                        exhausted = True
+                        break
+                    worker_name, doc_type, source_path = document
+                    if worker_name in failed_workers:
+                        continue
+                    
+                    destination_path = os.path.join(output_folder, worker_name, f"{worker_name}_{doc_type}.pdf")
+                    unit = f"doc:{worker_name}/{doc_type}"
+                    if manifest is not None:
+                        future = copy_pool.submit(
+                            manifest.check, source_path, destination_path, self.sync.verify_hash
+                        )
+                        tasks[future] = (SYNC_TASK_CHECK, worker_name, unit, source_path, destination_path, None)
+                        continue
+                    source = None
+                    if journal is not None:
+                        source = journal.source_stat(source_path)
+                        replayed = journal.completed(unit, source)
+                        if replayed is not None:
+                            yield replayed
+                            continue
+                    submit_copy(worker_name, unit, source_path, destination_path, source)
+                
+                if not tasks:
+                    return
+                
+                done, _ = wait(tasks, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task, worker_name, unit, source_path, destination_path, source = tasks.pop(future)
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        if worker_name not in failed_workers:
+                            failed_workers.add(worker_name)
+                            yield self._worker_error(worker_name, str(e))
+                        continue
+                    
+                    if task == SYNC_TASK_CHECK:
+                        if outcome is None:
+                            if worker_name not in failed_workers:
+                                submit_copy(worker_name, unit, source_path, destination_path)
+                            continue
+                        manifest.record(destination_path, outcome)
+                        yield ProcessResult(
+                            original_file=os.path.basename(source_path),
+                            success=True,
+                            new_name=os.path.basename(destination_path),
+                            worker_name=worker_name,
+                            skipped=True
+                        )
+                        continue
+                    
+                    result, entry = outcome
+                    if entry is not None:
+                        manifest.record(destination_path, entry)
+                    if journal is not None:
+                        journal.finish(unit, result, destination_path, source)
+                    yield result
+        finally:
+            # Al cancelar (cierre del generador) las tareas encoladas se descartan y las que
+            # están en curso terminan: anotarlas para que no parezcan interrumpidas
+            copy_pool.shutdown(wait=True, cancel_futures=True)
+            self._settle_organize_tasks(tasks, journal, manifest)
+    
+    @staticmethod
+    def _settle_organize_tasks(tasks: Dict[Future, Tuple[str, str, str, str, str, Optional[Tuple[int, int]]]],
+                               journal: Optional['JobJournal'] = None,
+                               manifest: Optional[SyncManifest] = None):
+        """Anotar en el diario y en el manifiesto las tareas que terminaron tras cancelar"""
+        for future, (task, _, unit, _, destination_path, source) in tasks.items():
+            if future.cancelled() or future.exception() is not None or future.result() is None:
+                continue
+            if task == SYNC_TASK_CHECK:
+                manifest.record(destination_path, future.result())
+                continue
+            result, entry = future.result()
+            if entry is not None:
+                manifest.record(destination_path, entry)
+            if journal is not None:
+                journal.finish(unit, result, destination_path, source)
+        tasks.clear()
+    
+    def _copy_worker_document(self, source_path: str, destination_path: str, worker_name: str,
+                              manifest: Optional[SyncManifest] = None) -> Tuple[ProcessResult, Optional[dict]]:
+        """
+        Copiar un documento a la carpeta de su trabajador (se ejecuta en un hilo del pool)
+        
+        Returns:
+            Resultado de la copia y, si hay manifiesto, la entrada a anotar en él
+        """
+        timer = StageTimer()
+        with timer.stage(STAGE_WRITE):
+            used = self.transfer_file(source_path, destination_path, timer)
+        
+        result = timer.apply(ProcessResult(
+            original_file=os.path.basename(source_path),
+            success=True,
+            new_name=os.path.basename(destination_path),
+            worker_name=worker_name,
+            pages_processed=1,
+            transfer_fallback=used != self.transfer
+        ))
+        return result, manifest.copied(source_path, destination_path) if manifest is not None else None
     
     def detect_document_type(self, folder_name: str) -> Optional[str]:
         """
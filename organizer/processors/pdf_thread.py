@@ -1,11 +1,20 @@
 """
 Threading para procesamiento de PDFs sin bloquear la interfaz de usuario
 """
-import os
-from typing import List
+import time
+from typing import Callable, Iterator, List, Optional, Union
 from PySide6.QtCore import QThread, Signal
 
+from .block_extraction import DEFAULT_EXTRACTION
+from .discovery import DiscoveryOptions
+from .job_journal import open_job_journal
+from .job_plan import JobPlan, JobPlanner
 from .pdf_processor import PDFProcessor, ProcessResult
+from .preview import iter_preview_lines
+from .rename_engine import ConcurrentRenamer
+from .sync_manifest import SyncOptions
+from .transfer import DEFAULT_TRANSFER
+from ..utils.cache import open_extraction_cache
 
 
 class PDFProcessorThread(QThread):
@@ -15,18 +24,29 @@ class PDFProcessorThread(QThread):
     Signals:
         progress: Progreso del procesamiento (0-100)
         status_update: Actualización del estado actual
-        result_ready: Resultados listos (List[ProcessResult])
+        results_batch: Lote de resultados nuevos durante el proceso (List[ProcessResult])
+        result_ready: Resultados completos al finalizar (List[ProcessResult])
         finished_processing: Procesamiento completado
         error_occurred: Error durante el procesamiento
     """
     
     progress = Signal(int)
     status_update = Signal(str)
+    results_batch = Signal(list)  # List[ProcessResult]
     result_ready = Signal(list)  # List[ProcessResult]
     finished_processing = Signal()
     error_occurred = Signal(str)
     
-    def __init__(self, source_path: str, output_folder: str, process_type: str):
+    # Un lote se envía al reunir este número de resultados...
+    RESULT_BATCH_SIZE = 50
+    # ...o al pasar este tiempo (segundos) desde el último envío
+    RESULT_BATCH_INTERVAL = 0.5
+    
+    def __init__(self, source_path: str, output_folder: str, process_type: str,
+                 max_workers: int = 1, use_cache: bool = False, resume: bool = False,
+                 transfer: str = DEFAULT_TRANSFER, discovery: DiscoveryOptions = DiscoveryOptions(),
+                 sync: SyncOptions = SyncOptions(), extraction: str = DEFAULT_EXTRACTION,
+                 plan: Optional[JobPlan] = None):
         """
         Inicializar el hilo de procesamiento
         
@@ -34,13 +54,29 @@ class PDFProcessorThread(QThread):
             source_path: Ruta del archivo o carpeta fuente
             output_folder: Carpeta de salida
             process_type: Tipo de procesamiento ('separate', 'rename' o 'organize')
+            max_workers: Procesos en paralelo para separar y renombrar PDFs
+            use_cache: Reutilizar texto y nombres extraídos en ejecuciones anteriores
+            resume: Llevar un diario del trabajo y saltar lo ya completado si se repite
+            transfer: Cómo llevar los archivos al destino al renombrar y organizar (ver TRANSFER_STRATEGIES)
+            discovery: Qué archivos se renombran (subcarpetas y patrones de inclusión y exclusión)
+            sync: Al organizar, saltar los documentos cuyo destino ya está al día
+            extraction: Cómo leer el texto para buscar el nombre (ver EXTRACTION_MODES)
+            plan: Plan calculado en la vista previa; si sigue vigente no se vuelven a analizar los PDFs
         """
         super().__init__()
         self.source_path = source_path
         self.output_folder = output_folder
         self.process_type = process_type
-        self.processor = PDFProcessor()
+        self.max_workers = max_workers
+        self.cache = open_extraction_cache() if use_cache else None
+        self.processor = PDFProcessor(max_workers=max_workers, cache=self.cache, transfer=transfer,
+                                      discovery=discovery, sync=sync, extraction=extraction)
+        self.resume = resume
+        self.journal = None
+        self.plan = plan
         self._is_cancelled = False
+        self._pending_results: List[ProcessResult] = []
+        self._last_batch_time = 0.0
     
     def cancel(self):
         """Cancelar el procesamiento"""
@@ -53,6 +89,21 @@ class PDFProcessorThread(QThread):
                 return
                 
             results = []
+            self._pending_results = []
+            self._last_batch_time = time.monotonic()
+            
+            # Antes de abrir el diario: crear la carpeta de salida puede cambiar la de entrada
+            self._check_plan()
+            
+            if self.resume and self.process_type in ("separate", "rename", "organize"):
+                self.journal = open_job_journal(self.output_folder, self.process_type, self.source_path)
+            
+            # Mostrar primero lo que el diario borró o devolvió del intento interrumpido
+            discarded = []
+            if self.journal is not None:
+                for result in self.journal.discarded:
+                    self._collect_result(result, discarded)
+                self._flush_results()
             
             if self.process_type == "separate":
                 results = self._process_separate()
@@ -65,23 +116,115 @@ class PDFProcessorThread(QThread):
                 return
             
             if not self._is_cancelled:
-                self.result_ready.emit(results)
+                self._flush_results()
+                self.result_ready.emit(discarded + results)
                 self.finished_processing.emit()
                 
         except Exception as e:
             self.error_occurred.emit(f"Error durante el procesamiento: {str(e)}")
+        
+        finally:
+            self._close_journal()
+            self._close_cache()
+    
+    def _check_plan(self):
+        """Descartar el plan si ya no corresponde a la entrada (se procesa analizando de nuevo)"""
+        if self.plan is None:
+            return
+        reason = self.plan.invalid_reason(
+            self.process_type, self.source_path, self.output_folder, self.processor.name_version
+        )
+        if reason is not None:
+            self.status_update.emit(f"Plan de la vista previa descartado ({reason}): se analiza de nuevo")
+            self.plan = None
+    
+    def _close_journal(self):
+        """Cerrar el diario del trabajo (queda en disco para poder reanudar)"""
+        if self.journal is not None:
+            try:
+                self.journal.close()
+            except Exception:
+                pass
+            self.journal = None
+    
+    def _close_cache(self):
+        """Guardar la caché de extracción y recortarla a su tamaño máximo"""
+        if self.cache is None:
+            return
+        try:
+            self.cache.flush()
+            self.cache.prune()
+            self.cache.close()
+        except Exception:
+            pass
+        self.cache = None
+        self.processor.cache = None
+    
+    def _collect_result(self, result: ProcessResult, results: List[ProcessResult]):
+        """Guardar un resultado y enviarlo a la UI en lotes por cantidad o por tiempo"""
+        results.append(result)
+        self._pending_results.append(result)
+        
+        if (len(self._pending_results) >= self.RESULT_BATCH_SIZE or
+                time.monotonic() - self._last_batch_time >= self.RESULT_BATCH_INTERVAL):
+            self._flush_results()
+    
+    def _flush_results(self):
+        """Enviar a la UI los resultados pendientes"""
+        if self._pending_results:
+            self.results_batch.emit(self._pending_results)
+            self._pending_results = []
+        self._last_batch_time = time.monotonic()
+    
+    def _consume(self, result_iter: Iterator[ProcessResult],
+                 total: Union[int, Callable[[], int]]) -> List[ProcessResult]:
+        """
+        Recorrer un iterador de resultados enviándolos a la UI y actualizando el progreso
+        
+        Args:
+            result_iter: Resultados producidos por el procesador
+            total: Número de resultados esperados (0 si se desconoce), o función que
+                   da el total parcial mientras se siguen buscando archivos
+                   
+        Returns:
+            Lista de resultados obtenidos
+        """
+        results = []
+        try:
+            for result in result_iter:
+                if self._is_cancelled:
+                    break
+                
+                self._collect_result(result, results)
+                
+                expected = total() if callable(total) else total
+                if expected:
+                    self.progress.emit(min(100, int(len(results) / expected * 100)))
+        finally:
+            # Cerrar el iterador libera documentos y pools aunque se cancele
+            result_iter.close()
+        
+        return results
     
     def _process_separate(self) -> List[ProcessResult]:
         """Procesar separación de PDF multi-página"""
         self.status_update.emit("Separando PDF multi-página...")
-        self.progress.emit(10)
+        self.progress.emit(0)
         
         if self._is_cancelled:
             return []
         
-        results = self.processor.separate_multi_page_pdf(
-            self.source_path, 
-            self.output_folder
+        total_pages = self.processor.get_page_count(self.source_path)
+        if total_pages and self.plan is not None:
+            self.status_update.emit(f"Separando {total_pages} páginas con los nombres de la vista previa...")
+        elif total_pages:
+            self.status_update.emit(f"Separando {total_pages} páginas...")
+        
+        results = self._consume(
+            self.processor.iter_separate_multi_page_pdf(
+                self.source_path, self.output_folder, self.journal, self.plan
+            ),
+            total_pages
         )
         
         self.progress.emit(100)
@@ -90,32 +233,28 @@ class PDFProcessorThread(QThread):
     def _process_rename(self) -> List[ProcessResult]:
         """Procesar renombrado de PDFs individuales"""
         try:
-            pdf_files = [
-                f for f in os.listdir(self.source_path) 
-                if f.lower().endswith('.pdf')
-            ]
+            # Los archivos se renombran a medida que se encuentran
+            discovery = self.processor.iter_input_files(self.source_path, self.output_folder)
             
-            if not pdf_files:
-                self.status_update.emit("No se encontraron archivos PDF")
-                return []
-            
-            results = []
-            total_files = len(pdf_files)
+            if self.processor.discovery.recursive:
+                self.status_update.emit("Buscando PDFs en la carpeta y sus subcarpetas y renombrando...")
+            else:
+                self.status_update.emit("Renombrando archivos...")
+            renamer = ConcurrentRenamer(self.processor, self.max_workers)
             
-            for i, pdf_file in enumerate(pdf_files):
-                if self._is_cancelled:
-                    break
-                
-                input_path = os.path.join(self.source_path, pdf_file)
-                self.status_update.emit(f"Procesando: {pdf_file}")
-                
-                result = self.processor.rename_single_pdf(input_path, self.output_folder)
-                results.append(result)
-                
-                # Actualizar progreso
-                progress = int((i + 1) / total_files * 100)
-                self.progress.emit(progress)
+            # El progreso cuenta los archivos completados frente a los encontrados hasta el momento
+            results = self._consume(
+                renamer.iter_rename(discovery, self.output_folder, self.journal, self.plan),
+                lambda: discovery.found
+            )
             
+            if not discovery.found:
+                self.status_update.emit("No se encontraron archivos PDF")
+            elif discovery.skipped_folders:
+                self.status_update.emit(
+                    f"Renombrados {discovery.found} archivos; "
+                    f"{len(discovery.skipped_folders)} subcarpetas no se pudieron leer"
+                )
             return results
             
         except Exception as e:
@@ -125,205 +264,146 @@ class PDFProcessorThread(QThread):
         """Procesar organización por trabajador"""
         try:
             self.status_update.emit("Escaneando carpetas procesadas...")
-            self.progress.emit(10)
+            self.progress.emit(0)
             
             if self._is_cancelled:
                 return []
             
-            # Verificar que existan subcarpetas con PDFs
-            subfolders = []
-            for item in os.listdir(self.source_path):
-                subfolder_path = os.path.join(self.source_path, item)
-                if os.path.isdir(subfolder_path):
-                    # Verificar si tiene PDFs
-                    pdf_files = [f for f in os.listdir(subfolder_path) if f.lower().endswith('.pdf')]
-                    if pdf_files:
-                        subfolders.append(item)
+            # Verificar que existan subcarpetas con PDFs (listado compartido con la validación y la vista previa)
+            subfolders = [folder for folder in self.processor.scan_processed_folders(self.source_path)
+                          if folder.pdf_files]
+            total_pdfs = sum(len(folder.pdf_files) for folder in subfolders)
             
             if not subfolders:
                 self.status_update.emit("No se encontraron subcarpetas con PDFs")
-                return [ProcessResult(
+                results = []
+                self._collect_result(ProcessResult(
                     original_file=self.source_path,
                     success=False,
                     error="No se encontraron subcarpetas con archivos PDF procesados"
-                )]
+                ), results)
+                return results
             
             self.status_update.emit(f"Organizando documentos de {len(subfolders)} carpetas...")
-            self.progress.emit(30)
             
             if self._is_cancelled:
                 return []
             
             # Ejecutar organización
-            results = self.processor.organize_by_worker(
-                self.source_path,
-                self.output_folder
+            results = self._consume(
+                self.processor.iter_organize_by_worker(
+                    self.source_path, self.output_folder, self.journal, self.plan
+                ),
+                total_pdfs
             )
             
+            skipped = sum(1 for result in results if result.skipped)
+            if skipped:
+                self.status_update.emit(
+                    f"Copiados {len(results) - skipped} documentos; {skipped} sin cambios desde la última vez"
+                )
+            
             self.progress.emit(100)
             return results
             
         except Exception as e:
             raise Exception(f"Error organizando por trabajador: {str(e)}")
+
+
+class PreviewThread(QThread):
+    """
+    Hilo que planifica el trabajo y genera su vista previa sin bloquear la interfaz
+    
+    Envía cada bloque de líneas en cuanto se calcula (una página o un archivo)
+    y se detiene al llamar a cancel(), por ejemplo al cambiar la configuración.
+    Al terminar entrega el plan completo, que el procesamiento reutiliza para
+    no volver a extraer texto.
+    
+    Signals:
+        lines_ready: Bloque de líneas nuevo (List[str])
+        plan_progress: Unidades planificadas y total
+        plan_ready: Plan completo (JobPlan)
+        preview_finished: Vista previa terminada
+        error_occurred: Error al generar la vista previa
+    """
+    
+    lines_ready = Signal(list)  # List[str]
+    plan_progress = Signal(int, int)
+    plan_ready = Signal(object)  # JobPlan
+    preview_finished = Signal()
+    error_occurred = Signal(str)
+    
+    # Intervalo mínimo (segundos) entre avisos de progreso
+    PROGRESS_INTERVAL = 0.2
     
-    def get_preview_data(self) -> dict:
+    def __init__(self, source_path: str, output_folder: str, process_type: str,
+                 use_cache: bool = False, max_workers: int = 1, transfer: str = DEFAULT_TRANSFER,
+                 discovery: DiscoveryOptions = DiscoveryOptions(), extraction: str = DEFAULT_EXTRACTION):
         """
-        Obtener datos de vista previa sin procesar archivos
-        
-        Returns:
-            Diccionario con información de vista previa
+        Args:
+            source_path: Ruta del archivo o carpeta fuente
+            output_folder: Carpeta de salida
+            process_type: Tipo de procesamiento ('separate', 'rename' o 'organize')
+            use_cache: Reutilizar texto y nombres extraídos en ejecuciones anteriores
+            max_workers: Procesos en paralelo para detectar nombres
+            transfer: Estrategia de transferencia (cambia el espacio necesario)
+            discovery: Qué archivos se renombran (subcarpetas y patrones)
+            extraction: Cómo leer el texto para buscar el nombre
         """
-        try:
-            preview_data = {
-                'files': [],
-                'total_files': 0,
-                'estimated_results': []
-            }
-            
-            if self.process_type == "separate":
-                preview_data.update(self._get_separate_preview())
-            elif self.process_type == "rename":
-                preview_data.update(self._get_rename_preview())
-            elif self.process_type == "organize":
-                preview_data.update(self._get_organize_preview())
-            
-            return preview_data
-            
-        except Exception as e:
-            return {
-                'error': f"Error generando vista previa: {str(e)}",
-                'files': [],
-                'total_files': 0
-            }
+        super().__init__()
+        self.source_path = source_path
+        self.output_folder = output_folder
+        self.process_type = process_type
+        self.use_cache = use_cache
+        self.max_workers = max_workers
+        self.transfer = transfer
+        self.discovery = discovery
+        self.extraction = extraction
+        self._is_cancelled = False
+        self._last_progress_time = 0.0
     
-    def _get_separate_preview(self) -> dict:
-        """Vista previa para separación de PDF"""
-        try:
-            import PyPDF2
-            
-            with open(self.source_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                total_pages = len(pdf_reader.pages)
-                
-                preview_pages = []
-                max_preview = min(5, total_pages)  # Mostrar máximo 5 páginas
-                
-                for i in range(max_preview):
-                    text = self.processor.extract_text_from_pdf(self.source_path, i)
-                    worker_name = self.processor.extract_worker_name(text)
-                    
-                    preview_pages.append({
-                        'page': i + 1,
-                        'worker_name': worker_name,
-                        'has_name': worker_name is not None
-                    })
-                
-                return {
-                    'total_pages': total_pages,
-                    'preview_pages': preview_pages,
-                    'showing_preview': max_preview < total_pages
-                }
-                
-        except Exception as e:
-            return {
-                'error': f"Error leyendo PDF: {str(e)}",
-                'total_pages': 0,
-                'preview_pages': []
-            }
+    def cancel(self):
+        """Cancelar la vista previa (termina tras la página o archivo en curso)"""
+        self._is_cancelled = True
     
-    def _get_rename_preview(self) -> dict:
-        """Vista previa para renombrado de PDFs"""
-        try:
-            pdf_files = [
-                f for f in os.listdir(self.source_path) 
-                if f.lower().endswith('.pdf')
-            ]
-            
-            if not pdf_files:
-                return {
-                    'total_files': 0,
-                    'preview_files': [],
-                    'message': 'No se encontraron archivos PDF en la carpeta'
-                }
-            
-            preview_files = []
-            max_preview = min(10, len(pdf_files))  # Mostrar máximo 10 archivos
-            
-            for pdf_file in pdf_files[:max_preview]:
-                full_path = os.path.join(self.source_path, pdf_file)
-                text = self.processor.extract_text_from_pdf(full_path)
-                worker_name = self.processor.extract_worker_name(text)
-                
-                preview_files.append({
-                    'original_name': pdf_file,
-                    'worker_name': worker_name,
-                    'new_name': f"{self.processor.clean_filename(worker_name)}.pdf" if worker_name else None,
-                    'has_name': worker_name is not None
-                })
-            
-            return {
-                'total_files': len(pdf_files),
-                'preview_files': preview_files,
-                'showing_preview': max_preview < len(pdf_files)
-            }
-            
-        except Exception as e:
-            return {
-                'error': f"Error leyendo archivos: {str(e)}",
-                'total_files': 0,
-                'preview_files': []
-            }
+    def is_cancelled(self) -> bool:
+        return self._is_cancelled
     
-    def _get_organize_preview(self) -> dict:
-        """Vista previa para organización por trabajador"""
+    def run(self):
+        """Generar la vista previa en el hilo separado"""
+        # La caché se abre aquí para no tocar el disco desde el hilo de la interfaz
+        cache = open_extraction_cache() if self.use_cache else None
+        blocks = None
         try:
-            # Escanear subcarpetas
-            subfolders_found = []
-            worker_docs = {}
+            processor = PDFProcessor(max_workers=self.max_workers, cache=cache, transfer=self.transfer,
+                                     discovery=self.discovery, extraction=self.extraction)
+            plan = JobPlan.create(self.process_type, self.source_path, self.output_folder, processor)
+            planner = JobPlanner(processor, progress=self._report_progress)
+            blocks = iter_preview_lines(planner, plan)
+            for lines in blocks:
+                if self._is_cancelled:
+                    return
+                if lines:
+                    self.lines_ready.emit(lines)
             
-            for item in os.listdir(self.source_path):
-                subfolder_path = os.path.join(self.source_path, item)
-                
-                if not os.path.isdir(subfolder_path):
-                    continue
-                
-                # Detectar tipo de documento
-                doc_type = self.processor.detect_document_type(item)
-                if not doc_type:
-                    continue
-                
-                subfolders_found.append({
-                    'folder_name': item,
-                    'doc_type': doc_type
-                })
-                
-                # Buscar PDFs
-                pdf_files = [f for f in os.listdir(subfolder_path) if f.lower().endswith('.pdf')]
+            if not self._is_cancelled:
+                self.plan_ready.emit(plan)
+                self.preview_finished.emit()
                 
-                for pdf_file in pdf_files[:5]:  # Mostrar solo primeros 5 por carpeta
-                    worker_name = self.processor.extract_worker_name_from_filename(pdf_file)
-                    
-                    if worker_name:
-                        if worker_name not in worker_docs:
-                            worker_docs[worker_name] = {}
-                        worker_docs[worker_name][doc_type] = pdf_file
-            
-            # Contar totales
-            total_workers = len(worker_docs)
-            total_docs = sum(len(docs) for docs in worker_docs.values())
-            
-            return {
-                'subfolders_found': subfolders_found,
-                'worker_docs': worker_docs,
-                'total_workers': total_workers,
-                'total_docs': total_docs,
-                'showing_preview': True
-            }
-            
         except Exception as e:
-            return {
-                'error': f"Error escaneando carpetas: {str(e)}",
-                'subfolders_found': [],
-                'worker_docs': {},
-                'total_workers': 0
-            }
\ No newline at end of file
+            if not self._is_cancelled:
+                self.error_occurred.emit(f"Error generando vista previa: {str(e)}")
+        
+        finally:
+            if blocks is not None:
+                # Cerrar el generador libera el documento abierto aunque se cancele
+                blocks.close()
+            if cache is not None:
+                cache.close()
+    
+    def _report_progress(self, done: int, total: int):
+        """Avisar del progreso de la planificación sin saturar la interfaz"""
+        now = time.monotonic()
+        if done == total or now - self._last_progress_time >= self.PROGRESS_INTERVAL:
+            self._last_progress_time = now
+            self.plan_progress.emit(done, total)
@@ -0,0 +1,181 @@
+"""
+Vista previa de cada modo: muestra el plan de trabajo poco a poco mientras se calcula
+"""
+import os
+from typing import Dict, Iterator, List
+
+from .job_plan import JobPlan, JobPlanner, sample_pages
+
+# Páginas mostradas al separar, repartidas por todo el documento
+PREVIEW_PAGE_SAMPLES = 10
+
+# Archivos mostrados al renombrar
+PREVIEW_FILE_SAMPLES = 10
+
+# Trabajadores mostrados al organizar
+PREVIEW_WORKER_SAMPLES = 3
+
+
+def iter_preview_lines(planner: JobPlanner, plan: JobPlan) -> Iterator[List[str]]:
+    """
+    Planifica un trabajo y genera su vista previa en bloques de líneas
+
+    Cada bloque se entrega en cuanto está listo, así quien la muestra puede
+    ir completándola y dejar de pedir bloques para cancelarla. Las unidades
+    que no se muestran producen un bloque vacío, para que cancelar no tenga
+    que esperar al final del plan. Al terminar, el plan queda completo y
+    puede ejecutarse sin volver a extraer texto.
+
+    Args:
+        planner: Planificador con el procesador usado para detectar nombres
+        plan: Plan vacío (JobPlan.create) que se completa mientras se muestra
+
+    Yields:
+        Líneas de texto de cada bloque
+    """
+    if plan.mode == "separate":
+        yield from _iter_separate_preview(planner, plan)
+    elif plan.mode == "rename":
+        yield from _iter_rename_preview(planner, plan)
+    else:
+        yield from _iter_organize_preview(planner, plan)
+
+    if plan.units:
+        yield plan_summary_lines(plan) + ["Al pulsar \"Procesar\" se usa este plan sin volver a analizar los PDFs"]
+
+
+def plan_summary_lines(plan: JobPlan) -> List[str]:
+    """
+    Resumen de un plan completo: archivos a escribir, nombres repetidos y espacio necesario
+
+    Args:
+        plan: Plan completo
+
+    Returns:
+        Líneas del resumen
+    """
+    targets = [unit for unit in plan.units if unit.target]
+    unnamed = sum(1 for unit in plan.units if not unit.worker_name)
+    estimated_mb = plan.estimated_bytes / 1048576
+
+    lines = ["", "PLAN DEL TRABAJO", "-" * 50, f"Archivos a escribir: {len(targets)} → {plan.output_folder}"]
+    if plan.mode == "separate":
+        if unnamed:
+            lines.append(f"Páginas sin nombre detectado: {unnamed} (se guardan como Pagina_XXX.pdf, "
+                         f"numeradas _001, _002... si ya existen)")
+    elif unnamed:
+        lines.append(f"Archivos sin nombre de trabajador (no se copian): {unnamed}")
+
+    # Al organizar, de cada trabajador y tipo de documento se copia un solo archivo
+    superseded = len(plan.units) - len(targets) - unnamed
+    if plan.mode == "organize" and superseded:
+        lines.append(f"Documentos repetidos del mismo trabajador y tipo (se copia el último): {superseded}")
+
+    # Destinos con sufijo _001, _002...: el nombre limpio ya estaba ocupado
+    repeated = sum(1 for unit in targets if plan.mode != "organize" and unit.worker_name and
+                   os.path.splitext(unit.target)[0].rsplit("_", 1)[-1].isdigit())
+    if repeated:
+        lines.append(f"Nombres repetidos: {repeated} (se numeran _001, _002...)")
+
+    try:
+        free_mb = plan.free_bytes() / 1048576
+    except OSError:
+        lines.append(f"Espacio estimado: {estimated_mb:.1f} MB")
+    else:
+        status = "✅" if plan.has_free_space() else "❌ Espacio insuficiente en la unidad de salida"
+        lines.append(f"Espacio estimado: {estimated_mb:.1f} MB · libre: {free_mb:.1f} MB {status}")
+    return lines
+
+
+def _iter_separate_preview(planner: JobPlanner, plan: JobPlan) -> Iterator[List[str]]:
+    """Vista previa de separar: trabajador de páginas repartidas por todo el PDF"""
+    processor = planner.processor
+    yield [f"SEPARANDO PDF: {os.path.basename(plan.source_path)}", "-" * 50]
+
+    shown = None
+    for unit in planner.iter_plan(plan, samples=PREVIEW_PAGE_SAMPLES):
+        if shown is None:
+            # Las páginas de muestra se planifican primero
+            shown = set(sample_pages(plan.page_count, PREVIEW_PAGE_SAMPLES))
+            remaining = plan.page_count - len(shown)
+            if remaining:
+                yield [f"{plan.page_count} páginas (muestra de {len(shown)} repartidas por todo el documento)", ""]
+
+        if unit.page not in shown:
+            yield []
+            continue
+
+        page_label = f"Página {unit.page + 1}"
+        if unit.worker_name:
+            clean_name = processor.clean_filename(unit.worker_name)
+            yield [f"{page_label}: {unit.worker_name}", f"  → Archivo: {clean_name}.pdf"]
+        else:
+            yield [f"{page_label}: [Sin nombre detectado]",
+                   f"  → Archivo: {processor.unnamed_page_name(unit.page)}.pdf"]
+
+        shown.discard(unit.page)
+        if not shown and remaining:
+            yield [f"... y {remaining} páginas más"]
+
+
+def _iter_rename_preview(planner: JobPlanner, plan: JobPlan) -> Iterator[List[str]]:
+    """Vista previa de renombrar: nombre nuevo de los primeros archivos"""
+    processor = planner.processor
+    yield [f"RENOMBRANDO PDFs EN: {plan.source_path}", "-" * 50]
+
+    for index, unit in enumerate(planner.iter_plan(plan)):
+        if index >= PREVIEW_FILE_SAMPLES:
+            yield []
+            continue
+
+        pdf_file = os.path.basename(unit.source)
+        if unit.worker_name:
+            clean_name = processor.clean_filename(unit.worker_name)
+            yield [f"'{pdf_file}' → '{clean_name}.pdf'", f"  Trabajador: {unit.worker_name}"]
+        else:
+            yield [f"'{pdf_file}' → [Sin cambios - no se detectó nombre]"]
+
+    if len(plan.units) > PREVIEW_FILE_SAMPLES:
+        yield [f"... y {len(plan.units) - PREVIEW_FILE_SAMPLES} archivos más"]
+
+
+def _iter_organize_preview(planner: JobPlanner, plan: JobPlan) -> Iterator[List[str]]:
+    """Vista previa de organizar: carpetas reconocidas y estructura resultante"""
+    yield [f"ORGANIZANDO POR TRABAJADOR EN: {plan.source_path}", "-" * 60]
+
+    # Solo se leen nombres de archivo: el plan completo es inmediato
+    for _ in planner.iter_plan(plan):
+        pass
+
+    folders: Dict[str, List] = {}
+    for unit in plan.units:
+        folder = os.path.basename(os.path.dirname(unit.source))
+        folders.setdefault(folder, [unit.doc_type, 0])[1] += 1
+
+    if not folders:
+        yield [
+            "❌ No se encontraron subcarpetas con PDFs procesados",
+            "Busca carpetas como: PDFs_Procesados_Certificados, PDFs_Procesados_5rentas, etc."
+        ]
+        return
+
+    lines = ["Carpetas procesadas encontradas:"]
+    for folder, (doc_type, count) in sorted(folders.items()):
+        lines.append(f"  📁 {folder} ({count} PDFs) → {doc_type}")
+
+    worker_docs = plan.worker_documents()
+    lines += [
+        "",
+        f"Trabajadores únicos detectados: {len(worker_docs)}",
+        "",
+        "Estructura resultante (muestra):",
+        f"{os.path.basename(plan.output_folder)}/",
+    ]
+    for worker_name, docs in list(worker_docs.items())[:PREVIEW_WORKER_SAMPLES]:
+        lines.append(f"  📂 {worker_name}/")
+        for doc_type in docs:
+            lines.append(f"    📄 {worker_name}_{doc_type}.pdf")
+
+    if len(worker_docs) > PREVIEW_WORKER_SAMPLES:
+        lines.append(f"  ... y {len(worker_docs) - PREVIEW_WORKER_SAMPLES} trabajadores más")
+    yield lines
@@ -0,0 +1,339 @@
+"""
+Motor de renombrado concurrente para carpetas con muchos PDFs individuales
+"""
+import os
+from collections import deque
+from concurrent.futures import (
+    Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+)
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Optional, Tuple
+
+from .block_extraction import DEFAULT_EXTRACTION
+from .job_journal import JobJournal
+from .pdf_processor import PDFProcessor, ProcessResult
+from .timing import StageTimer
+from ..utils.cache import open_extraction_cache
+
+if TYPE_CHECKING:
+    from .job_plan import JobPlan
+
+# Archivos analizados por adelantado por cada proceso (limita la memoria usada)
+IN_FLIGHT_PER_WORKER = 4
+
+
+def file_unit(input_path: str, source_folder: Optional[str] = None) -> str:
+    """
+    Identificador de un archivo en el diario del trabajo y en el plan
+
+    Es su ruta relativa a la carpeta de entrada, para distinguir archivos con
+    el mismo nombre en distintas subcarpetas; los de la propia carpeta se
+    identifican solo por el nombre.
+
+    Args:
+        input_path: Ruta del archivo
+        source_folder: Carpeta de entrada (None = solo el nombre)
+    """
+    if source_folder is not None:
+        try:
+            relative = os.path.relpath(os.path.abspath(input_path), source_folder)
+        except ValueError:
+            # Otra unidad en Windows
+            relative = os.pardir
+        if relative != os.pardir and not relative.startswith(os.pardir + os.sep):
+            return f"file:{relative.replace(os.sep, '/')}"
+    return f"file:{os.path.basename(input_path)}"
+
+
+# Procesador de cada proceso del pool (creado por init_analyze_worker)
+_worker_processor: Optional[PDFProcessor] = None
+
+
+def init_analyze_worker(cache_path: Optional[str], extraction: str = DEFAULT_EXTRACTION):
+    """Preparar el procesador de un proceso del pool, con su propia conexión a la caché"""
+    global _worker_processor
+    # En procesos paralelos cada escritura se confirma para no bloquear a los demás
+    cache = open_extraction_cache(cache_path, flush_every=1) if cache_path else None
+    _worker_processor = PDFProcessor(cache=cache, extraction=extraction)
+
+
+def analyze_pdf_in_worker(input_path: str) -> ProcessResult:
+    """Detectar el trabajador de un PDF dentro de un proceso del pool"""
+    processor = _worker_processor or PDFProcessor()
+    return processor.analyze_single_pdf(input_path)
+
+
+class ConcurrentRenamer:
+    """
+    Renombra PDFs individuales repartiendo el trabajo entre varios procesos
+
+    La detección de nombres (abrir PDF, extraer texto, aplicar patrones) corre en
+    un pool de procesos y las copias en un pool de hilos. Los nombres de destino
+    se reservan siempre en el orden de entrada (ver PDFProcessor.claim_output_path),
+    por lo que los sufijos _001, _002... son los mismos que en el procesamiento
+    secuencial.
+    """
+
+    def __init__(self, processor: PDFProcessor, max_workers: int = 1):
+        """
+        Args:
+            processor: Procesador usado para limpiar nombres y copiar archivos
+            max_workers: Número de procesos/hilos (1 = secuencial en el hilo actual)
+        """
+        self.processor = processor
+        self.max_workers = max(1, max_workers)
+
+    def iter_rename(self, input_paths: Iterable[str], output_folder: Optional[str] = None,
+                    journal: Optional[JobJournal] = None,
+                    plan: Optional['JobPlan'] = None) -> Iterator[ProcessResult]:
+        """
+        Renombra los PDFs y entrega cada resultado en cuanto termina
+
+        Args:
+            input_paths: Rutas de los PDFs en el orden en que deben asignarse los nombres
+            output_folder: Carpeta de destino (None = misma carpeta de cada archivo)
+            journal: Diario del trabajo: los archivos ya copiados se saltan
+            plan: Plan vigente: los archivos que contiene no se vuelven a analizar
+
+        Yields:
+            Resultado de cada archivo, en orden de finalización
+        """
+        if output_folder is not None:
+            os.makedirs(output_folder, exist_ok=True)
+
+        if journal is not None:
+            input_paths = self._skip_completed(input_paths, journal)
+
+        if self.max_workers == 1:
+            for input_path in input_paths:
+                if isinstance(input_path, ProcessResult):
+                    yield input_path
+                elif journal is None and plan is None:
+                    yield self.processor.rename_single_pdf(input_path, output_folder)
+                else:
+                    yield self._rename_in_thread(input_path, output_folder, journal, plan)
+            return
+
+        analyze_pool = self._analyze_pool()
+        copy_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            yield from self._run(analyze_pool, copy_pool, iter(input_paths), output_folder, journal, plan)
+        finally:
+            # Al cancelar (cierre del generador) se descarta lo que no ha empezado y se
+            # espera a lo que está en curso (_run anota en el diario las copias terminadas)
+            analyze_pool.shutdown(wait=True, cancel_futures=True)
+            copy_pool.shutdown(wait=True, cancel_futures=True)
+
+    def iter_analyze(self, input_paths: Iterable[str]) -> Iterator[ProcessResult]:
+        """
+        Detecta el trabajador de cada PDF sin copiar nada (fase de planificación)
+
+        Args:
+            input_paths: Rutas de los PDFs
+
+        Yields:
+            Resultado del análisis de cada archivo, en orden de entrada
+        """
+        if self.max_workers == 1:
+            for input_path in input_paths:
+                yield self.processor.analyze_single_pdf(input_path)
+            return
+
+        max_in_flight = self.max_workers * IN_FLIGHT_PER_WORKER
+        analyze_pool = self._analyze_pool()
+        pending: deque = deque()  # (ruta, futuro) en orden de entrada
+        paths = iter(input_paths)
+        try:
+            while True:
+                while len(pending) < max_in_flight:
+                    input_path = next(paths, None)
+                    if input_path is None:
+                        break
+                    pending.append((input_path, analyze_pool.submit(analyze_pdf_in_worker, input_path)))
+
+                if not pending:
+                    return
+
+                input_path, future = pending.popleft()
+                try:
+                    yield future.result()
+                except Exception as e:
+                    yield ProcessResult(
+                        original_file=os.path.basename(input_path),
+                        success=False,
+                        error=f"Error procesando archivo: {str(e)}"
+                    )
+        finally:
+            analyze_pool.shutdown(wait=True, cancel_futures=True)
+
+    def _analyze_pool(self) -> ProcessPoolExecutor:
+        """Pool de procesos para detectar nombres, con acceso a la caché de extracción"""
+        cache_path = None
+        if self.processor.cache is not None:
+            # Liberar la base de datos para que los procesos puedan escribir
+            self.processor.cache.flush()
+            cache_path = self.processor.cache.db_path
+
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=init_analyze_worker,
+            initargs=(cache_path, self.processor.extraction)
+        )
+
+    def _skip_completed(self, input_paths: Iterable[str], journal: JobJournal) -> Iterator:
+        """Sustituir los archivos ya copiados en una ejecución anterior por su resultado"""
+        for input_path in input_paths:
+            replayed = journal.completed(self._unit(input_path, journal), journal.source_stat(input_path))
+            yield replayed if replayed is not None else input_path
+
+    @staticmethod
+    def _unit(input_path: str, journal: Optional[JobJournal]) -> str:
+        """Identificador de un archivo en el diario del trabajo"""
+        return file_unit(input_path, journal.source_path if journal is not None else None)
+
+    @staticmethod
+    def _planned_analysis(input_path: str, plan: Optional['JobPlan']) -> Optional[ProcessResult]:
+        """Análisis de un archivo tomado del plan (None si no hay plan o no lo incluye)"""
+        return plan.analysis(input_path) if plan is not None else None
+
+    def _rename_in_thread(self, input_path: str, output_folder: Optional[str],
+                          journal: Optional[JobJournal] = None,
+                          plan: Optional['JobPlan'] = None) -> ProcessResult:
+        """Renombrar un archivo en el hilo actual, con el nombre del plan y anotándolo en el diario"""
+        timer = StageTimer()
+        result = self._planned_analysis(input_path, plan)
+        if result is None:
+            result = self.processor.analyze_single_pdf(input_path, timer)
+        if not result.success:
+            return result
+
+        target = self._reserve_output_path(input_path, result.worker_name, output_folder)
+        if target is None:
+            return ProcessResult(
+                original_file=os.path.basename(input_path),
+                success=False,
+                error="No se pudo preparar la carpeta de destino"
+            )
+
+        unit = self._unit(input_path, journal)
+        if journal is not None:
+            journal.start(unit, target, input_path, self.processor.moves_inputs)
+        result = self.processor.copy_renamed_pdf(input_path, target, result.worker_name, timer)
+        if journal is not None and result.success:
+            journal.finish(unit, result, target, journal.source_stat(input_path))
+        return result
+
+    def _run(self, analyze_pool: Executor, copy_pool: Executor, paths: Iterator,
+             output_folder: Optional[str], journal: Optional[JobJournal] = None,
+             plan: Optional['JobPlan'] = None) -> Iterator[ProcessResult]:
+        """Bucle principal: análisis concurrente, asignación ordenada y copia concurrente"""
+        max_in_flight = self.max_workers * IN_FLIGHT_PER_WORKER
+        analyses: Dict[Future, int] = {}
+        # Copia en curso → (unidad del diario, ruta de destino, ruta de origen)
+        copies: Dict[Future, Tuple[str, str, str]] = {}
+        analyzed: Dict[int, ProcessResult] = {}
+        order: deque = deque()  # (índice, ruta) pendientes de asignar nombre
+        next_index = 0
+        exhausted = False
+
+        try:
+            while True:
+                # Mantener el pool de análisis lleno sin leer toda la entrada de golpe
+                while not exhausted and len(order) < max_in_flight:
+                    input_path = next(paths, None)
+                    if input_path is None:
+                        exhausted = True
+                        break
+                    if isinstance(input_path, ProcessResult):
+                        # Ya completado según el diario
+                        yield input_path
+                        continue
+                    planned = self._planned_analysis(input_path, plan)
+                    if planned is not None:
+                        analyzed[next_index] = planned
+                    else:
+                        future = analyze_pool.submit(analyze_pdf_in_worker, input_path)
+                        analyses[future] = next_index
+                    order.append((next_index, input_path))
+                    next_index += 1
+
+                if not analyses and not copies and not order:
+                    return
+
+                done, _ = wait(set(analyses) | set(copies), return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    if future in copies:
+                        unit, target, input_path = copies.pop(future)
+                        result = future.result()
+                        if journal is not None and result.success:
+                            journal.finish(unit, result, target, journal.source_stat(input_path))
+                        yield result
+                    else:
+                        index = analyses.pop(future)
+                        analyzed[index] = self._future_result(future, order, index)
+
+                # Asignar nombres en orden de entrada: colisiones deterministas
+                while order and order[0][0] in analyzed:
+                    index, input_path = order.popleft()
+                    result = analyzed.pop(index)
+                    if not result.success:
+                        yield result
+                        continue
+
+                    target = self._reserve_output_path(input_path, result.worker_name, output_folder)
+                    if target is None:
+                        yield ProcessResult(
+                            original_file=os.path.basename(input_path),
+                            success=False,
+                            error="No se pudo preparar la carpeta de destino"
+                        )
+                        continue
+
+                    unit = self._unit(input_path, journal)
+                    if journal is not None:
+                        journal.start(unit, target, input_path, self.processor.moves_inputs)
+                    future = copy_pool.submit(
+                        self.processor.copy_renamed_pdf, input_path, target, result.worker_name,
+                        StageTimer.from_result(result)
+                    )
+                    copies[future] = (unit, target, input_path)
+        finally:
+            # Al cancelar (cierre del generador) las copias encoladas se descartan y las
+            # que están en curso terminan: anotarlas para que no parezcan interrumpidas
+            copy_pool.shutdown(wait=True, cancel_futures=True)
+            self._settle_copies(copies, journal)
+
+    def _settle_copies(self, copies: Dict[Future, Tuple[str, str, str]], journal: Optional[JobJournal]):
+        """Anotar en el diario las copias terminadas tras cancelar y liberar los nombres de las no empezadas"""
+        for future, (unit, target, input_path) in copies.items():
+            if future.cancelled():
+                self.processor.release_output_path(target)
+                continue
+            result = future.result()
+            if journal is not None and result.success:
+                journal.finish(unit, result, target, journal.source_stat(input_path))
+        copies.clear()
+
+    def _future_result(self, future: Future, order: deque, index: int) -> ProcessResult:
+        """Obtener el resultado de un análisis, convirtiendo fallos del pool en errores"""
+        try:
+            return future.result()
+        except Exception as e:
+            input_path = next(path for i, path in order if i == index)
+            return ProcessResult(
+                original_file=os.path.basename(input_path),
+                success=False,
+                error=f"Error procesando archivo: {str(e)}"
+            )
+
+    def _reserve_output_path(self, input_path: str, worker_name: str,
+                             output_folder: Optional[str]) -> Optional[str]:
+        """Reservar una ruta de destino libre (las copias aún en curso ya tienen la suya)"""
+        try:
+            folder = output_folder if output_folder is not None else os.path.dirname(input_path)
+            clean_name = self.processor.clean_filename(worker_name)
+            extension = Path(input_path).suffix
+            return self.processor.claim_output_path(folder, clean_name, extension)
+        except Exception:
+            return None
@@ -0,0 +1,172 @@
+"""
+Sincronización incremental al organizar: manifiesto de lo ya copiado en la carpeta de salida
+"""
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from ..utils.cache import hash_file
+
+MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SyncOptions:
+    """
+    Cómo decidir qué documentos hay que volver a copiar al organizar
+
+    Con incremental un documento se salta si el destino ya tiene el mismo
+    tamaño y la misma fecha que el original, o si coincide con lo anotado en
+    el manifiesto de la última ejecución (origen y destino sin cambios).
+    Con verify_hash, cuando el tamaño coincide pero las fechas no (copias
+    hechas con otra herramienta, fechas redondeadas por la unidad), se
+    compara el contenido en lugar de copiar de nuevo.
+    """
+    incremental: bool = False
+    verify_hash: bool = False
+
+
+class SyncManifest:
+    """
+    Tamaño y fecha de cada documento copiado, de su original y de su copia
+
+    Se guarda en la carpeta de salida, uno por carpeta de entrada, con rutas
+    de destino relativas a la carpeta de salida. check() se puede llamar desde
+    varios hilos; record() y save() solo desde el hilo que organiza.
+    """
+
+    def __init__(self, path: str, output_folder: str):
+        """
+        Args:
+            path: Ruta del archivo del manifiesto
+            output_folder: Carpeta de salida (base de las rutas guardadas)
+        """
+        self.path = path
+        self.output_folder = os.path.abspath(output_folder)
+        self._entries: Dict[str, dict] = self._load()
+        self._changed = False
+
+    @classmethod
+    def for_job(cls, output_folder: str, source_path: str) -> 'SyncManifest':
+        """
+        Abre (o crea vacío) el manifiesto de una carpeta de entrada
+
+        Args:
+            output_folder: Carpeta de salida del trabajo
+            source_path: Carpeta de entrada
+
+        Returns:
+            Manifiesto listo para usar (guardar con save())
+        """
+        source_id = hashlib.sha1(os.path.abspath(source_path).encode('utf-8')).hexdigest()[:12]
+        return cls(os.path.join(output_folder, f".organizador_manifiesto_{source_id}.json"), output_folder)
+
+    def _load(self) -> Dict[str, dict]:
+        """Leer el manifiesto guardado (vacío si no existe, está dañado o es de otra versión)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != MANIFEST_VERSION:
+            return {}
+        return data.get('entries') or {}
+
+    def _key(self, destination_path: str) -> str:
+        """Ruta de destino relativa a la carpeta de salida, con "/" como separador"""
+        return os.path.relpath(os.path.abspath(destination_path), self.output_folder).replace(os.sep, '/')
+
+    def check(self, source_path: str, destination_path: str, verify_hash: bool = False) -> Optional[dict]:
+        """
+        Comprueba si el destino ya contiene el documento original
+
+        Args:
+            source_path: Documento original
+            destination_path: Copia esperada en la carpeta del trabajador
+            verify_hash: Comparar el contenido si el tamaño coincide pero las fechas no
+
+        Returns:
+            Entrada a anotar en el manifiesto si no hace falta copiar, o None si hay que copiar
+        """
+        source = os.stat(source_path)
+        try:
+            destination = os.stat(destination_path)
+        except FileNotFoundError:
+            return None
+        if destination.st_size != source.st_size:
+            return None
+
+        recorded = self._entries.get(self._key(destination_path))
+        if recorded is not None and recorded.get('source') == os.path.abspath(source_path) and \
+                recorded.get('source_stat') == [source.st_size, source.st_mtime_ns] and \
+                recorded.get('stat') == [destination.st_size, destination.st_mtime_ns]:
+            return recorded
+
+        content_hash = None
+        if verify_hash:
+            content_hash = hash_file(source_path)
+            if hash_file(destination_path) != content_hash:
+                return None
+        elif destination.st_mtime_ns != source.st_mtime_ns:
+            return None
+        return _entry(source_path, source, destination, content_hash)
+
+    @staticmethod
+    def copied(source_path: str, destination_path: str) -> Optional[dict]:
+        """
+        Entrada de un documento recién copiado
+
+        Returns:
+            Entrada a anotar, o None si el original ya no está (p. ej. se movió)
+        """
+        try:
+            return _entry(source_path, os.stat(source_path), os.stat(destination_path))
+        except OSError:
+            return None
+
+    def record(self, destination_path: str, entry: dict):
+        """Anotar el estado de un documento sincronizado"""
+        key = self._key(destination_path)
+        if self._entries.get(key) != entry:
+            self._entries[key] = entry
+            self._changed = True
+
+    def save(self):
+        """Guardar el manifiesto si cambió (escritura atómica)"""
+        if not self._changed:
+            return
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump({'version': MANIFEST_VERSION, 'entries': self._entries}, file, ensure_ascii=False)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.path)
+        self._changed = False
+
+
+def _entry(source_path: str, source: os.stat_result, destination: os.stat_result,
+           content_hash: Optional[str] = None) -> dict:
+    """Entrada del manifiesto a partir del estado del original y de la copia"""
+    entry = {
+        'source': os.path.abspath(source_path),
+        'source_stat': [source.st_size, source.st_mtime_ns],
+        'stat': [destination.st_size, destination.st_mtime_ns],
+    }
+    if content_hash is not None:
+        entry['sha256'] = content_hash
+    return entry
+
+
+def open_sync_manifest(output_folder: str, source_path: str) -> Optional[SyncManifest]:
+    """
+    Abre el manifiesto de una carpeta sin interrumpir el procesamiento si falla
+
+    Returns:
+        Manifiesto abierto o None si no se pudo abrir
+    """
+    try:
+        return SyncManifest.for_job(output_folder, source_path)
+    except (OSError, ValueError):
+        return None
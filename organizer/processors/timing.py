@@ -0,0 +1,127 @@
+"""
+Medición de tiempos por etapa (apertura, extracción, patrones, escritura) y bytes procesados
+"""
+from time import perf_counter
+from typing import Dict, Iterable, List
+
+# Etapas medidas, en el orden en que se muestran
+STAGE_OPEN = 'open'
+STAGE_EXTRACT = 'extract'
+STAGE_MATCH = 'match'
+STAGE_WRITE = 'write'
+STAGES = (STAGE_OPEN, STAGE_EXTRACT, STAGE_MATCH, STAGE_WRITE)
+
+# Nombres visibles de cada etapa
+STAGE_LABELS = {
+    STAGE_OPEN: 'Apertura',
+    STAGE_EXTRACT: 'Extracción',
+    STAGE_MATCH: 'Patrones',
+    STAGE_WRITE: 'Escritura',
+}
+
+# Percentiles informados en el resumen
+PERCENTILES = (50, 90, 99)
+
+
+class _Stage:
+    """Context manager que suma la duración de un bloque a una etapa"""
+
+    __slots__ = ('_timer', '_name', '_start')
+
+    def __init__(self, timer: 'StageTimer', name: str):
+        self._timer = timer
+        self._name = name
+
+    def __enter__(self):
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._timer.add(self._name, perf_counter() - self._start)
+
+
+class StageTimer:
+    """
+    Acumula la duración de cada etapa y los bytes leídos/escritos de un resultado
+
+    Cuesta dos llamadas a perf_counter por bloque medido, así que puede quedar
+    siempre activo.
+
+    Uso:
+        timer = StageTimer()
+        with timer.stage(STAGE_EXTRACT):
+            text = session.extract_text(0)
+        timer.apply(result)
+    """
+
+    __slots__ = ('durations', 'bytes_read', 'bytes_written')
+
+    def __init__(self, durations: Dict[str, float] = None, bytes_read: int = 0, bytes_written: int = 0):
+        self.durations: Dict[str, float] = dict(durations or {})
+        self.bytes_read = bytes_read
+        self.bytes_written = bytes_written
+
+    @classmethod
+    def from_result(cls, result) -> 'StageTimer':
+        """Continuar midiendo a partir de los tiempos ya guardados en un resultado"""
+        return cls(result.timings, result.bytes_read, result.bytes_written)
+
+    def stage(self, name: str) -> _Stage:
+        """Medir un bloque de código como parte de una etapa"""
+        return _Stage(self, name)
+
+    def add(self, name: str, seconds: float):
+        """Sumar una duración a una etapa"""
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    def merge(self, other: 'StageTimer'):
+        """Sumar los tiempos y bytes de otro medidor"""
+        for name, seconds in other.durations.items():
+            self.add(name, seconds)
+        self.bytes_read += other.bytes_read
+        self.bytes_written += other.bytes_written
+
+    def apply(self, result):
+        """
+        Copiar las mediciones a un resultado
+
+        Args:
+            result: ProcessResult a completar
+
+        Returns:
+            El mismo resultado
+        """
+        result.timings = dict(self.durations)
+        result.bytes_read = self.bytes_read
+        result.bytes_written = self.bytes_written
+        return result
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    Percentil por rango más cercano
+
+    Args:
+        sorted_values: Valores ya ordenados de menor a mayor
+        pct: Percentil (0-100)
+
+    Returns:
+        Valor del percentil (0.0 si no hay valores)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))  # Redondeo hacia arriba
+    return sorted_values[min(int(rank), len(sorted_values)) - 1]
+
+
+def summarize_samples(samples: Iterable[float]) -> Dict[str, float]:
+    """
+    Percentiles de una lista de duraciones
+
+    Returns:
+        Diccionario {'p50': ..., 'p90': ..., 'p99': ..., 'max': ...}
+    """
+    values = sorted(samples)
+    stats = {f'p{pct}': percentile(values, pct) for pct in PERCENTILES}
+    stats['max'] = values[-1] if values else 0.0
+    return stats
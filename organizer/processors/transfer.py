@@ -0,0 +1,139 @@
+"""
+Estrategias para llevar un archivo a su destino: copia, copia del kernel, clon, enlace duro o movimiento
+"""
+import errno
+import os
+import shutil
+import sys
+from typing import Callable, Dict
+
+TRANSFER_COPY = "copy"
+TRANSFER_KERNEL_COPY = "kernel_copy"
+TRANSFER_REFLINK = "reflink"
+TRANSFER_HARDLINK = "hardlink"
+TRANSFER_MOVE = "move"
+TRANSFER_STRATEGIES = (TRANSFER_COPY, TRANSFER_KERNEL_COPY, TRANSFER_REFLINK, TRANSFER_HARDLINK, TRANSFER_MOVE)
+DEFAULT_TRANSFER = TRANSFER_COPY
+
+# Nombres visibles de cada estrategia
+TRANSFER_LABELS = {
+    TRANSFER_COPY: "Copiar (conserva el original)",
+    TRANSFER_KERNEL_COPY: "Copia rápida del sistema (copy_file_range)",
+    TRANSFER_REFLINK: "Clonar sin duplicar datos (copy-on-write: Btrfs y XFS en Linux, APFS en macOS)",
+    TRANSFER_HARDLINK: "Enlace duro (misma unidad, sin duplicar datos)",
+    TRANSFER_MOVE: "Mover (misma unidad, quita el original)",
+}
+
+# Estrategias que no escriben los datos del archivo, solo metadatos del sistema de archivos
+METADATA_ONLY = (TRANSFER_REFLINK, TRANSFER_HARDLINK, TRANSFER_MOVE)
+
+# ioctl de Linux para clonar un archivo completo (FICLONE)
+_FICLONE = 0x40049409
+
+
+def _kernel_copy(source: str, destination: str):
+    """Copiar dentro del kernel con os.copy_file_range, sin pasar los datos por Python"""
+    if not hasattr(os, "copy_file_range"):
+        raise NotImplementedError("copy_file_range no disponible")
+
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        remaining = os.fstat(src.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+        if remaining > 0:
+            raise OSError(errno.EIO, "copia incompleta", destination)
+    shutil.copystat(source, destination)
+
+
+def _reflink(source: str, destination: str):
+    """Clonar el archivo compartiendo sus bloques de datos (FICLONE en Linux, clonefile en macOS)"""
+    if sys.platform == "darwin":
+        _clonefile(source, destination)
+        return
+    if not sys.platform.startswith("linux"):
+        raise NotImplementedError("clonado no disponible en este sistema")
+
+    import fcntl
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    shutil.copystat(source, destination)
+
+
+def _clonefile(source: str, destination: str):
+    """Clonar con clonefile(2) de macOS; como no admite un destino existente, se clona a un temporal"""
+    import ctypes
+    libc = ctypes.CDLL(None, use_errno=True)
+    clonefile = getattr(libc, "clonefile", None)
+    if clonefile is None:
+        raise NotImplementedError("clonefile no disponible (macOS 10.12 o posterior)")
+    clonefile.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32)
+    clonefile.restype = ctypes.c_int
+
+    temp_path = f"{destination}.{os.getpid()}.tmp"
+    if clonefile(os.fsencode(source), os.fsencode(temp_path), 0) != 0:
+        error = ctypes.get_errno()
+        raise OSError(error, os.strerror(error), source)
+    try:
+        os.replace(temp_path, destination)
+    except OSError:
+        os.remove(temp_path)
+        raise
+
+
+def _hardlink(source: str, destination: str):
+    """Crear un enlace duro; si el destino ya existe se sustituye de forma atómica"""
+    temp_path = f"{destination}.{os.getpid()}.tmp"
+    os.link(source, temp_path)
+    try:
+        os.replace(temp_path, destination)
+    except OSError:
+        os.remove(temp_path)
+        raise
+
+
+def _move(source: str, destination: str):
+    """Mover sin copiar datos (falla con EXDEV si el destino está en otra unidad)"""
+    os.replace(source, destination)
+
+
+_TRANSFERS: Dict[str, Callable[[str, str], None]] = {
+    TRANSFER_KERNEL_COPY: _kernel_copy,
+    TRANSFER_REFLINK: _reflink,
+    TRANSFER_HARDLINK: _hardlink,
+    TRANSFER_MOVE: _move,
+}
+
+
+def transfer_file(source: str, destination: str, strategy: str = DEFAULT_TRANSFER) -> str:
+    """
+    Lleva un archivo a su destino con la estrategia pedida, o con una copia normal si no es posible
+
+    El destino puede existir (p. ej. el archivo vacío reservado por
+    OutputNameIndex) y se sobrescribe. Si la estrategia falla (otra unidad,
+    sistema de archivos sin soporte, permisos...) se copia con shutil.copy2;
+    con "move" el original se conserva en ese caso. Quien llama compara la
+    estrategia devuelta con la pedida para avisar de la copia normal.
+
+    Args:
+        source: Archivo de origen
+        destination: Ruta de destino
+        strategy: Estrategia (ver TRANSFER_STRATEGIES)
+
+    Returns:
+        Estrategia usada realmente
+    """
+    if strategy not in TRANSFER_STRATEGIES:
+        raise ValueError(f"Estrategia de transferencia desconocida: {strategy}")
+
+    if strategy != TRANSFER_COPY:
+        try:
+            _TRANSFERS[strategy](source, destination)
+            return strategy
+        except (OSError, NotImplementedError):
+            pass
+
+    shutil.copy2(source, destination)
+    return TRANSFER_COPY
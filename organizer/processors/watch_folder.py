@@ -0,0 +1,207 @@
+"""
+Modo vigilancia: procesa cada PDF que aparece en una carpeta en cuanto termina de copiarse
+"""
+import logging
+import os
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+from typing import Dict, Iterator, Optional, Tuple
+
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+
+from .pdf_processor import PDFProcessor, ProcessResult
+
+# Segundos sin cambios de tamaño ni fecha para considerar que un archivo terminó de escribirse
+DEFAULT_SETTLE_SECONDS = 2.0
+
+# Intervalo entre revisiones de los archivos pendientes
+POLL_INTERVAL = 0.5
+
+# Registro rotativo: tamaño máximo de cada archivo y copias conservadas
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+LOG_FILENAME = "organizador_vigilancia.log"
+
+
+def create_rolling_log(log_path: str) -> logging.Logger:
+    """
+    Crea un registro que rota al alcanzar LOG_MAX_BYTES
+
+    Args:
+        log_path: Ruta del archivo de registro
+
+    Returns:
+        Logger configurado (uno por ruta)
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
+    logger = logging.getLogger(f"organizer.watch.{os.path.abspath(log_path)}")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    if not logger.handlers:
+        handler = RotatingFileHandler(
+            log_path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+        logger.addHandler(handler)
+    return logger
+
+
+class _PDFEventHandler(FileSystemEventHandler):
+    """Anota como pendiente cada PDF creado, modificado o movido dentro de la carpeta"""
+
+    def __init__(self, watcher: "FolderWatcher"):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.watcher.mark_pending(event.src_path)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.watcher.mark_pending(event.src_path)
+
+    def on_moved(self, event):
+        # Los escáneres suelen escribir con un nombre temporal y renombrar al terminar
+        if not event.is_directory:
+            self.watcher.mark_pending(event.dest_path)
+
+
+class FolderWatcher:
+    """
+    Vigila una carpeta y procesa cada PDF nuevo sin volver a recorrer la carpeta entera
+
+    Los eventos del sistema de archivos solo anotan el archivo como pendiente; el
+    archivo se procesa cuando su tamaño y fecha no cambian durante settle_seconds
+    y puede abrirse para lectura. Los PDFs de una página se renombran y los de
+    varias páginas se separan por trabajador.
+
+    Uso:
+        watcher = FolderWatcher(entrada, salida, PDFProcessor())
+        for result in watcher.iter_results():
+            ...
+        # desde otro hilo: watcher.stop()
+    """
+
+    def __init__(self, input_folder: str, output_folder: str, processor: PDFProcessor,
+                 settle_seconds: float = DEFAULT_SETTLE_SECONDS, log_path: Optional[str] = None,
+                 process_existing: bool = False):
+        """
+        Args:
+            input_folder: Carpeta vigilada (sin subcarpetas)
+            output_folder: Carpeta donde dejar los PDFs procesados
+            processor: Procesador usado para renombrar y separar
+            settle_seconds: Segundos sin cambios antes de procesar un archivo
+            log_path: Registro rotativo (por defecto, en la carpeta de salida)
+            process_existing: Procesar también los PDFs que ya estaban en la carpeta
+        """
+        self.input_folder = os.path.realpath(input_folder)
+        self.output_folder = output_folder
+        self.processor = processor
+        self.settle_seconds = settle_seconds
+        self.log_path = log_path or os.path.join(output_folder, LOG_FILENAME)
+        self.process_existing = process_existing
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        # Ruta → (tamaño, mtime_ns, momento del último cambio)
+        self._pending: Dict[str, Tuple[int, int, float]] = {}
+        # Ruta → (tamaño, mtime_ns) de la versión ya procesada
+        self._processed: Dict[str, Tuple[int, int]] = {}
+
+    def mark_pending(self, path: str):
+        """Anotar un archivo para procesarlo cuando deje de cambiar"""
+        path = os.path.realpath(path)
+        if not path.lower().endswith('.pdf') or os.path.dirname(path) != self.input_folder:
+            return
+        with self._lock:
+            # (-1, -1) obliga a tomar el tamaño y la fecha en la próxima revisión
+            self._pending[path] = (-1, -1, time.monotonic())
+
+    def stop(self):
+        """Detener la vigilancia (iter_results termina tras el archivo en curso)"""
+        self._stop_event.set()
+
+    def iter_results(self) -> Iterator[ProcessResult]:
+        """
+        Vigila la carpeta hasta llamar a stop() entregando cada resultado en cuanto se produce
+
+        Yields:
+            Resultado de cada archivo renombrado o de cada página separada
+        """
+        os.makedirs(self.output_folder, exist_ok=True)
+        log = create_rolling_log(self.log_path)
+        log.info("Vigilando %s → %s", self.input_folder, self.output_folder)
+
+        if self.process_existing:
+            for path in self.processor.list_pdf_files(self.input_folder):
+                self.mark_pending(path)
+
+        observer = Observer()
+        observer.schedule(_PDFEventHandler(self), self.input_folder, recursive=False)
+        observer.start()
+        try:
+            while not self._stop_event.is_set():
+                for path in self._ready_files():
+                    for result in self._process_file(path):
+                        self._log_result(log, result)
+                        yield result
+                self._stop_event.wait(POLL_INTERVAL)
+        finally:
+            observer.stop()
+            observer.join()
+            log.info("Vigilancia detenida")
+
+    def _ready_files(self) -> list:
+        """Archivos pendientes que ya no cambian y pueden leerse, en orden de llegada"""
+        now = time.monotonic()
+        ready = []
+        with self._lock:
+            for path, (size, mtime_ns, changed_at) in list(self._pending.items()):
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    # Borrado o renombrado antes de procesarlo
+                    del self._pending[path]
+                    continue
+
+                current = (stat.st_size, stat.st_mtime_ns)
+                if current != (size, mtime_ns):
+                    self._pending[path] = current + (now,)
+                    continue
+                if stat.st_size == 0 or now - changed_at < self.settle_seconds:
+                    continue
+                if self._processed.get(path) == current:
+                    del self._pending[path]
+                    continue
+                if not self._can_read(path):
+                    continue
+
+                del self._pending[path]
+                self._processed[path] = current
+                ready.append(path)
+        return ready
+
+    def _can_read(self, path: str) -> bool:
+        """Comprobar que el archivo no sigue bloqueado por quien lo escribe (Windows)"""
+        try:
+            with open(path, 'rb'):
+                return True
+        except OSError:
+            return False
+
+    def _process_file(self, path: str) -> Iterator[ProcessResult]:
+        """Renombrar un PDF de una página o separar uno de varias páginas"""
+        if self.processor.get_page_count(path) > 1:
+            yield from self.processor.iter_separate_multi_page_pdf(path, self.output_folder)
+        else:
+            yield self.processor.rename_single_pdf(path, self.output_folder)
+
+    def _log_result(self, log: logging.Logger, result: ProcessResult):
+        """Escribir un resultado en el registro rotativo"""
+        if result.success:
+            log.info("OK %s → %s (%s)", result.original_file, result.new_name, result.worker_name)
+        else:
+            log.warning("ERROR %s: %s", result.original_file, result.error)
@@ -0,0 +1,116 @@
+"""
+Modelo del explorador: QFileSystemModel con el tamaño de las carpetas en la columna "Tamaño"
+"""
+import os
+from PySide6.QtCore import QFileSystemWatcher, QLocale, QModelIndex, Qt
+from PySide6.QtWidgets import QFileSystemModel
+
+from ..processors.folder_sizes import FolderSizeCache, FolderSizeScanner
+
+# Columna de tamaño de QFileSystemModel (Nombre, Tamaño, Tipo, Fecha)
+SIZE_COLUMN = 1
+
+# Texto mientras se calcula el tamaño de una carpeta
+PENDING_SIZE_TEXT = "…"
+
+# Carpetas vigiladas a la vez para invalidar su tamaño (los sistemas limitan los vigilantes)
+MAX_WATCHED_FOLDERS = 2000
+
+
+class FolderSizeModel(QFileSystemModel):
+    """
+    QFileSystemModel que muestra también el tamaño de las carpetas
+
+    El tamaño lo calcula FolderSizeScanner en su hilo; mientras tanto se
+    muestra PENDING_SIZE_TEXT. La interfaz nunca recorre carpetas: la caché
+    se consulta solo por ruta, sin llamadas al sistema de archivos (la fecha
+    que guarda QFileSystemModel de una subcarpeta no se actualiza cuando
+    cambia su contenido). Las carpetas mostradas se vigilan con
+    QFileSystemWatcher y, cuando cambian, se descarta su tamaño y el de las
+    carpetas que las contienen. Volver a una carpeta ya vista es inmediato;
+    al empezar a vigilarla se pide una vez al escáner que compruebe su fecha.
+    Los cambios en subcarpetas más profundas o dentro de archivos existentes
+    no se vigilan: se recogen con invalidate_folder_sizes() (Actualizar).
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.size_cache = FolderSizeCache()
+        self.scanner = FolderSizeScanner(self.size_cache, self)
+        self.scanner.size_ready.connect(self.handle_size_ready)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.handle_directory_changed)
+        self._watched = set()
+        self.scanner.start()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if index.column() == SIZE_COLUMN and role == Qt.ItemDataRole.DisplayRole and self.isDir(index):
+            path = self.filePath(index)
+            size = self.size_cache.get(path)
+            if size is None:
+                self.scanner.request(path)
+                return PENDING_SIZE_TEXT
+            if self._watch(path):
+                # Puede haber cambiado mientras no se vigilaba: el escáner lo comprueba por su fecha
+                self.scanner.request(path)
+            return QLocale.system().formattedDataSize(size)
+        return super().data(index, role)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if section == SIZE_COLUMN and orientation == Qt.Orientation.Horizontal \
+                and role == Qt.ItemDataRole.DisplayRole:
+            return "Tamaño"
+        return super().headerData(section, orientation, role)
+
+    def setRootPath(self, path: str) -> QModelIndex:
+        # Lo pendiente de la carpeta anterior ya no se muestra; su caché se conserva
+        self.scanner.clear()
+        if self._watched:
+            self.watcher.removePaths(list(self._watched))
+            self._watched.clear()
+        return super().setRootPath(path)
+
+    def invalidate_folder_sizes(self, path: str):
+        """Recalcular el tamaño de una carpeta y de todo lo que contiene (botón Actualizar)"""
+        self.size_cache.invalidate_tree(path)
+        self._size_changed(path)
+
+    def shutdown(self):
+        """Detener el escáner (antes de cerrar la ventana)"""
+        self.scanner.stop()
+        self.scanner.wait()
+
+    def handle_size_ready(self, path: str):
+        self._size_changed(path)
+
+    def handle_directory_changed(self, path: str):
+        if not os.path.isdir(path):
+            # El vigilante deja de seguir las carpetas borradas
+            self._watched.discard(path)
+        for folder in self.size_cache.invalidate(path) or [path]:
+            self._size_changed(folder)
+
+    def _watch(self, path: str) -> bool:
+        """
+        Vigilar una carpeta mostrada para invalidar su tamaño si cambia
+
+        Returns:
+            True si se empezó a vigilar ahora
+        """
+        if path in self._watched or len(self._watched) >= MAX_WATCHED_FOLDERS:
+            return False
+        self._watched.add(path)
+        self.watcher.addPath(path)
+        return True
+
+    def _size_changed(self, path: str):
+        """Avisar a la vista de que el tamaño de una carpeta (y de las que la contienen) cambió"""
+        path = os.path.normpath(path)
+        while True:
+            index = self.index(path, SIZE_COLUMN)
+            if index.isValid():
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
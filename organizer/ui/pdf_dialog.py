@@ -1,7 +1,6 @@
 """
 Diálogo principal para procesar PDFs - Versión limpia y modularizada
 """
-import os
 from typing import List
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, 
@@ -13,8 +12,8 @@ from PySide6.QtGui import QFont
 
 from .styles import UIStyles
 from .pdf_tabs import ConfigurationTab, ResultsTab, PreviewTab
-from ..processors.pdf_processor import PDFProcessor, ProcessResult
-from ..processors.pdf_thread import PDFProcessorThread
+from ..processors.pdf_processor import PDFProcessor, ProcessResult, ResultSummary
+from ..processors.pdf_thread import PDFProcessorThread, PreviewThread
 
 
 class PDFProcessorDialog(QDialog):
@@ -35,10 +34,19 @@ class PDFProcessorDialog(QDialog):
         """)
         
         self.results: List[ProcessResult] = []
+        self.summary = ResultSummary()
         self.worker_thread = None
+        self.preview_thread = None
+        # Plan calculado por la última vista previa completa (lo reutiliza "Procesar")
+        self.job_plan = None
+        # Vistas previas canceladas que aún no terminaron (se conservan hasta que acaben)
+        self._finishing_previews = set()
         
         self.setup_ui()
         
+        # Una vista previa (en curso o terminada) deja de ser válida al cambiar la configuración
+        self.config_tab.config_changed.connect(self.invalidate_preview)
+        
     def setup_ui(self):
         """Configurar interfaz de usuario"""
         layout = QVBoxLayout(self)
@@ -121,51 +129,98 @@ class PDFProcessorDialog(QDialog):
         layout.addLayout(button_layout)
     
     def preview_processing(self):
-        """Mostrar vista previa sin procesar"""
+        """Mostrar vista previa sin procesar (se calcula en segundo plano)"""
         is_valid, error_msg = self.config_tab.validate_config()
         if not is_valid:
             QMessageBox.warning(self, "Error", error_msg)
             return
         
-        try:
-            config = self.config_tab.get_config()
-            
-            # Validación específica para organización por trabajador
-            if config['process_type'] == 2:  # Organizar por trabajador
-                if not self._validate_organize_input(config['input_path']):
-                    return
-            
-            preview_text = self._generate_preview_text(config)
-            self.preview_tab.update_preview(preview_text)
-            
-            # Cambiar a pestaña de vista previa
-            self.tab_widget.setCurrentIndex(2)
-            
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Error generando vista previa: {str(e)}")
+        config = self.config_tab.get_config()
+        process_types = ["separate", "rename", "organize"]
+        
+        self.cancel_preview()
+        self.preview_tab.update_preview("")
+        self.status_label.setText("Generando vista previa...")
+        
+        thread = PreviewThread(
+            config['input_path'],
+            config['output_path'],
+            process_types[config['process_type']],
+            use_cache=config['use_cache'],
+            max_workers=config['max_workers'],
+            transfer=config['transfer'],
+            discovery=config['discovery'],
+            extraction=config['extraction']
+        )
+        thread.lines_ready.connect(self.handle_preview_lines)
+        thread.plan_progress.connect(self.handle_plan_progress)
+        thread.plan_ready.connect(self.handle_plan_ready)
+        thread.preview_finished.connect(self.preview_finished)
+        thread.error_occurred.connect(self.handle_preview_error)
+        thread.finished.connect(lambda: self._finishing_previews.discard(thread))
+        self._finishing_previews.add(thread)
+        self.preview_thread = thread
+        thread.start()
+        
+        # Cambiar a pestaña de vista previa
+        self.tab_widget.setCurrentIndex(2)
+    
+    def cancel_preview(self):
+        """Cancelar la vista previa en curso, si la hay"""
+        if self.preview_thread is None:
+            return
+        self.preview_thread.cancel()
+        if self.preview_thread.isRunning():
+            self.status_label.setText("Vista previa cancelada")
+        self.preview_thread = None
+    
+    def invalidate_preview(self):
+        """Cancelar la vista previa en curso y descartar el plan de la última (la configuración cambió)"""
+        self.cancel_preview()
+        self.job_plan = None
+    
+    def _is_current_preview(self) -> bool:
+        """Comprobar que una señal viene de la vista previa vigente y no de una cancelada"""
+        sender = self.sender()
+        return sender is not None and sender is self.preview_thread
+    
+    def handle_preview_lines(self, lines: List[str]):
+        """Agregar a la vista previa un bloque de líneas recién calculado"""
+        if self._is_current_preview():
+            self.preview_tab.append_preview(lines)
+    
+    def handle_plan_progress(self, done: int, total: int):
+        """Mostrar el avance de la planificación"""
+        if self._is_current_preview():
+            self.status_label.setText(f"Generando vista previa... {done}/{total}")
     
+    def handle_plan_ready(self, plan):
+        """Guardar el plan de la vista previa para reutilizarlo al procesar"""
+        if self._is_current_preview():
+            self.job_plan = plan
+    
+    def preview_finished(self):
+        """Vista previa terminada"""
+        if self._is_current_preview():
+            self.status_label.setText("Vista previa lista")
+            self.preview_thread = None
+    
+    def handle_preview_error(self, error_msg: str):
+        """Mostrar un error de la vista previa"""
+        if self._is_current_preview():
+            self.preview_tab.append_preview(["", error_msg])
+            self.status_label.setText("Error en la vista previa")
+            self.preview_thread = None
+        
     def _validate_organize_input(self, input_path: str) -> bool:
         """Validar entrada específica para organización por trabajador"""
         try:
-            # Verificar que existan subcarpetas con PDFs procesados
-            subfolders_found = 0
+            # Verificar que existan subcarpetas de tipo reconocido con PDFs procesados
+            # (el listado queda guardado para la vista previa y el procesamiento)
             processor = PDFProcessor()
-            
-            for item in os.listdir(input_path):
-                subfolder_path = os.path.join(input_path, item)
-                
-                if not os.path.isdir(subfolder_path):
-                    continue
-                
-                # Verificar si es una carpeta de tipo reconocido
-                doc_type = processor.detect_document_type(item)
-                if not doc_type:
-                    continue
-                
-                # Verificar que tenga PDFs
-                pdf_files = [f for f in os.listdir(subfolder_path) if f.lower().endswith('.pdf')]
-                if pdf_files:
-                    subfolders_found += 1
+            subfolders_found = sum(
+                1 for folder in processor.scan_processed_folders(input_path) if folder.pdf_files
+            )
             
             if subfolders_found == 0:
                 QMessageBox.warning(
@@ -185,126 +240,6 @@ class PDFProcessorDialog(QDialog):
             QMessageBox.warning(self, "Error", f"Error validando carpetas: {str(e)}")
             return False
     
-    def _generate_preview_text(self, config: dict) -> str:
-        """Generar texto de vista previa"""
-        try:
-            processor = PDFProcessor()
-            preview_lines = []
-            
-            input_path = config['input_path']
-            process_type = config['process_type']
-            
-            if process_type == 0:  # Separar PDF
-                preview_lines.append(f"SEPARANDO PDF: {os.path.basename(input_path)}")
-                preview_lines.append("-" * 50)
-                
-                # Obtener información del PDF
-                import PyPDF2
-                with open(input_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    total_pages = len(pdf_reader.pages)
-                    
-                    # Mostrar primeras 5 páginas como ejemplo
-                    max_preview = min(5, total_pages)
-                    for i in range(max_preview):
-                        text = processor.extract_text_from_pdf(input_path, i)
-                        worker_name = processor.extract_worker_name(text)
-                        
-                        if worker_name:
-                            clean_name = processor.clean_filename(worker_name)
-                            preview_lines.append(f"Página {i+1}: {worker_name}")
-                            preview_lines.append(f"  → Archivo: {clean_name}.pdf")
-                        else:
-                            preview_lines.append(f"Página {i+1}: [Sin nombre detectado]")
-                            preview_lines.append(f"  → Archivo: Pagina_{i+1:03d}.pdf")
-                    
-                    if total_pages > 5:
-                        preview_lines.append(f"... y {total_pages - 5} páginas más")
-                        
-            elif process_type == 1:  # Renombrar individuales
-                preview_lines.append(f"RENOMBRANDO PDFs EN: {input_path}")
-                preview_lines.append("-" * 50)
-                
-                pdf_files = [f for f in os.listdir(input_path) if f.lower().endswith('.pdf')][:10]
-                
-                for pdf_file in pdf_files:
-                    full_path = os.path.join(input_path, pdf_file)
-                    text = processor.extract_text_from_pdf(full_path)
-                    worker_name = processor.extract_worker_name(text)
-                    
-                    if worker_name:
-                        clean_name = processor.clean_filename(worker_name)
-                        preview_lines.append(f"'{pdf_file}' → '{clean_name}.pdf'")
-                        preview_lines.append(f"  Trabajador: {worker_name}")
-                    else:
-                        preview_lines.append(f"'{pdf_file}' → [Sin cambios - no se detectó nombre]")
-                
-                total_pdfs = len([f for f in os.listdir(input_path) if f.lower().endswith('.pdf')])
-                if total_pdfs > 10:
-                    preview_lines.append(f"... y {total_pdfs - 10} archivos más")
-            
-            elif process_type == 2:  # Organizar por trabajador
-                preview_lines.append(f"ORGANIZANDO POR TRABAJADOR EN: {input_path}")
-                preview_lines.append("-" * 60)
-                
-                # Escanear subcarpetas disponibles
-                subfolders_with_pdfs = []
-                worker_docs = {}
-                
-                for item in os.listdir(input_path):
-                    subfolder_path = os.path.join(input_path, item)
-                    
-                    if not os.path.isdir(subfolder_path):
-                        continue
-                    
-                    # Detectar tipo de documento
-                    doc_type = processor.detect_document_type(item)
-                    if not doc_type:
-                        continue
-                    
-                    # Contar PDFs en la subcarpeta
-                    pdf_files = [f for f in os.listdir(subfolder_path) if f.lower().endswith('.pdf')]
-                    if pdf_files:
-                        subfolders_with_pdfs.append(f"📁 {item} ({len(pdf_files)} PDFs) → {doc_type}")
-                        
-                        # Analizar algunos archivos para detectar trabajadores
-                        for pdf_file in pdf_files[:3]:  # Solo primeros 3 por carpeta
-                            worker_name = processor.extract_worker_name_from_filename(pdf_file)
-                            if worker_name:
-                                if worker_name not in worker_docs:
-                                    worker_docs[worker_name] = {}
-                                worker_docs[worker_name][doc_type] = pdf_file
-                
-                # Mostrar carpetas encontradas
-                if subfolders_with_pdfs:
-                    preview_lines.append("Carpetas procesadas encontradas:")
-                    for folder_info in subfolders_with_pdfs:
-                        preview_lines.append(f"  {folder_info}")
-                    
-                    preview_lines.append("")
-                    preview_lines.append(f"Trabajadores únicos detectados: {len(worker_docs)}")
-                    preview_lines.append("")
-                    
-                    # Mostrar estructura resultante (primeros 3 trabajadores)
-                    preview_lines.append("Estructura resultante (muestra):")
-                    preview_lines.append("PDFs_Procesados_Trabajadores/")
-                    
-                    for i, (worker_name, docs) in enumerate(list(worker_docs.items())[:3]):
-                        preview_lines.append(f"  📂 {worker_name}/")
-                        for doc_type in docs.keys():
-                            preview_lines.append(f"    📄 {worker_name}_{doc_type}.pdf")
-                    
-                    if len(worker_docs) > 3:
-                        preview_lines.append(f"  ... y {len(worker_docs) - 3} trabajadores más")
-                else:
-                    preview_lines.append("❌ No se encontraron subcarpetas con PDFs procesados")
-                    preview_lines.append("Busca carpetas como: PDFs_Procesados_Certificados, PDFs_Procesados_5rentas, etc.")
-            
-            return "\n".join(preview_lines)
-            
-        except Exception as e:
-            return f"Error generando vista previa: {str(e)}"
-    
     def start_processing(self):
         """Iniciar procesamiento en hilo separado"""
         is_valid, error_msg = self.config_tab.validate_config()
@@ -319,22 +254,57 @@ class PDFProcessorDialog(QDialog):
             if not self._validate_organize_input(config['input_path']):
                 return
         
-        # Configurar UI para procesamiento
-        self._set_processing_state(True)
+        # La vista previa compite por el disco con el procesamiento
+        self.cancel_preview()
         
-        # Crear y configurar hilo
+        # Reutilizar el plan de la vista previa si es del mismo trabajo (se usa una sola vez)
         process_types = ["separate", "rename", "organize"]
         process_type = process_types[config['process_type']]
+        plan = self.job_plan
+        self.job_plan = None
+        if plan is not None and not plan.matches(process_type, config['input_path'], config['output_path']):
+            plan = None
+        if plan is not None and not plan.has_free_space():
+            reply = QMessageBox.question(
+                self, "Espacio insuficiente",
+                f"Se estima que harán falta {plan.estimated_bytes / 1048576:.1f} MB y la unidad de "
+                f"salida solo tiene {plan.free_bytes() / 1048576:.1f} MB libres.\n\n¿Desea procesar de todos modos?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                self.job_plan = plan
+                return
+        
+        # Configurar UI para procesamiento
+        self._set_processing_state(True)
         
+        # Limpiar resultados anteriores y mostrar los nuevos a medida que llegan
+        self.results = []
+        self.summary = ResultSummary()
+        self.results_tab.clear_results()
+        self.results_tab.update_summary(self.summary.as_dict())
+        self.tab_widget.setCurrentIndex(1)
+        
+        # Crear y configurar hilo
         self.worker_thread = PDFProcessorThread(
             config['input_path'],
             config['output_path'],
-            process_type
+            process_type,
+            max_workers=config['max_workers'],
+            use_cache=config['use_cache'],
+            resume=config['resume'],
+            transfer=config['transfer'],
+            discovery=config['discovery'],
+            sync=config['sync'],
+            extraction=config['extraction'],
+            plan=plan
         )
         
         # Conectar señales
         self.worker_thread.progress.connect(self.progress_bar.setValue)
         self.worker_thread.status_update.connect(self.status_label.setText)
+        self.worker_thread.results_batch.connect(self.handle_results_batch)
         self.worker_thread.result_ready.connect(self.handle_results)
         self.worker_thread.finished_processing.connect(self.processing_finished)
         self.worker_thread.error_occurred.connect(self.handle_error)
@@ -350,17 +320,20 @@ class PDFProcessorDialog(QDialog):
         if processing:
             self.progress_bar.setValue(0)
     
+    def handle_results_batch(self, results: List[ProcessResult]):
+        """Agregar un lote de resultados recibido durante el procesamiento"""
+        self.results.extend(results)
+        self.summary.add_all(results)
+        
+        # Agregar solo las filas nuevas y actualizar contadores acumulados
+        self.results_tab.append_results(results)
+        self.results_tab.update_summary(self.summary.as_dict())
+    
     def handle_results(self, results: List[ProcessResult]):
-        """Manejar resultados del procesamiento"""
+        """Manejar resultados completos al finalizar el procesamiento"""
+        # La tabla y los contadores ya se llenaron lote a lote; falta calcular percentiles
         self.results = results
-        
-        # Actualizar pestaña de resultados
-        self.results_tab.update_results(results)
-        
-        # Generar y mostrar resumen
-        processor = PDFProcessor()
-        summary = processor.get_summary(results)
-        self.results_tab.update_summary(summary)
+        self.results_tab.update_summary(self.summary.as_dict(percentiles=True))
         
         # Cambiar a pestaña de resultados
         self.tab_widget.setCurrentIndex(1)
@@ -380,10 +353,10 @@ class PDFProcessorDialog(QDialog):
         self._set_processing_state(False)
         self.status_label.setText("Procesamiento completado")
         
-        if self.results:
+        if self.summary.total_processed:
             # Mostrar mensaje de finalización
-            successful = len([r for r in self.results if r.success])
-            total = len(self.results)
+            successful = self.summary.successful
+            total = self.summary.total_processed
             
             if successful == total:
                 QMessageBox.information(
@@ -402,6 +375,19 @@ class PDFProcessorDialog(QDialog):
                     "No se pudo procesar ningún archivo. Revisa los errores en la pestaña 'Resultados'."
                 )
     
+    def _stop_previews(self):
+        """Cancelar todas las vistas previas y esperar a que terminen su página o archivo en curso"""
+        self.cancel_preview()
+        for thread in list(self._finishing_previews):
+            thread.cancel()
+            thread.wait()
+        self._finishing_previews.clear()
+    
+    def done(self, result: int):
+        """Cerrar el diálogo sin dejar vistas previas en segundo plano"""
+        self._stop_previews()
+        super().done(result)
+    
     def closeEvent(self, event):
         """Manejar cierre del diálogo"""
         if self.worker_thread and self.worker_thread.isRunning():
@@ -7,17 +7,28 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox,
     QLabel, QLineEdit, QPushButton, QFileDialog, QComboBox,
     QTextEdit, QTableWidget, QTableWidgetItem,
-    QScrollArea, QFrame
+    QScrollArea, QFrame, QSpinBox, QCheckBox
 )
+from PySide6.QtCore import Signal
 from PySide6.QtGui import QColor
 
 from .styles import UIStyles
+from ..processors.block_extraction import DEFAULT_EXTRACTION, EXTRACTION_LABELS, EXTRACTION_MODES
+from ..processors.discovery import DEFAULT_INCLUDE, DiscoveryOptions, parse_patterns
 from ..processors.pdf_processor import ProcessResult
+from ..processors.parallel import default_worker_count
+from ..processors.sync_manifest import SyncOptions
+from ..processors.timing import STAGES, STAGE_LABELS
+from ..processors.transfer import DEFAULT_TRANSFER, TRANSFER_LABELS, TRANSFER_STRATEGIES
 
 
 class ConfigurationTab(QWidget):
     """Pestaña de configuración del procesador"""
     
+    # Cambió algún dato que afecta a la vista previa y a su plan (entrada, salida, tipo de proceso,
+    # caché, procesos, transferencia o lectura del texto)
+    config_changed = Signal()
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         # Aplicar estilos base al widget
@@ -87,6 +98,48 @@ class ConfigurationTab(QWidget):
         self.process_type.setStyleSheet(UIStyles.get_combobox_style())
         input_layout.addWidget(self.process_type, 1, 1, 1, 2)
         
+        # Búsqueda de archivos al renombrar
+        self.recursive = QCheckBox("Incluir subcarpetas (p. ej. archivos por año/mes/sede)")
+        self.recursive.setToolTip("Renombrar también los PDFs de todas las subcarpetas de la carpeta de entrada")
+        self.recursive.setStyleSheet(UIStyles.get_checkbox_style())
+        input_layout.addWidget(self.recursive, 2, 1, 1, 2)
+        
+        label_include = QLabel("Incluir:")
+        label_include.setStyleSheet(UIStyles.get_label_style())
+        input_layout.addWidget(label_include, 3, 0)
+        self.include_patterns = QLineEdit()
+        self.include_patterns.setPlaceholderText("; ".join(DEFAULT_INCLUDE))
+        self.include_patterns.setToolTip("Patrones de los archivos a renombrar, separados por ';' (p. ej. *.pdf; 2024/*)")
+        self.include_patterns.setStyleSheet(UIStyles.get_input_style())
+        input_layout.addWidget(self.include_patterns, 3, 1, 1, 2)
+        
+        label_exclude = QLabel("Excluir:")
+        label_exclude.setStyleSheet(UIStyles.get_label_style())
+        input_layout.addWidget(label_exclude, 4, 0)
+        self.exclude_patterns = QLineEdit()
+        self.exclude_patterns.setPlaceholderText("p. ej. borradores; *_copia.pdf; 2019/*")
+        self.exclude_patterns.setToolTip("Archivos y carpetas que no se renombran ni se recorren, separados por ';'")
+        self.exclude_patterns.setStyleSheet(UIStyles.get_input_style())
+        input_layout.addWidget(self.exclude_patterns, 4, 1, 1, 2)
+        self.discovery_widgets = [self.recursive, label_include, self.include_patterns,
+                                  label_exclude, self.exclude_patterns]
+        
+        # Sincronización incremental al organizar
+        self.incremental_sync = QCheckBox("Solo copiar lo nuevo o modificado desde la última vez")
+        self.incremental_sync.setToolTip(
+            "Salta los documentos cuya copia en la carpeta del trabajador ya tiene el mismo tamaño y fecha "
+            "(se guarda un manifiesto en la carpeta de salida)"
+        )
+        self.incremental_sync.setStyleSheet(UIStyles.get_checkbox_style())
+        input_layout.addWidget(self.incremental_sync, 5, 1, 1, 2)
+        
+        self.verify_hash = QCheckBox("Comparar el contenido si las fechas no coinciden (más lento)")
+        self.verify_hash.setToolTip("Evita volver a copiar documentos iguales copiados con otra herramienta")
+        self.verify_hash.setStyleSheet(UIStyles.get_checkbox_style())
+        self.verify_hash.setEnabled(False)
+        input_layout.addWidget(self.verify_hash, 6, 1, 1, 2)
+        self.sync_widgets = [self.incremental_sync, self.verify_hash]
+        
         # Inicializar placeholders
         self.update_placeholders()
         
@@ -116,6 +169,69 @@ class ConfigurationTab(QWidget):
         output_layout.setColumnStretch(1, 1)
         layout.addWidget(output_group)
         
+        # Grupo: Rendimiento
+        performance_group = QGroupBox("Rendimiento")
+        performance_group.setStyleSheet(UIStyles.get_group_style())
+        performance_layout = QGridLayout(performance_group)
+        performance_layout.setSpacing(10)
+        
+        label_workers = QLabel("Procesos en paralelo:")
+        label_workers.setStyleSheet(UIStyles.get_label_style())
+        performance_layout.addWidget(label_workers, 0, 0)
+        self.max_workers = QSpinBox()
+        self.max_workers.setRange(1, max(1, default_worker_count() * 2))
+        self.max_workers.setValue(default_worker_count())
+        self.max_workers.setToolTip("Núcleos usados al separar PDFs grandes y al renombrar carpetas (1 = secuencial)")
+        self.max_workers.setStyleSheet(UIStyles.get_spinbox_style())
+        performance_layout.addWidget(self.max_workers, 0, 1)
+        
+        self.use_cache = QCheckBox("Reutilizar texto y nombres ya extraídos (caché)")
+        self.use_cache.setChecked(True)
+        self.use_cache.setToolTip("Evita volver a leer PDFs sin cambios al repetir una vista previa o un proceso")
+        self.use_cache.setStyleSheet(UIStyles.get_checkbox_style())
+        performance_layout.addWidget(self.use_cache, 1, 0, 1, 3)
+        
+        self.resume_jobs = QCheckBox("Reanudar trabajos interrumpidos (saltar lo ya procesado)")
+        # Desactivado por defecto: reanudar borra las salidas a medio escribir del intento anterior
+        self.resume_jobs.setChecked(False)
+        self.resume_jobs.setToolTip(
+            "Cada trabajo guarda un diario en la carpeta de salida; si se interrumpe, "
+            "al repetirlo continúa donde quedó sin crear copias duplicadas"
+        )
+        self.resume_jobs.setStyleSheet(UIStyles.get_checkbox_style())
+        performance_layout.addWidget(self.resume_jobs, 2, 0, 1, 3)
+        
+        label_transfer = QLabel("Al renombrar/organizar:")
+        label_transfer.setStyleSheet(UIStyles.get_label_style())
+        performance_layout.addWidget(label_transfer, 3, 0)
+        self.transfer_strategy = QComboBox()
+        for strategy in TRANSFER_STRATEGIES:
+            self.transfer_strategy.addItem(TRANSFER_LABELS[strategy], strategy)
+        self.transfer_strategy.setCurrentIndex(TRANSFER_STRATEGIES.index(DEFAULT_TRANSFER))
+        self.transfer_strategy.setToolTip(
+            "Enlazar, clonar o mover evita duplicar los datos en la misma unidad; "
+            "si no es posible se hace una copia normal y se indica en los resultados"
+        )
+        self.transfer_strategy.setStyleSheet(UIStyles.get_combobox_style())
+        performance_layout.addWidget(self.transfer_strategy, 3, 1, 1, 2)
+        
+        label_extraction = QLabel("Lectura del texto:")
+        label_extraction.setStyleSheet(UIStyles.get_label_style())
+        performance_layout.addWidget(label_extraction, 4, 0)
+        self.extraction_mode = QComboBox()
+        for mode in EXTRACTION_MODES:
+            self.extraction_mode.addItem(EXTRACTION_LABELS[mode], mode)
+        self.extraction_mode.setCurrentIndex(EXTRACTION_MODES.index(DEFAULT_EXTRACTION))
+        self.extraction_mode.setToolTip(
+            "Leer por bloques de arriba abajo y parar en el primer nombre acelera las páginas con mucho texto; "
+            "la zona se aprende de las primeras páginas de cada PDF multi-página"
+        )
+        self.extraction_mode.setStyleSheet(UIStyles.get_combobox_style())
+        performance_layout.addWidget(self.extraction_mode, 4, 1, 1, 2)
+        
+        performance_layout.setColumnStretch(2, 1)
+        layout.addWidget(performance_group)
+        
         # Layout horizontal para guía de uso
         horizontal_layout = QHBoxLayout()
         horizontal_layout.setSpacing(15)
@@ -159,6 +275,19 @@ class ConfigurationTab(QWidget):
         
         # Conectar cambio de tipo de proceso para actualizar placeholders
         self.process_type.currentIndexChanged.connect(self.update_placeholders)
+        
+        # Avisar de los cambios que invalidan una vista previa en curso
+        self.input_path.textChanged.connect(self.config_changed)
+        self.output_path.textChanged.connect(self.config_changed)
+        self.process_type.currentIndexChanged.connect(self.config_changed)
+        self.max_workers.valueChanged.connect(self.config_changed)
+        self.use_cache.toggled.connect(self.config_changed)
+        self.transfer_strategy.currentIndexChanged.connect(self.config_changed)
+        self.extraction_mode.currentIndexChanged.connect(self.config_changed)
+        self.recursive.toggled.connect(self.config_changed)
+        self.include_patterns.textChanged.connect(self.config_changed)
+        self.exclude_patterns.textChanged.connect(self.config_changed)
+        self.incremental_sync.toggled.connect(self.verify_hash.setEnabled)
     
     def update_placeholders(self):
         """Actualizar placeholders según el tipo de procesamiento seleccionado"""
@@ -170,6 +299,12 @@ class ConfigurationTab(QWidget):
             self.input_path.setPlaceholderText("Selecciona carpeta con archivos PDF individuales...")
         elif process_index == 2:  # Organizar por trabajador
             self.input_path.setPlaceholderText("Selecciona carpeta padre con subcarpetas procesadas (PDFs_Procesados_*)...")
+        
+        # Subcarpetas y patrones solo se aplican al renombrar
+        for widget in self.discovery_widgets:
+            widget.setVisible(process_index == 1)
+        for widget in self.sync_widgets:
+            widget.setVisible(process_index == 2)
     
     def browse_input(self):
         """Buscar carpeta o archivo de entrada según el tipo de procesamiento"""
@@ -217,9 +352,27 @@ class ConfigurationTab(QWidget):
         return {
             'input_path': self.input_path.text(),
             'output_path': self.output_path.text(),
-            'process_type': self.process_type.currentIndex()
+            'process_type': self.process_type.currentIndex(),
+            'max_workers': self.max_workers.value(),
+            'use_cache': self.use_cache.isChecked(),
+            'resume': self.resume_jobs.isChecked(),
+            'transfer': self.transfer_strategy.currentData(),
+            'extraction': self.extraction_mode.currentData(),
+            'discovery': self.get_discovery_options(),
+            'sync': SyncOptions(
+                incremental=self.incremental_sync.isChecked(),
+                verify_hash=self.incremental_sync.isChecked() and self.verify_hash.isChecked()
+            )
         }
     
+    def get_discovery_options(self) -> DiscoveryOptions:
+        """Opciones de búsqueda de archivos al renombrar"""
+        return DiscoveryOptions(
+            recursive=self.recursive.isChecked(),
+            include=parse_patterns(self.include_patterns.text()) or DEFAULT_INCLUDE,
+            exclude=parse_patterns(self.exclude_patterns.text())
+        )
+    
     def validate_config(self) -> tuple[bool, str]:
         """Validar configuración actual"""
         if not self.input_path.text():
@@ -237,6 +390,11 @@ class ConfigurationTab(QWidget):
 class ResultsTab(QWidget):
     """Pestaña de resultados del procesamiento"""
     
+    BASE_COLUMNS = ["Archivo Original", "Nuevo Nombre", "Trabajador", "Estado", "Error"]
+    
+    # Columnas opcionales: milisegundos por etapa y kilobytes leídos/escritos
+    METRIC_COLUMNS = [f"{STAGE_LABELS[stage]} (ms)" for stage in STAGES] + ["Leído (KB)", "Escrito (KB)"]
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         # Aplicar estilos base al widget
@@ -257,14 +415,25 @@ class ResultsTab(QWidget):
         self.summary_label.setStyleSheet(UIStyles.get_status_style())
         layout.addWidget(self.summary_label)
         
+        # Mostrar u ocultar las columnas de rendimiento
+        self.show_metrics = QCheckBox("Mostrar tiempos por etapa y bytes procesados")
+        self.show_metrics.setStyleSheet(UIStyles.get_checkbox_style())
+        self.show_metrics.toggled.connect(self._set_metrics_visible)
+        layout.addWidget(self.show_metrics)
+        
         # Tabla de resultados
-        self.results_table = QTableWidget(0, 5)
-        self.results_table.setHorizontalHeaderLabels([
-            "Archivo Original", "Nuevo Nombre", "Trabajador", "Estado", "Error"
-        ])
+        columns = self.BASE_COLUMNS + self.METRIC_COLUMNS
+        self.results_table = QTableWidget(0, len(columns))
+        self.results_table.setHorizontalHeaderLabels(columns)
         self.results_table.horizontalHeader().setStretchLastSection(True)
         self.results_table.setStyleSheet(UIStyles.get_table_style())
         layout.addWidget(self.results_table)
+        self._set_metrics_visible(False)
+        
+    def _set_metrics_visible(self, visible: bool):
+        """Mostrar u ocultar las columnas de tiempos y bytes"""
+        for offset in range(len(self.METRIC_COLUMNS)):
+            self.results_table.setColumnHidden(len(self.BASE_COLUMNS) + offset, not visible)
         
     def update_results(self, results: List[ProcessResult]):
         """Actualizar tabla con nuevos resultados"""
@@ -272,7 +441,7 @@ class ResultsTab(QWidget):
         if not results:
             results = []
         
-        self.results_table.setRowCount(len(results))
+        self.clear_results()
         
         # Si no hay resultados, mostrar mensaje informativo
         if len(results) == 0:
@@ -281,27 +450,68 @@ class ResultsTab(QWidget):
             item.setBackground(QColor(UIStyles.COLORS['bg_subtle']))
             self.results_table.setItem(0, 0, item)
             # Vaciar las otras columnas
-            for j in range(1, 5):
+            for j in range(1, self.results_table.columnCount()):
                 empty_item = QTableWidgetItem("")
                 empty_item.setBackground(QColor(UIStyles.COLORS['bg_subtle']))
                 self.results_table.setItem(0, j, empty_item)
             return
         
-        for i, result in enumerate(results):
-            self.results_table.setItem(i, 0, QTableWidgetItem(result.original_file))
-            self.results_table.setItem(i, 1, QTableWidgetItem(result.new_name or ""))
-            self.results_table.setItem(i, 2, QTableWidgetItem(result.worker_name or ""))
-            self.results_table.setItem(i, 3, QTableWidgetItem("Exitoso" if result.success else "Error"))
-            self.results_table.setItem(i, 4, QTableWidgetItem(result.error or ""))
+        self.append_results(results)
+    
+    def clear_results(self):
+        """Vaciar la tabla de resultados"""
+        self.results_table.setRowCount(0)
+    
+    def append_results(self, results: List[ProcessResult]):
+        """Agregar un lote de resultados al final de la tabla"""
+        if not results:
+            return
+        
+        # Evitar repintar fila por fila mientras se inserta el lote
+        self.results_table.setUpdatesEnabled(False)
+        try:
+            start_row = self.results_table.rowCount()
+            self.results_table.setRowCount(start_row + len(results))
             
-            # Colorear filas según resultado usando colores del programa
-            if result.success:
-                color = QColor(UIStyles.COLORS['success_bg'])  # Verde claro para éxito
-            else:
-                color = QColor(UIStyles.COLORS['danger_bg'])   # Rojo claro para error
-                
-            for j in range(5):
-                self.results_table.item(i, j).setBackground(color)
+            for offset, result in enumerate(results):
+                self._fill_row(start_row + offset, result)
+        finally:
+            self.results_table.setUpdatesEnabled(True)
+        
+        self.results_table.scrollToBottom()
+    
+    def _fill_row(self, i: int, result: ProcessResult):
+        """Rellenar una fila de la tabla con un resultado"""
+        self.results_table.setItem(i, 0, QTableWidgetItem(result.original_file))
+        self.results_table.setItem(i, 1, QTableWidgetItem(result.new_name or ""))
+        self.results_table.setItem(i, 2, QTableWidgetItem(result.worker_name or ""))
+        if result.interrupted:
+            status = "Intento interrumpido"
+        elif result.skipped:
+            status = "Sin cambios"
+        elif result.transfer_fallback:
+            status = "Exitoso (copia normal)"
+        else:
+            status = "Exitoso" if result.success else "Error"
+        self.results_table.setItem(i, 3, QTableWidgetItem(status))
+        self.results_table.setItem(i, 4, QTableWidgetItem(result.error or ""))
+        
+        # Métricas de rendimiento (columnas opcionales)
+        metrics = [result.timings.get(stage, 0.0) * 1000 for stage in STAGES]
+        metrics += [result.bytes_read / 1024, result.bytes_written / 1024]
+        for offset, value in enumerate(metrics):
+            self.results_table.setItem(i, len(self.BASE_COLUMNS) + offset, QTableWidgetItem(f"{value:.1f}"))
+        
+        # Colorear filas según resultado usando colores del programa
+        if result.skipped or result.interrupted:
+            color = QColor(UIStyles.COLORS['bg_subtle'])   # Gris para lo que no se procesó en esta ejecución
+        elif result.success:
+            color = QColor(UIStyles.COLORS['success_bg'])  # Verde claro para éxito
+        else:
+            color = QColor(UIStyles.COLORS['danger_bg'])   # Rojo claro para error
+            
+        for j in range(self.results_table.columnCount()):
+            self.results_table.item(i, j).setBackground(color)
     
     def update_summary(self, summary: dict):
         """Actualizar resumen estadístico"""
@@ -313,6 +523,36 @@ class ResultsTab(QWidget):
             f"• Tasa de éxito: {summary['success_rate']:.1f}%\n"
             f"• Trabajadores únicos encontrados: {summary['workers_found']}"
         )
+        if summary.get('skipped'):
+            summary_text += f"\n• Sin cambios (no copiados): {summary['skipped']}"
+        if summary.get('interrupted'):
+            summary_text += (
+                f"\n• Salidas del intento interrumpido (borradas o devueltas al reanudar): {summary['interrupted']}"
+            )
+        if summary.get('transfer_fallbacks'):
+            summary_text += (
+                f"\n• Copia normal (no se pudo clonar, enlazar o mover): {summary['transfer_fallbacks']}"
+            )
+        
+        stage_totals = summary.get('stage_totals')
+        if stage_totals and any(stage_totals.values()):
+            stages_text = " | ".join(
+                f"{STAGE_LABELS[stage]}: {stage_totals.get(stage, 0.0):.2f} s" for stage in STAGES
+            )
+            summary_text += (
+                f"\n• Tiempo por etapa: {stages_text}"
+                f"\n• Leído: {summary['bytes_read'] / 1048576:.1f} MB | "
+                f"Escrito: {summary['bytes_written'] / 1048576:.1f} MB"
+            )
+        
+        percentiles = summary.get('stage_percentiles')
+        if percentiles and percentiles['total']['max'] > 0:
+            total = percentiles['total']
+            summary_text += (
+                f"\n• Tiempo por archivo: p50 {total['p50'] * 1000:.1f} ms | "
+                f"p90 {total['p90'] * 1000:.1f} ms | p99 {total['p99'] * 1000:.1f} ms"
+            )
+        
         self.summary_label.setText(summary_text)
 
 
@@ -379,7 +619,11 @@ el procesamiento real.
     def update_preview(self, preview_text: str):
         """Actualizar contenido de la vista previa"""
         self.preview_text.setPlainText(preview_text)
-        
+    
+    def append_preview(self, lines: List[str]):
+        """Agregar líneas al final de la vista previa (se completa a medida que se calcula)"""
+        self.preview_text.append("\n".join(lines))
+    
     def clear_preview(self):
         """Limpiar vista previa"""
         initial_text = """
@@ -224,6 +224,27 @@ class UIStyles:
             }}
         """
 
+    @classmethod
+    def get_spinbox_style(cls) -> str:
+        return f"""
+            QSpinBox {{
+                padding: 8px 12px;
+                border: 1px solid {cls.COLORS['border']};
+                border-radius: {cls.RADIUS}px;
+                background: {cls.COLORS['bg_subtle']};
+                font-size: 13px;
+                color: {cls.COLORS['text']};
+                min-height: 22px;
+            }}
+            QSpinBox:focus {{
+                border: 1px solid {cls.COLORS['accent']};
+                outline: none;
+            }}
+            QSpinBox:hover {{
+                border: 1px solid {cls.COLORS['accent']};
+            }}
+        """
+
     @classmethod
     def get_combobox_style(cls) -> str:
         return f"""
@@ -0,0 +1,328 @@
+"""
+Caché persistente (SQLite) de texto extraído y nombres detectados por página
+"""
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, Optional, Set, Tuple
+
+APP_CACHE_NAME = "OrganizadorArchivos"
+
+# Tamaño máximo del texto guardado antes de descartar las páginas menos usadas
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Escrituras acumuladas antes de confirmar la transacción
+FLUSH_EVERY = 200
+
+# Valor devuelto cuando una página no está en la caché (None es un nombre válido: "sin nombre")
+MISSING = object()
+
+# Nombre guardado para una página sin texto (None = con texto pero sin nombre)
+NO_TEXT = ""
+
+
+def default_cache_dir() -> str:
+    """
+    Carpeta de caché del usuario según el sistema operativo
+
+    Returns:
+        Ruta de la carpeta (puede no existir aún)
+    """
+    if sys.platform.startswith('win'):
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+        return os.path.join(base, APP_CACHE_NAME, 'Cache')
+    if sys.platform == 'darwin':
+        return os.path.join(os.path.expanduser('~/Library/Caches'), APP_CACHE_NAME)
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, APP_CACHE_NAME)
+
+
+def default_cache_path() -> str:
+    """Ruta del archivo SQLite de la caché de extracción"""
+    return os.path.join(default_cache_dir(), 'extraction_cache.sqlite3')
+
+
+def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Calcula el hash del contenido de un archivo
+
+    Args:
+        path: Ruta del archivo
+        chunk_size: Tamaño de bloque de lectura
+
+    Returns:
+        Hash SHA-256 en hexadecimal
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    Caché en disco de extracción de texto, direccionada por contenido
+
+    Guarda en dos capas, con clave hash del contenido + número de página:
+        - el texto extraído de cada página
+        - el nombre del trabajador detectado, por versión del conjunto de patrones
+
+    El hash de cada archivo se memoriza por (ruta, tamaño, mtime), así que en
+    ejecuciones posteriores sobre archivos sin cambios no hace falta ni leerlos.
+    Segura para usar desde varios hilos y varios procesos a la vez.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                 flush_every: int = FLUSH_EVERY):
+        """
+        Args:
+            db_path: Ruta del archivo SQLite (por defecto en la carpeta de caché del usuario)
+            max_bytes: Tamaño máximo del texto almacenado
+            flush_every: Escrituras pendientes antes de confirmar (1 = confirmar siempre)
+        """
+        self.db_path = db_path or default_cache_path()
+        self.max_bytes = max_bytes
+        self.flush_every = max(1, flush_every)
+        self._lock = threading.RLock()
+        self._pending_writes = 0
+        self._file_keys: Dict[Tuple[str, int, int], str] = {}
+        # Archivos leídos desde la caché: su fecha de uso se actualiza al confirmar
+        self._touched: Set[str] = set()
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        """Crear las tablas (o recrearlas si cambió el formato)"""
+        with self._lock:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != self.SCHEMA_VERSION:
+                self._conn.executescript("""
+                    DROP TABLE IF EXISTS files;
+                    DROP TABLE IF EXISTS page_text;
+                    DROP TABLE IF EXISTS page_names;
+                """)
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    file_hash TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS page_text (
+                    file_hash TEXT NOT NULL,
+                    page INTEGER NOT NULL,
+                    text TEXT NOT NULL,
+                    accessed REAL NOT NULL,
+                    PRIMARY KEY (file_hash, page)
+                );
+                CREATE TABLE IF NOT EXISTS page_names (
+                    file_hash TEXT NOT NULL,
+                    page INTEGER NOT NULL,
+                    pattern_version TEXT NOT NULL,
+                    worker_name TEXT,
+                    PRIMARY KEY (file_hash, page, pattern_version)
+                );
+                CREATE INDEX IF NOT EXISTS idx_page_text_accessed ON page_text (accessed);
+            """)
+            self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self._conn.commit()
+
+    def file_key(self, path: str) -> str:
+        """
+        Obtiene la clave de contenido de un archivo
+
+        Args:
+            path: Ruta del archivo
+
+        Returns:
+            Hash del contenido (reutilizado si el archivo no cambió)
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        memo_key = (path, stat.st_size, stat.st_mtime_ns)
+
+        file_hash = self._file_keys.get(memo_key)
+        if file_hash is not None:
+            return file_hash
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT file_hash FROM files WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (path, stat.st_size, stat.st_mtime_ns)
+            ).fetchone()
+
+        if row:
+            file_hash = row[0]
+        else:
+            file_hash = hash_file(path)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO files (path, size, mtime_ns, file_hash) VALUES (?, ?, ?, ?)",
+                    (path, stat.st_size, stat.st_mtime_ns, file_hash)
+                )
+                self._after_write()
+
+        self._file_keys[memo_key] = file_hash
+        return file_hash
+
+    def get_text(self, file_hash: str, page: int) -> Optional[str]:
+        """
+        Args:
+            file_hash: Clave de contenido del archivo
+            page: Número de página (0-indexed)
+
+        Returns:
+            Texto guardado o None si no está en caché
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text FROM page_text WHERE file_hash = ? AND page = ?",
+                (file_hash, page)
+            ).fetchone()
+            if row:
+                self._touched.add(file_hash)
+        return row[0] if row else None
+
+    def set_text(self, file_hash: str, page: int, text: str):
+        """Guardar el texto extraído de una página"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO page_text (file_hash, page, text, accessed) VALUES (?, ?, ?, ?)",
+                (file_hash, page, text or "", time.time())
+            )
+            self._after_write()
+
+    def get_name(self, file_hash: str, page: int, pattern_version: str):
+        """
+        Args:
+            file_hash: Clave de contenido del archivo
+            page: Número de página (0-indexed)
+            pattern_version: Versión del conjunto de patrones
+
+        Returns:
+            Nombre guardado (None si la página no tenía nombre, NO_TEXT si no tenía texto),
+            o MISSING si no está en caché
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT worker_name FROM page_names WHERE file_hash = ? AND page = ? AND pattern_version = ?",
+                (file_hash, page, pattern_version)
+            ).fetchone()
+            if row:
+                self._touched.add(file_hash)
+        return row[0] if row else MISSING
+
+    def get_names(self, file_hash: str, pattern_version: str) -> Dict[int, Optional[str]]:
+        """
+        Obtiene todos los nombres guardados de un archivo
+
+        Returns:
+            Diccionario {página: nombre o None} con las páginas en caché
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT page, worker_name FROM page_names WHERE file_hash = ? AND pattern_version = ?",
+                (file_hash, pattern_version)
+            ).fetchall()
+            if rows:
+                self._touched.add(file_hash)
+        return dict(rows)
+
+    def set_name(self, file_hash: str, page: int, pattern_version: str, worker_name: Optional[str]):
+        """Guardar el nombre detectado en una página (None = sin nombre, NO_TEXT = sin texto)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO page_names (file_hash, page, pattern_version, worker_name) "
+                "VALUES (?, ?, ?, ?)",
+                (file_hash, page, pattern_version, worker_name)
+            )
+            self._after_write()
+
+    def _after_write(self):
+        """Confirmar la transacción cada cierto número de escrituras"""
+        self._pending_writes += 1
+        if self._pending_writes >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Confirmar las escrituras pendientes"""
+        with self._lock:
+            if self._touched:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE page_text SET accessed = ? WHERE file_hash = ?",
+                    [(now, file_hash) for file_hash in self._touched]
+                )
+                self._touched.clear()
+            self._conn.commit()
+            self._pending_writes = 0
+
+    def prune(self):
+        """Descartar las páginas usadas hace más tiempo si se supera el tamaño máximo"""
+        with self._lock:
+            total = self._conn.execute("SELECT COALESCE(SUM(LENGTH(text)), 0) FROM page_text").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+
+            # Liberar hasta quedar en el 90% del máximo
+            to_free = total - int(self.max_bytes * 0.9)
+            freed = 0
+            stale = []
+            for file_hash, page, size in self._conn.execute(
+                "SELECT file_hash, page, LENGTH(text) FROM page_text ORDER BY accessed"
+            ):
+                stale.append((file_hash, page))
+                freed += size
+                if freed >= to_free:
+                    break
+
+            self._conn.executemany("DELETE FROM page_text WHERE file_hash = ? AND page = ?", stale)
+            self._conn.executemany("DELETE FROM page_names WHERE file_hash = ? AND page = ?", stale)
+            self._conn.execute(
+                "DELETE FROM files WHERE file_hash NOT IN (SELECT DISTINCT file_hash FROM page_text)"
+            )
+            self._conn.commit()
+
+    def clear(self):
+        """Vaciar la caché"""
+        with self._lock:
+            self._conn.executescript("DELETE FROM files; DELETE FROM page_text; DELETE FROM page_names;")
+            self._conn.commit()
+            self._file_keys.clear()
+
+    def close(self):
+        """Confirmar las escrituras pendientes y cerrar la base de datos"""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self.flush()
+            finally:
+                self._conn.close()
+                self._conn = None
+
+
+def open_extraction_cache(db_path: Optional[str] = None, **kwargs) -> Optional[ExtractionCache]:
+    """
+    Abre la caché de extracción sin interrumpir el procesamiento si falla
+
+    Args:
+        db_path: Ruta del archivo SQLite (por defecto en la carpeta de caché del usuario)
+
+    Returns:
+        Caché abierta o None si no se pudo abrir (p. ej. carpeta sin permisos)
+    """
+    try:
+        return ExtractionCache(db_path, **kwargs)
+    except (OSError, sqlite3.Error):
+        return None
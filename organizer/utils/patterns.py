@@ -1,19 +1,111 @@
 """
 Patrones regex para extracción de nombres de trabajadores de documentos PDF
 """
+import hashlib
 import re
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
+
+
+class WorkerNameMatcher:
+    """
+    Motor de patrones precompilado para detectar nombres de trabajadores
+
+    Compila los patrones una sola vez, los recorre en orden de prioridad y
+    se detiene en la primera coincidencia válida sin materializar el resto.
+    """
+
+    FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL
+
+    def __init__(self, patterns: Iterable[str], excluded_words: Iterable[str]):
+        """
+        Args:
+            patterns: Patrones regex ordenados por prioridad (un grupo de captura cada uno)
+            excluded_words: Palabras que invalidan un nombre detectado
+        """
+        patterns = list(patterns)
+        self._patterns = [re.compile(pattern, self.FLAGS) for pattern in patterns]
+        self._excluded_words = frozenset(word.lower() for word in excluded_words)
+
+        # Huella del conjunto de patrones: cambia si se edita cualquier patrón o exclusión
+        fingerprint = "\n".join(patterns + sorted(self._excluded_words) + [str(int(self.FLAGS))])
+        self.version = hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()[:16]
+
+    def find(self, text: str) -> Optional[str]:
+        """
+        Busca el nombre del trabajador en el texto
+        
+        Args:
+            text: Texto extraído del PDF
+            
+        Returns:
+            Nombre del trabajador en formato Title Case o None si no se encuentra
+        """
+        found = self.search(text)
+        return found[0] if found is not None else None
+    
+    def search(self, text: str) -> Optional[Tuple[str, int, int]]:
+        """
+        Busca el nombre del trabajador en el texto e indica dónde está
+        
+        Args:
+            text: Texto extraído del PDF
+            
+        Returns:
+            (nombre en Title Case, inicio, fin del nombre en el texto) o None si no se encuentra
+        """
+        if not text or text.isspace():
+            return None
+        
+        for pattern in self._patterns:
+            for match in pattern.finditer(text):
+                # Normalizar espacios y quitar comas
+                name = ' '.join(match.group(1).split()).replace(',', '').strip()
+                
+                if self.is_valid_name(name):
+                    return name.title(), match.start(1), match.end(1)
+        
+        return None
+
+    def is_valid_name(self, name: str) -> bool:
+        """
+        Valida si un nombre extraído es válido
+
+        Args:
+            name: Nombre a validar
+
+        Returns:
+            True si el nombre es válido, False en caso contrario
+        """
+        if not name or len(name) > 50:
+            return False
+
+        words = name.lower().split()
+
+        # Debe tener al menos 2 palabras
+        if len(words) < 2:
+            return False
+
+        # Cada palabra debe tener al menos 2 caracteres
+        if not all(len(word) >= 2 for word in words):
+            return False
+
+        # No debe contener palabras excluidas
+        if not self._excluded_words.isdisjoint(words):
+            return False
+
+        return True
+
 
 class WorkerNamePatterns:
     """Patrones regex para extraer nombres de trabajadores de documentos laborales"""
     
     # Palabras que deben excluirse de los nombres detectados
-    EXCLUDED_WORDS = [
+    EXCLUDED_WORDS = frozenset([
         'fecha', 'baja', 'alta', 'certificado', 'constancia', 
         'trabajador', 'empleado', 'dni', 'documento', 'prestadores',
         'empleador', 'ejercicio', 'gravable', 'retenciones', 'rentas',
         'quinta', 'categoría', 'certifica'
-    ]
+    ])
     
     # Patrones ordenados por especificidad (más específicos primero)
     PATTERNS = [
@@ -33,6 +125,21 @@ class WorkerNamePatterns:
         r'([A-ZÁÉÍÓÚÑ][a-záéíóúñ]+(?:\s+[A-ZÁÉÍÓÚÑ][a-záéíóúñ]+){1,4})\s+(?:DNI|C\.?I\.?)\s*[:\-]?\s*\d',
     ]
     
+    # Motor compartido, compilado en el primer uso
+    _matcher: Optional[WorkerNameMatcher] = None
+    
+    @classmethod
+    def get_matcher(cls) -> WorkerNameMatcher:
+        """
+        Obtiene el motor de patrones compartido (compilado una sola vez)
+        
+        Returns:
+            Instancia de WorkerNameMatcher con PATTERNS y EXCLUDED_WORDS
+        """
+        if cls._matcher is None:
+            cls._matcher = WorkerNameMatcher(cls.PATTERNS, cls.EXCLUDED_WORDS)
+        return cls._matcher
+    
     @classmethod
     def extract_worker_name(cls, text: str) -> Optional[str]:
         """
@@ -44,24 +151,7 @@ class WorkerNamePatterns:
         Returns:
             Nombre del trabajador en formato Title Case o None si no se encuentra
         """
-        if not text or not text.strip():
-            return None
-            
-        for pattern in cls.PATTERNS:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE | re.DOTALL)
-            if matches:
-                for match in matches:
-                    name = match.strip() if isinstance(match, str) else match[0].strip()
-                    
-                    # Limpiar el nombre
-                    name = re.sub(r'\s+', ' ', name)
-                    name = name.replace(',', '').strip()
-                    
-                    # Validar que sea un nombre válido
-                    if cls._is_valid_name(name):
-                        return name.title()
-        
-        return None
+        return cls.get_matcher().find(text)
     
     @classmethod
     def _is_valid_name(cls, name: str) -> bool:
@@ -74,21 +164,4 @@ class WorkerNamePatterns:
         Returns:
             True si el nombre es válido, False en caso contrario
         """
-        if not name or len(name) > 50:
-            return False
-            
-        words = name.lower().split()
-        
-        # Debe tener al menos 2 palabras
-        if len(words) < 2:
-            return False
-            
-        # Cada palabra debe tener al menos 2 caracteres
-        if not all(len(word) >= 2 for word in words):
-            return False
-            
-        # No debe contener palabras excluidas
-        if any(word in cls.EXCLUDED_WORDS for word in words):
-            return False
-            
-        return True
\ No newline at end of file
+        return cls.get_matcher().is_valid_name(name)
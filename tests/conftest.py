@@ -0,0 +1,33 @@
+"""
+Utilidades comunes de las pruebas: PDFs sintéticos con nombres detectables
+"""
+import os
+import sys
+from typing import List
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import generate_worker_names, write_single_constancias  # noqa: E402
+
+
+def list_pdfs(folder: str) -> List[str]:
+    """PDFs de una carpeta (sin subcarpetas), ordenados por nombre"""
+    if not os.path.isdir(folder):
+        return []
+    return sorted(name for name in os.listdir(folder) if name.lower().endswith('.pdf'))
+
+
+@pytest.fixture
+def worker_names() -> List[str]:
+    """Nombres de trabajadores reproducibles"""
+    return generate_worker_names(20, seed=1)
+
+
+@pytest.fixture
+def singles_folder(tmp_path, worker_names) -> str:
+    """Carpeta con 60 PDFs de una página, cada uno con un trabajador detectable"""
+    folder = str(tmp_path / "entrada")
+    write_single_constancias(folder, worker_names, 60, seed=1)
+    return folder
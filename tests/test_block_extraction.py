@@ -0,0 +1,76 @@
+"""
+Pruebas de la detección por bloques: mismos nombres que con el texto completo y zona aprendida
+"""
+import pytest
+
+from benchmarks.corpus import write_certificate_bundle
+from organizer.processors.block_extraction import (
+    EXTRACTION_BLOCKS, EXTRACTION_FULL, EXTRACTION_ROI, NameRegion, TextBlock, find_name_in_blocks
+)
+from organizer.processors.pdf_document import PDFDocumentSession
+from organizer.processors.pdf_processor import PDFProcessor
+from organizer.utils.patterns import WorkerNamePatterns
+
+
+@pytest.fixture
+def matcher():
+    return WorkerNamePatterns.get_matcher()
+
+
+@pytest.mark.parametrize("kind", ["certificate", "termination", "income", "contractor"])
+def test_blocks_find_the_same_names_as_full_text(tmp_path, worker_names, matcher, kind):
+    bundle = str(tmp_path / f"{kind}.pdf")
+    write_certificate_bundle(bundle, worker_names, 12, kind)
+
+    with PDFDocumentSession(bundle) as session:
+        for page_num in range(session.page_count):
+            full = matcher.find(session.extract_text(page_num))
+            found = find_name_in_blocks(session.extract_blocks(page_num), matcher)
+            assert found is not None
+            assert found[0] == full
+
+
+@pytest.mark.parametrize("extraction", [EXTRACTION_BLOCKS, EXTRACTION_ROI])
+def test_block_modes_separate_like_full(tmp_path, worker_names, extraction):
+    bundle = str(tmp_path / "lote.pdf")
+    write_certificate_bundle(bundle, worker_names, 40, "termination")
+
+    def names(mode):
+        processor = PDFProcessor(extraction=mode)
+        with processor.open_document(bundle) as session:
+            return [name for name, _ in processor.iter_page_worker_names(bundle, session, session.page_count)]
+
+    assert names(extraction) == names(EXTRACTION_FULL)
+
+
+def test_block_without_name_returns_none(matcher):
+    blocks = [TextBlock((0.1, 0.1, 0.9, 0.2), "ANEXO"), TextBlock((0.1, 0.3, 0.9, 0.4), "Sin datos")]
+    assert find_name_in_blocks(blocks, matcher) is None
+
+
+def test_name_found_in_its_own_block_uses_only_that_block(matcher):
+    blocks = [
+        TextBlock((0.1, 0.05, 0.9, 0.1), "CONSTANCIA DE PRESTADORES"),
+        TextBlock((0.1, 0.2, 0.9, 0.25), "Apellidos y nombres: Ana García Rojas"),
+    ]
+    assert find_name_in_blocks(blocks, matcher) == ("Ana García Rojas", (0.1, 0.2, 0.9, 0.25))
+
+
+def test_learned_region_covers_every_block_of_the_context_window(matcher):
+    # El patrón necesita "PERÚ", el nombre y la fecha, cada uno en su bloque
+    blocks = [
+        TextBlock((0.1, 0.05, 0.5, 0.08), "PERÚ"),
+        TextBlock((0.1, 0.10, 0.6, 0.13), "JUAN PÉREZ TORRES"),
+        TextBlock((0.1, 0.15, 0.4, 0.18), "01/02/2023"),
+    ]
+    name, rect = find_name_in_blocks(blocks, matcher)
+    assert name == "Juan Pérez Torres"
+    assert rect == (0.1, 0.05, 0.6, 0.18)
+
+
+def test_name_region_clips_after_learning():
+    region = NameRegion(learn_pages=2, margin=0.05)
+    region.learn((0.2, 0.2, 0.4, 0.3))
+    assert region.clip() is None
+    region.learn((0.3, 0.25, 0.5, 0.35))
+    assert region.clip() == pytest.approx((0.15, 0.15, 0.55, 0.4))
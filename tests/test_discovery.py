@@ -0,0 +1,75 @@
+"""
+Pruebas de la búsqueda de PDFs de entrada: subcarpetas y patrones de inclusión y exclusión
+"""
+import os
+
+import pytest
+
+from organizer.processors.discovery import DiscoveryOptions, PDFDiscovery, parse_patterns
+
+FILES = [
+    "a.pdf",
+    "B.PDF",
+    "notas.txt",
+    "borrador_c.pdf",
+    "2024/d.pdf",
+    "2024/enero/e.pdf",
+    "borradores/f.pdf",
+    "salida/g.pdf",
+]
+
+
+@pytest.fixture
+def tree(tmp_path) -> str:
+    """Carpeta de entrada con subcarpetas y archivos que no son PDF"""
+    root = str(tmp_path / "entrada")
+    for relative in FILES:
+        path = os.path.join(root, *relative.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb'):
+            pass
+    return root
+
+
+def _found(root: str, **kwargs) -> list:
+    skip_folders = kwargs.pop("skip_folders", ())
+    discovery = PDFDiscovery(root, DiscoveryOptions(**kwargs), skip_folders)
+    paths = [os.path.relpath(path, root).replace(os.sep, "/") for path in discovery]
+    assert discovery.finished
+    assert discovery.found == len(paths)
+    return paths
+
+
+def test_default_lists_only_top_level_pdfs(tree):
+    assert _found(tree) == ["B.PDF", "a.pdf", "borrador_c.pdf"]
+
+
+def test_recursive_walks_subfolders_in_order(tree):
+    assert _found(tree, recursive=True) == [
+        "B.PDF", "a.pdf", "borrador_c.pdf",
+        "2024/d.pdf", "2024/enero/e.pdf", "borradores/f.pdf", "salida/g.pdf",
+    ]
+
+
+def test_exclude_matches_names_and_relative_paths(tree):
+    assert _found(tree, recursive=True, exclude=("borrador*", "2024/enero")) == [
+        "B.PDF", "a.pdf", "2024/d.pdf", "salida/g.pdf",
+    ]
+
+
+def test_include_patterns_replace_the_default(tree):
+    # Como en fnmatch, "*" también abarca "/": "2024/*" incluye las subcarpetas de 2024
+    assert _found(tree, recursive=True, include=("*.txt", "2024/*")) == [
+        "notas.txt", "2024/d.pdf", "2024/enero/e.pdf",
+    ]
+
+
+def test_skip_folders_are_not_walked(tree):
+    paths = _found(tree, recursive=True, skip_folders=[os.path.join(tree, "salida")])
+    assert "salida/g.pdf" not in paths
+    assert "2024/d.pdf" in paths
+
+
+def test_parse_patterns():
+    assert parse_patterns(" *.pdf ; borradores,, 2024/* ;") == ("*.pdf", "borradores", "2024/*")
+    assert parse_patterns("") == ()
@@ -0,0 +1,55 @@
+"""
+Pruebas de la caché de extracción: los resultados negativos también se reutilizan
+"""
+import fitz
+import pytest
+
+from benchmarks.corpus import write_pdf
+from organizer.processors.pdf_processor import PDFProcessor
+from organizer.utils.cache import MISSING, ExtractionCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ExtractionCache(str(tmp_path / "cache.sqlite3"))
+    yield cache
+    cache.close()
+
+
+def _fail_on_extraction(*args, **kwargs):
+    raise AssertionError("el PDF se volvió a leer")
+
+
+def test_get_name_distinguishes_missing_from_no_name(cache):
+    assert cache.get_name("abc", 0, "v1") is MISSING
+    cache.set_name("abc", 0, "v1", None)
+    assert cache.get_name("abc", 0, "v1") is None
+    assert cache.get_name("abc", 0, "v2") is MISSING
+
+
+def test_pdf_without_name_is_not_read_again(tmp_path, cache, monkeypatch):
+    path = str(tmp_path / "sin_nombre.pdf")
+    write_pdf(path, [["ANEXO", "Documento sin datos del trabajador"]], filler_lines=0)
+
+    first = PDFProcessor(cache=cache).analyze_single_pdf(path)
+    assert first.error == "No se pudo extraer nombre del trabajador"
+
+    processor = PDFProcessor(cache=cache)
+    monkeypatch.setattr(processor, "_match_page", _fail_on_extraction)
+    assert processor.analyze_single_pdf(path).error == first.error
+
+
+def test_pdf_without_text_is_not_read_again(tmp_path, cache, monkeypatch):
+    path = str(tmp_path / "escaneado.pdf")
+    with fitz.open() as doc:
+        doc.new_page()
+        doc.save(path)
+
+    first = PDFProcessor(cache=cache).analyze_single_pdf(path)
+    assert first.error == "No se pudo extraer texto del PDF"
+
+    processor = PDFProcessor(cache=cache)
+    monkeypatch.setattr(processor, "_match_page", _fail_on_extraction)
+    assert processor.analyze_single_pdf(path).error == first.error
+    # Para el resto del programa sigue siendo una página sin nombre
+    assert processor.detect_page_worker_name(path, 0, file_key=processor.cache_key(path)) is None
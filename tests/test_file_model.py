@@ -0,0 +1,70 @@
+"""
+Pruebas del tamaño de carpetas en el explorador: se actualiza sin volver a pedirlo sin fin
+"""
+import os
+import time
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QCoreApplication, QLocale  # noqa: E402
+from PySide6.QtWidgets import QApplication, QTreeView  # noqa: E402
+
+from organizer.ui.file_model import SIZE_COLUMN, FolderSizeModel  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def explorer(app, tmp_path):
+    """Explorador mostrando una carpeta con la subcarpeta X (1000 bytes)"""
+    (tmp_path / "X").mkdir()
+    (tmp_path / "X" / "a.txt").write_bytes(b"a" * 1000)
+
+    model = FolderSizeModel()
+    view = QTreeView()
+    view.setModel(model)
+    view.setRootIndex(model.setRootPath(str(tmp_path)))
+    view.show()
+    yield model, str(tmp_path / "X")
+    view.close()
+    model.shutdown()
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def _formatted(size: int) -> str:
+    return QLocale.system().formattedDataSize(size)
+
+
+def _size_text(model: FolderSizeModel, path: str):
+    return model.data(model.index(path, SIZE_COLUMN))
+
+
+def test_size_updates_once_after_adding_a_file_to_a_subfolder(explorer):
+    model, folder = explorer
+    reported = []
+    model.scanner.size_ready.connect(reported.append)
+
+    assert _wait_for(lambda: _size_text(model, folder) == _formatted(1000))
+    with open(os.path.join(folder, "b.txt"), 'wb') as file:
+        file.write(b"b" * 5000)
+
+    assert _wait_for(lambda: _size_text(model, folder) == _formatted(6000))
+    # Dar tiempo a que se repitan las peticiones si la vista y el escáner entran en bucle
+    _wait_for(lambda: False, timeout=0.5)
+    assert _size_text(model, folder) == _formatted(6000)
+    # Una vez calculado, el escáner no vuelve a recibir la carpeta
+    assert reported.count(folder) <= 3
@@ -0,0 +1,141 @@
+"""
+Pruebas del diario de trabajos: repetición de lo completado y limpieza de lo interrumpido
+"""
+import itertools
+import os
+
+from conftest import list_pdfs
+from organizer.processors.job_journal import JobJournal
+from organizer.processors.pdf_processor import PDFProcessor, ProcessResult
+from organizer.processors.rename_engine import ConcurrentRenamer
+from organizer.processors.transfer import TRANSFER_MOVE
+
+
+def _write(path: str, data: bytes = b"%PDF-1.4 prueba"):
+    with open(path, 'wb') as file:
+        file.write(data)
+
+
+def test_completed_units_are_replayed(tmp_path):
+    source = tmp_path / "entrada"
+    output = tmp_path / "salida"
+    source.mkdir()
+    input_path = str(source / "a.pdf")
+    output_path = str(output / "Ana Torres.pdf")
+    _write(input_path)
+
+    with JobJournal.for_job(str(output), 'rename', str(source)) as journal:
+        fingerprint = journal.source_stat(input_path)
+        journal.start("file:a.pdf", output_path, input_path)
+        _write(output_path)
+        result = ProcessResult(original_file="a.pdf", success=True, new_name="Ana Torres.pdf",
+                               worker_name="Ana Torres", bytes_written=15)
+        journal.finish("file:a.pdf", result, output_path, fingerprint)
+
+    with JobJournal.for_job(str(output), 'rename', str(source)) as journal:
+        replayed = journal.completed("file:a.pdf", journal.source_stat(input_path))
+        assert replayed is not None
+        assert replayed.worker_name == "Ana Torres"
+        assert replayed.bytes_written == 0
+
+        # Si la entrada cambió, la unidad se rehace
+        _write(input_path, b"%PDF-1.4 otro contenido")
+        assert journal.completed("file:a.pdf", journal.source_stat(input_path)) is None
+
+
+def test_interrupted_output_is_discarded(tmp_path):
+    source = tmp_path / "entrada"
+    output = tmp_path / "salida"
+    source.mkdir()
+    input_path = str(source / "a.pdf")
+    output_path = str(output / "Ana Torres.pdf")
+    _write(input_path)
+
+    journal = JobJournal.for_job(str(output), 'rename', str(source))
+    journal.start("file:a.pdf", output_path, input_path)
+    _write(output_path, b"%PDF-1.4 a medio")
+    journal.close()
+
+    with JobJournal.for_job(str(output), 'rename', str(source)) as resumed:
+        [discarded] = resumed.discarded
+    assert not os.path.exists(output_path)
+    assert os.path.exists(input_path)
+    assert discarded.interrupted and not discarded.success
+    assert discarded.original_file == "a.pdf"
+    assert discarded.new_name == "Ana Torres.pdf"
+    assert "borrada" in discarded.error and output_path in discarded.error
+
+    # Lo descartado se muestra pero no cuenta como unidad procesada
+    summary = PDFProcessor().get_summary([discarded])
+    assert summary['interrupted'] == 1
+    assert summary['total_processed'] == summary['failed'] == 0
+
+
+def test_interrupted_output_is_kept_when_input_is_gone(tmp_path):
+    source = tmp_path / "entrada"
+    output = tmp_path / "salida"
+    source.mkdir()
+    input_path = str(source / "a.pdf")
+    output_path = str(output / "Ana Torres.pdf")
+
+    journal = JobJournal.for_job(str(output), 'rename', str(source))
+    journal.start("file:a.pdf", output_path, input_path)
+    _write(output_path)
+    journal.close()
+
+    with JobJournal.for_job(str(output), 'rename', str(source)) as resumed:
+        [kept] = resumed.discarded
+    assert os.path.exists(output_path)
+    assert "conservada" in kept.error
+
+
+def test_interrupted_move_is_restored(tmp_path):
+    source = tmp_path / "entrada"
+    output = tmp_path / "salida"
+    source.mkdir()
+    input_path = str(source / "a.pdf")
+    output_path = str(output / "Ana Torres.pdf")
+    _write(input_path, b"%PDF-1.4 original")
+
+    journal = JobJournal.for_job(str(output), 'rename', str(source))
+    journal.start("file:a.pdf", output_path, input_path, moves_input=True)
+    os.replace(input_path, output_path)
+    journal.close()
+
+    with JobJournal.for_job(str(output), 'rename', str(source)) as resumed:
+        [restored] = resumed.discarded
+    assert "devuelto" in restored.error
+    assert not os.path.exists(output_path)
+    with open(input_path, 'rb') as file:
+        assert file.read() == b"%PDF-1.4 original"
+
+
+def test_cancelled_move_then_resume_keeps_every_file(tmp_path, singles_folder):
+    output = str(tmp_path / "salida")
+    total = len(list_pdfs(singles_folder))
+    processor = PDFProcessor(transfer=TRANSFER_MOVE)
+    renamer = ConcurrentRenamer(processor, max_workers=4)
+
+    journal = JobJournal.for_job(output, 'rename', singles_folder)
+    results = renamer.iter_rename(processor.iter_input_files(singles_folder, output), output, journal)
+    assert len(list(itertools.islice(results, 5))) == 5
+    results.close()
+    journal.close()
+
+    # Reabrir limpia lo interrumpido sin perder ningún documento
+    with JobJournal.for_job(output, 'rename', singles_folder) as resumed:
+        assert all(result.interrupted for result in resumed.discarded)
+    remaining = list_pdfs(singles_folder)
+    moved = list_pdfs(output)
+    assert len(remaining) + len(moved) == total
+    assert all(os.path.getsize(os.path.join(output, name)) > 0 for name in moved)
+
+    # Reanudar termina el trabajo
+    processor = PDFProcessor(transfer=TRANSFER_MOVE)
+    with JobJournal.for_job(output, 'rename', singles_folder) as journal:
+        results = list(ConcurrentRenamer(processor, max_workers=4).iter_rename(
+            processor.iter_input_files(singles_folder, output), output, journal
+        ))
+    assert all(result.success for result in results)
+    assert list_pdfs(singles_folder) == []
+    assert len(list_pdfs(output)) == total
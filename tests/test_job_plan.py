@@ -0,0 +1,47 @@
+"""
+Pruebas del plan de trabajo: reutilización de lo analizado y guardado en JSON
+"""
+from collections import Counter
+
+from benchmarks.corpus import write_certificate_bundle
+from organizer.processors.job_plan import JobPlan, JobPlanner
+from organizer.processors.pdf_processor import PDFProcessor
+
+
+def test_sampled_pages_are_not_detected_twice(tmp_path, worker_names, monkeypatch):
+    bundle = str(tmp_path / "lote.pdf")
+    write_certificate_bundle(bundle, worker_names, 30)
+
+    processor = PDFProcessor()
+    detected = Counter()
+    match_page = processor._match_page
+
+    def counting_match_page(pdf_path, page_num, *args):
+        detected[page_num] += 1
+        return match_page(pdf_path, page_num, *args)
+
+    monkeypatch.setattr(processor, "_match_page", counting_match_page)
+    plan = JobPlan.create("separate", bundle, str(tmp_path / "salida"), processor)
+    units = list(JobPlanner(processor).iter_plan(plan, samples=5))
+
+    assert len(units) == 30
+    assert set(detected) == set(range(30))
+    assert max(detected.values()) == 1
+    assert [unit.worker_name for unit in plan.units] == [worker_names[i % len(worker_names)] for i in range(30)]
+
+
+def test_plan_round_trip_and_rename_analysis(tmp_path, singles_folder):
+    output = str(tmp_path / "salida")
+    plan = JobPlanner(PDFProcessor()).plan("rename", singles_folder, output)
+    path = str(tmp_path / "plan.json")
+    plan.save(path)
+
+    loaded = JobPlan.load(path)
+    assert loaded == plan
+    assert loaded.invalid_reason("rename", singles_folder, output, plan.patterns_version) is None
+
+    unit = loaded.units[0]
+    analysis = loaded.analysis(unit.source)
+    assert analysis.success
+    assert analysis.worker_name == unit.worker_name
+    assert loaded.analysis(str(tmp_path / "otro.pdf")) is None
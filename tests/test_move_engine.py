@@ -0,0 +1,117 @@
+"""
+Pruebas de mover entre unidades: la copia parcial se elimina y el original queda intacto
+"""
+import errno
+import os
+
+import pytest
+
+from organizer.processors import move_engine
+from organizer.processors.move_engine import MOVE_COPY, MOVE_RENAME, MoveCancelled, move_item
+
+
+@pytest.fixture
+def source(tmp_path) -> str:
+    """Carpeta de un trabajador con dos documentos y una subcarpeta"""
+    folder = tmp_path / "origen" / "Juan Perez"
+    (folder / "2024").mkdir(parents=True)
+    (folder / "a.pdf").write_bytes(b"a" * 3000)
+    (folder / "2024" / "b.pdf").write_bytes(b"b" * 5000)
+    return str(folder)
+
+
+@pytest.fixture
+def cross_device(monkeypatch):
+    """Simular que origen y destino están en unidades distintas"""
+    monkeypatch.setattr(move_engine, "same_device", lambda source, target_dir: False)
+    monkeypatch.setattr(move_engine, "COPY_CHUNK_SIZE", 1024)
+
+
+def _leftovers(folder: str) -> list:
+    return [name for name in os.listdir(folder) if name.endswith(".partial")]
+
+
+def _snapshot(folder: str) -> dict:
+    files = {}
+    for root, _, names in os.walk(folder):
+        for name in names:
+            path = os.path.join(root, name)
+            with open(path, 'rb') as file:
+                files[os.path.relpath(path, folder)] = file.read()
+    return files
+
+
+def test_same_device_renames(tmp_path, source):
+    destination = str(tmp_path / "Juan Perez")
+    assert move_item(source, destination) == MOVE_RENAME
+    assert not os.path.exists(source)
+    assert os.path.isfile(os.path.join(destination, "2024", "b.pdf"))
+
+
+def test_cross_device_copies_and_removes_source(tmp_path, source, cross_device):
+    before = _snapshot(source)
+    destination = str(tmp_path / "Juan Perez")
+    copied = []
+
+    assert move_item(source, destination, progress=copied.append) == MOVE_COPY
+    assert not os.path.exists(source)
+    assert _snapshot(destination) == before
+    assert sum(copied) == 8000
+    assert _leftovers(str(tmp_path)) == []
+
+
+def test_rename_failing_with_exdev_falls_back_to_copy(tmp_path, source, monkeypatch):
+    destination = str(tmp_path / "Juan Perez")
+    rename = os.rename
+
+    def rename_across_devices(src, dst):
+        if src == source:
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        rename(src, dst)
+
+    monkeypatch.setattr(move_engine.os, "rename", rename_across_devices)
+    assert move_item(source, destination) == MOVE_COPY
+    assert not os.path.exists(source)
+
+
+def test_cancelled_copy_removes_partial_and_keeps_source(tmp_path, source, cross_device):
+    before = _snapshot(source)
+    destination = str(tmp_path / "Juan Perez")
+    chunks = []
+
+    with pytest.raises(MoveCancelled):
+        move_item(source, destination, progress=chunks.append, is_cancelled=lambda: len(chunks) >= 2)
+
+    assert chunks
+    assert not os.path.exists(destination)
+    assert _leftovers(str(tmp_path)) == []
+    assert _snapshot(source) == before
+
+
+def test_failed_verification_removes_partial_and_keeps_source(tmp_path, source, cross_device, monkeypatch):
+    before = _snapshot(source)
+    destination = str(tmp_path / "Juan Perez")
+    partials = []
+
+    def failing_verify(original, copy):
+        partials.append(copy)
+        assert os.path.isdir(copy)
+        raise OSError(errno.EIO, "La copia no tiene el tamaño del original", copy)
+
+    monkeypatch.setattr(move_engine, "_verify_copy", failing_verify)
+    with pytest.raises(OSError):
+        move_item(source, destination)
+
+    assert partials and partials[0].endswith(".partial")
+    assert not os.path.exists(partials[0])
+    assert not os.path.exists(destination)
+    assert _snapshot(source) == before
+
+
+def test_existing_destination_is_not_overwritten(tmp_path, source, cross_device):
+    destination = tmp_path / "Juan Perez"
+    destination.mkdir()
+    with pytest.raises(FileExistsError):
+        move_item(source, str(destination))
+    assert os.path.isdir(source)
+    assert os.listdir(destination) == []
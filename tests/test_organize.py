@@ -0,0 +1,63 @@
+"""
+Pruebas de organizar por trabajador: copias en paralelo, cancelación y sincronización incremental
+"""
+import itertools
+import os
+
+import pytest
+
+from benchmarks.corpus import write_processed_tree
+from organizer.processors.job_journal import JobJournal
+from organizer.processors.pdf_processor import PDFProcessor
+from organizer.processors.sync_manifest import SyncOptions
+
+
+def _organized(output: str):
+    """Documentos copiados (no vacíos) en las carpetas de los trabajadores"""
+    found = []
+    for root, _, files in os.walk(output):
+        for name in files:
+            path = os.path.join(root, name)
+            if name.endswith('.pdf') and os.path.getsize(path) > 0:
+                found.append(os.path.relpath(path, output))
+    return sorted(found)
+
+
+@pytest.fixture
+def processed_root(tmp_path, worker_names) -> str:
+    """Carpetas PDFs_Procesados_* con un documento de cada tipo por trabajador"""
+    root = str(tmp_path / "procesados")
+    write_processed_tree(root, worker_names)
+    return root
+
+
+def test_organize_copies_every_document(tmp_path, processed_root, worker_names):
+    output = str(tmp_path / "salida")
+    results = list(PDFProcessor().iter_organize_by_worker(processed_root, output))
+    assert all(result.success for result in results)
+    assert len(_organized(output)) == len(worker_names) * 3
+
+
+def test_cancel_journals_copies_finished_during_shutdown(tmp_path, processed_root):
+    output = str(tmp_path / "salida")
+    with JobJournal.for_job(output, 'organize', processed_root) as journal:
+        results = PDFProcessor().iter_organize_by_worker(processed_root, output, journal)
+        list(itertools.islice(results, 5))
+        results.close()
+    copied = _organized(output)
+
+    JobJournal.for_job(output, 'organize', processed_root).close()
+    assert _organized(output) == copied
+
+
+def test_cancel_records_copies_in_manifest(tmp_path, processed_root, worker_names):
+    output = str(tmp_path / "salida")
+    processor = PDFProcessor(sync=SyncOptions(incremental=True))
+    results = processor.iter_organize_by_worker(processed_root, output)
+    list(itertools.islice(results, 5))
+    results.close()
+    copied = _organized(output)
+
+    results = list(PDFProcessor(sync=SyncOptions(incremental=True)).iter_organize_by_worker(processed_root, output))
+    assert sum(1 for result in results if result.skipped) == len(copied)
+    assert len(_organized(output)) == len(worker_names) * 3
@@ -0,0 +1,66 @@
+"""
+Pruebas del índice de nombres de salida: sufijos ante colisiones y modo de solo cálculo
+"""
+import os
+
+from conftest import list_pdfs
+from organizer.processors.output_names import OutputNameIndex
+
+
+def _touch(path: str):
+    with open(path, 'wb'):
+        pass
+
+
+def test_claim_skips_existing_names_case_insensitively(tmp_path):
+    folder = str(tmp_path)
+    _touch(os.path.join(folder, "juan perez.pdf"))
+    _touch(os.path.join(folder, "Juan Perez_001.pdf"))
+
+    names = OutputNameIndex(folder)
+    assert os.path.basename(names.claim("Juan Perez", ".pdf")) == "Juan Perez_002.pdf"
+    assert os.path.basename(names.claim("Juan Perez", ".pdf")) == "Juan Perez_003.pdf"
+    assert os.path.basename(names.claim("Ana Rojas", ".pdf")) == "Ana Rojas.pdf"
+    assert len(list_pdfs(folder)) == 5
+
+
+def test_claim_takes_next_suffix_when_another_process_creates_the_file(tmp_path):
+    folder = str(tmp_path)
+    names = OutputNameIndex(folder)
+    # Creado después de leer la carpeta, sin pasar por el índice
+    _touch(os.path.join(folder, "Juan Perez.pdf"))
+
+    path = names.claim("Juan Perez", ".pdf")
+    assert os.path.basename(path) == "Juan Perez_001.pdf"
+    assert os.path.getsize(path) == 0
+
+
+def test_release_frees_the_name_for_reuse(tmp_path):
+    names = OutputNameIndex(str(tmp_path))
+    first = names.claim("Juan Perez", ".pdf")
+    second = names.claim("Juan Perez", ".pdf")
+
+    names.release(first)
+    assert not os.path.exists(first)
+    assert names.claim("Juan Perez", ".pdf") == first
+    assert names.claim("Juan Perez", ".pdf") != second
+
+
+def test_dry_run_creates_nothing(tmp_path):
+    folder = str(tmp_path / "salida")
+    names = OutputNameIndex(folder, reserve=False)
+    paths = [names.claim("Juan Perez", ".pdf") for _ in range(3)]
+
+    assert [os.path.basename(path) for path in paths] == [
+        "Juan Perez.pdf", "Juan Perez_001.pdf", "Juan Perez_002.pdf"
+    ]
+    assert not os.path.exists(folder)
+
+
+def test_dry_run_sees_existing_names(tmp_path):
+    folder = str(tmp_path)
+    _touch(os.path.join(folder, "Juan Perez.pdf"))
+
+    names = OutputNameIndex(folder, reserve=False)
+    assert os.path.basename(names.claim("Juan Perez", ".pdf")) == "Juan Perez_001.pdf"
+    assert list_pdfs(folder) == ["Juan Perez.pdf"]
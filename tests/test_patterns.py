@@ -0,0 +1,83 @@
+"""
+Pruebas del motor de patrones: mismos nombres que la extracción original con re.findall
+"""
+import re
+from typing import Optional
+
+import pytest
+
+from benchmarks.corpus import write_certificate_bundle
+from organizer.processors.pdf_document import PDFDocumentSession
+from organizer.utils.patterns import WorkerNamePatterns
+
+TEXTS = [
+    "",
+    "   \n  ",
+    "ANEXO\nDocumento sin datos del trabajador",
+    "Que el Sr. Juan Pérez Torres identificado con DNI 40000001",
+    "Que la Sra. María López identificada con C.I. 123",
+    "CONSTANCIA DE BAJA\nPERÚ\nJUAN PÉREZ TORRES\n01/02/2023",
+    "PERÚ\nFECHA DE BAJA\n01/02/2023\nPERÚ\nROSA DÍAZ\n03/04/2023",
+    "Apellidos y nombres: Ana García Rojas\nN° de documento: 1234",
+    "Nombres y apellidos:   Luis   Quispe Mamani",
+    "Trabajador: Fecha Baja\nEmpleado: Carlos Huamán Soto",
+    "Trabajador: Li Wu\nCarmen Vega Ruiz DNI: 45678901",
+    "Empleado: Aa Bb Cc Dd Ee",
+    "PERÚ\nNOMBRE " + "MUY LARGO " * 6 + "\n01/01/2020",
+    "Certificado Trabajador DNI 1\nRaúl Ñahui Ccori DNI - 7",
+    "Que el Sr. Pedro identificado con DNI 1\nTrabajador: Pedro Castillo",
+]
+
+
+def baseline_extract_worker_name(text: str) -> Optional[str]:
+    """Extracción de nombres tal como estaba antes de precompilar los patrones"""
+    if not text or not text.strip():
+        return None
+
+    for pattern in WorkerNamePatterns.PATTERNS:
+        for match in re.findall(pattern, text, re.IGNORECASE | re.MULTILINE | re.DOTALL):
+            name = match.strip() if isinstance(match, str) else match[0].strip()
+            name = re.sub(r'\s+', ' ', name)
+            name = name.replace(',', '').strip()
+            if _baseline_is_valid_name(name):
+                return name.title()
+    return None
+
+
+def _baseline_is_valid_name(name: str) -> bool:
+    if not name or len(name) > 50:
+        return False
+    words = name.lower().split()
+    if len(words) < 2:
+        return False
+    if not all(len(word) >= 2 for word in words):
+        return False
+    return not any(word in WorkerNamePatterns.EXCLUDED_WORDS for word in words)
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_matcher_matches_baseline_on_fixture_texts(text):
+    matcher = WorkerNamePatterns.get_matcher()
+    assert matcher.find(text) == baseline_extract_worker_name(text)
+    assert WorkerNamePatterns.extract_worker_name(text) == baseline_extract_worker_name(text)
+
+
+@pytest.mark.parametrize("kind", ["certificate", "termination", "income", "contractor"])
+def test_matcher_matches_baseline_on_generated_pages(tmp_path, worker_names, kind):
+    bundle = str(tmp_path / f"{kind}.pdf")
+    write_certificate_bundle(bundle, worker_names, 20, kind)
+    matcher = WorkerNamePatterns.get_matcher()
+
+    with PDFDocumentSession(bundle) as session:
+        for page_num in range(session.page_count):
+            text = session.extract_text(page_num)
+            expected = baseline_extract_worker_name(text)
+            assert expected is not None
+            assert matcher.find(text) == expected
+
+
+def test_search_returns_the_name_position():
+    text = "CONSTANCIA DE PRESTADORES\nApellidos y nombres: Ana García Rojas\n"
+    name, start, end = WorkerNamePatterns.get_matcher().search(text)
+    assert name == "Ana García Rojas"
+    assert text[start:end] == "Ana García Rojas"
@@ -0,0 +1,51 @@
+"""
+Pruebas del motor de renombrado concurrente
+"""
+import itertools
+import os
+
+from conftest import list_pdfs
+from organizer.processors.job_journal import JobJournal
+from organizer.processors.pdf_processor import PDFProcessor
+from organizer.processors.rename_engine import ConcurrentRenamer
+
+
+def _rename(folder: str, output: str, max_workers: int, journal=None):
+    processor = PDFProcessor()
+    renamer = ConcurrentRenamer(processor, max_workers)
+    return renamer.iter_rename(processor.iter_input_files(folder, output), output, journal)
+
+
+def test_concurrent_names_match_sequential(tmp_path, singles_folder):
+    sequential = [result.new_name for result in _rename(singles_folder, str(tmp_path / "uno"), 1)]
+    concurrent = _rename(singles_folder, str(tmp_path / "varios"), 4)
+    assert sorted(result.new_name for result in concurrent) == sorted(sequential)
+    assert list_pdfs(str(tmp_path / "uno")) == list_pdfs(str(tmp_path / "varios"))
+
+
+def test_cancel_without_journal_leaves_no_empty_reservations(tmp_path, singles_folder):
+    output = str(tmp_path / "salida")
+    results = _rename(singles_folder, output, 4)
+    list(itertools.islice(results, 5))
+    results.close()
+
+    assert all(os.path.getsize(os.path.join(output, name)) > 0 for name in list_pdfs(output))
+
+
+def test_cancel_journals_copies_finished_during_shutdown(tmp_path, singles_folder):
+    output = str(tmp_path / "salida")
+    with JobJournal.for_job(output, 'rename', singles_folder) as journal:
+        results = _rename(singles_folder, output, 4, journal)
+        list(itertools.islice(results, 5))
+        results.close()
+    written = list_pdfs(output)
+
+    # Todo lo que llegó a copiarse queda anotado: al reabrir no se borra nada
+    JobJournal.for_job(output, 'rename', singles_folder).close()
+    assert list_pdfs(output) == written
+
+    with JobJournal.for_job(output, 'rename', singles_folder) as journal:
+        results = list(_rename(singles_folder, output, 4, journal))
+    assert len(results) == len(list_pdfs(singles_folder))
+    # Sin copias _001 de lo que ya estaba hecho
+    assert len(list_pdfs(output)) == len(results)
@@ -0,0 +1,60 @@
+"""
+Pruebas de separar un PDF multi-página
+"""
+import os
+
+import pytest
+
+from benchmarks.corpus import write_pdf
+from conftest import list_pdfs
+from organizer.processors.job_plan import JobPlanner
+from organizer.processors.pdf_processor import PDFProcessor
+
+PAGES = [
+    ["CERTIFICADO DE TRABAJO", "Que el Sr. Juan Pérez Torres identificado con DNI 40000001"],
+    ["ANEXO", "Página sin datos del trabajador"],
+    ["CONSTANCIA DE PRESTADORES", "Apellidos y nombres: Ana García Rojas"],
+    ["ANEXO", "Otra página sin datos del trabajador"],
+]
+
+
+@pytest.fixture
+def bundle(tmp_path) -> str:
+    """PDF de cuatro páginas, dos de ellas sin nombre de trabajador"""
+    path = str(tmp_path / "lote.pdf")
+    write_pdf(path, PAGES, filler_lines=0)
+    return path
+
+
+def test_separate_names_each_page(tmp_path, bundle):
+    output = str(tmp_path / "salida")
+    results = list(PDFProcessor().iter_separate_multi_page_pdf(bundle, output))
+    assert [result.new_name for result in results] == [
+        "Juan Pérez Torres.pdf", "Pagina_002.pdf", "Ana García Rojas.pdf", "Pagina_004.pdf"
+    ]
+    assert [result.success for result in results] == [True, False, True, False]
+
+
+def test_unnamed_pages_of_another_bundle_are_not_overwritten(tmp_path, bundle):
+    output = str(tmp_path / "salida")
+    processor = PDFProcessor()
+    list(processor.iter_separate_multi_page_pdf(bundle, output))
+    with open(os.path.join(output, "Pagina_002.pdf"), 'rb') as file:
+        first = file.read()
+
+    # Otro lote que llega a la misma carpeta (p. ej. en la carpeta vigilada)
+    second = list(PDFProcessor().iter_separate_multi_page_pdf(bundle, output))
+    assert second[1].new_name == "Pagina_002_001.pdf"
+    with open(os.path.join(output, "Pagina_002.pdf"), 'rb') as file:
+        assert file.read() == first
+    assert len(list_pdfs(output)) == 8
+
+
+def test_plan_targets_match_written_files(tmp_path, bundle):
+    output = str(tmp_path / "salida")
+    processor = PDFProcessor()
+    list(processor.iter_separate_multi_page_pdf(bundle, output))
+
+    plan = JobPlanner(PDFProcessor()).plan("separate", bundle, output)
+    results = list(PDFProcessor().iter_separate_multi_page_pdf(bundle, output, plan=plan))
+    assert [unit.target for unit in plan.units] == [result.new_name for result in results]
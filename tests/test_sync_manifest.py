@@ -0,0 +1,99 @@
+"""
+Pruebas del manifiesto de sincronización: qué documentos se saltan y cuáles se vuelven a copiar
+"""
+import os
+import shutil
+
+import pytest
+
+from organizer.processors.sync_manifest import SyncManifest
+
+
+@pytest.fixture
+def job(tmp_path):
+    """Original, carpeta de salida y copia idéntica (mismo tamaño y fecha)"""
+    source = str(tmp_path / "entrada" / "doc.pdf")
+    output = str(tmp_path / "salida")
+    destination = os.path.join(output, "Juan Perez", "doc.pdf")
+    os.makedirs(os.path.dirname(source))
+    os.makedirs(os.path.dirname(destination))
+    with open(source, 'wb') as file:
+        file.write(b"%PDF contenido original")
+    shutil.copy2(source, destination)
+    return source, output, destination
+
+
+def _set_mtime_ns(path: str, mtime_ns: int):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_identical_copy_is_skipped(job):
+    source, output, destination = job
+    manifest = SyncManifest.for_job(output, os.path.dirname(source))
+    assert manifest.check(source, destination) is not None
+
+
+def test_missing_or_different_copy_is_copied_again(job):
+    source, output, destination = job
+    manifest = SyncManifest.for_job(output, os.path.dirname(source))
+
+    with open(destination, 'ab') as file:
+        file.write(b"!")
+    assert manifest.check(source, destination) is None
+
+    os.remove(destination)
+    assert manifest.check(source, destination) is None
+
+
+def test_recorded_copy_is_skipped_after_reopening(job):
+    source, output, destination = job
+    # Copia hecha con otra fecha (p. ej. unidad que redondea las fechas)
+    _set_mtime_ns(destination, os.stat(source).st_mtime_ns + 5_000_000_000)
+
+    manifest = SyncManifest.for_job(output, os.path.dirname(source))
+    assert manifest.check(source, destination) is None
+    manifest.record(destination, SyncManifest.copied(source, destination))
+    manifest.save()
+
+    reopened = SyncManifest.for_job(output, os.path.dirname(source))
+    assert reopened.check(source, destination) is not None
+
+
+def test_changed_original_is_copied_again(job):
+    source, output, destination = job
+    manifest = SyncManifest.for_job(output, os.path.dirname(source))
+    manifest.record(destination, manifest.check(source, destination))
+    manifest.save()
+
+    with open(source, 'r+b') as file:
+        file.write(b"%PDF contenido cambiado")
+    _set_mtime_ns(source, os.stat(source).st_mtime_ns + 5_000_000_000)
+
+    reopened = SyncManifest.for_job(output, os.path.dirname(source))
+    assert reopened.check(source, destination) is None
+
+
+def test_verify_hash_compares_content_when_dates_differ(job):
+    source, output, destination = job
+    _set_mtime_ns(destination, os.stat(source).st_mtime_ns + 5_000_000_000)
+    manifest = SyncManifest.for_job(output, os.path.dirname(source))
+
+    entry = manifest.check(source, destination, verify_hash=True)
+    assert entry is not None and 'sha256' in entry
+
+    # Mismo tamaño, distinto contenido
+    with open(destination, 'r+b') as file:
+        file.write(b"X")
+    assert manifest.check(source, destination, verify_hash=True) is None
+
+
+def test_damaged_manifest_starts_empty(job):
+    source, output, destination = job
+    manifest = SyncManifest.for_job(output, os.path.dirname(source))
+    with open(manifest.path, 'w', encoding='utf-8') as file:
+        file.write("{no es json")
+
+    reopened = SyncManifest.for_job(output, os.path.dirname(source))
+    assert reopened.check(source, destination) is not None
+    reopened.save()
+    assert not os.path.exists(manifest.path + '.tmp')
@@ -0,0 +1,61 @@
+"""
+Pruebas de las estrategias de transferencia: la copia normal de respaldo se indica en el resultado
+"""
+import errno
+import os
+
+import pytest
+
+from conftest import list_pdfs
+from organizer.processors import transfer
+from organizer.processors.pdf_processor import PDFProcessor
+from organizer.processors.rename_engine import ConcurrentRenamer
+from organizer.processors.transfer import (
+    TRANSFER_COPY, TRANSFER_HARDLINK, TRANSFER_REFLINK, transfer_file
+)
+
+
+@pytest.fixture
+def no_reflink(monkeypatch):
+    """Sistema de archivos sin clonado (p. ej. ext4 o NTFS)"""
+    def unsupported(source, destination):
+        raise OSError(errno.EOPNOTSUPP, "Operation not supported", destination)
+
+    monkeypatch.setitem(transfer._TRANSFERS, TRANSFER_REFLINK, unsupported)
+
+
+def _rename(folder: str, output: str, strategy: str):
+    processor = PDFProcessor(transfer=strategy)
+    renamer = ConcurrentRenamer(processor, 4)
+    results = list(renamer.iter_rename(processor.iter_input_files(folder, output), output))
+    return results, processor.get_summary(results)
+
+
+def test_transfer_file_reports_the_fallback_copy(tmp_path, no_reflink):
+    source = tmp_path / "a.pdf"
+    source.write_bytes(b"%PDF contenido")
+    destination = str(tmp_path / "b.pdf")
+
+    assert transfer_file(str(source), destination, TRANSFER_REFLINK) == TRANSFER_COPY
+    with open(destination, 'rb') as file:
+        assert file.read() == b"%PDF contenido"
+
+
+def test_rename_marks_results_copied_instead_of_cloned(tmp_path, singles_folder, no_reflink):
+    output = str(tmp_path / "salida")
+    results, summary = _rename(singles_folder, output, TRANSFER_REFLINK)
+
+    assert all(result.success and result.transfer_fallback for result in results)
+    assert summary['transfer_fallbacks'] == len(results) == 60
+    # Los bytes de la copia normal se cuentan como escritos
+    assert summary['bytes_written'] == sum(
+        os.path.getsize(os.path.join(output, name)) for name in list_pdfs(output)
+    )
+
+
+def test_hardlink_on_the_same_device_is_not_a_fallback(tmp_path, singles_folder):
+    results, summary = _rename(singles_folder, str(tmp_path / "salida"), TRANSFER_HARDLINK)
+
+    assert not any(result.transfer_fallback for result in results)
+    assert summary['transfer_fallbacks'] == 0
+    assert summary['bytes_written'] == 0